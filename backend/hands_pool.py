@@ -0,0 +1,201 @@
+"""Bounded pool of MediaPipe Hands graphs shared by gesture sessions."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+import mediapipe as mp
+
+
+class _PooledGraph:
+    """A MediaPipe Hands graph and its lease bookkeeping."""
+
+    def __init__(self, hands):
+        self.hands = hands
+        self.owner = None  # Session whose stream the graph is tracking
+        self.busy = False
+        self.needs_reset = False  # Forgotten while leased; reset before reuse
+        self.last_used = time.monotonic()
+
+
+class HandsPool:
+    """
+    Bounded pool of ``mp.solutions.hands.Hands`` graphs.
+
+    Graphs are leased per frame with session affinity: a session gets back
+    the graph that saw its previous frame whenever it is free, so MediaPipe
+    keeps tracking the hand instead of re-running palm detection. A graph
+    handed to a different session is reset first. Graphs idle for longer
+    than ``idle_timeout`` are closed.
+    """
+
+    def __init__(self, max_size: int = 4, idle_timeout: float = 60.0, max_hands: int = 2,
+                 min_detection_confidence: float = 0.7, min_tracking_confidence: float = 0.5):
+        """
+        Initialize the pool.
+
+        Args:
+            max_size (int): Maximum number of live graphs
+            idle_timeout (float): Seconds before an unused graph is closed
+            max_hands (int): Maximum number of hands each graph detects
+            min_detection_confidence (float): Palm detection threshold
+            min_tracking_confidence (float): Landmark tracking threshold
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.hands_options = {
+            "static_image_mode": False,
+            "max_num_hands": max_hands,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+        }
+        self._graphs: List[_PooledGraph] = []
+        self._creating = 0
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_env(cls, max_hands: int = 2) -> "HandsPool":
+        """
+        Create a pool sized by ``GESTURE_MAX_GRAPHS`` and ``GESTURE_GRAPH_IDLE_TIMEOUT``.
+
+        Args:
+            max_hands (int): Maximum number of hands each graph detects
+
+        Returns:
+            HandsPool: Configured pool
+        """
+        return cls(
+            max_size=int(os.environ.get("GESTURE_MAX_GRAPHS", 0)) or os.cpu_count() or 1,
+            idle_timeout=float(os.environ.get("GESTURE_GRAPH_IDLE_TIMEOUT", 60.0)),
+            max_hands=max_hands,
+        )
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._graphs)
+
+    def _pick(self, owner) -> Optional[_PooledGraph]:
+        free = [graph for graph in self._graphs if not graph.busy]
+        if not free:
+            return None
+        for graph in free:
+            if graph.owner == owner:
+                return graph
+        # Prefer graphs nobody is tracking, then the least recently used one
+        return min(free, key=lambda graph: (graph.owner is not None, graph.last_used))
+
+    def acquire(self, owner) -> _PooledGraph:
+        """
+        Lease a graph for one frame of ``owner``'s stream, waiting if all are busy.
+
+        Args:
+            owner: Hashable session identifier
+
+        Returns:
+            _PooledGraph: Leased graph; hand it back with :meth:`release`
+        """
+        with self._cond:
+            while True:
+                graph = self._pick(owner)
+                if graph is not None:
+                    graph.busy = True
+                    break
+                if len(self._graphs) + self._creating < self.max_size:
+                    self._creating += 1
+                    graph = None
+                    break
+                self._cond.wait()
+
+        if graph is None:
+            # Building a graph is slow; do it without holding the lock
+            try:
+                graph = _PooledGraph(mp.solutions.hands.Hands(**self.hands_options))
+            finally:
+                with self._cond:
+                    self._creating -= 1
+                    if graph is not None:
+                        graph.busy = True
+                        self._graphs.append(graph)
+                    else:
+                        self._cond.notify()
+        elif graph.needs_reset or (graph.owner != owner and graph.owner is not None):
+            # Drop tracking state from the previous stream
+            graph.hands.reset()
+            graph.needs_reset = False
+
+        graph.owner = owner
+        return graph
+
+    def release(self, graph: _PooledGraph) -> None:
+        """
+        Return a leased graph to the pool.
+
+        Args:
+            graph (_PooledGraph): Graph obtained from :meth:`acquire`
+        """
+        with self._cond:
+            graph.busy = False
+            graph.last_used = time.monotonic()
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, owner) -> Iterator[Any]:
+        """
+        Context manager leasing a graph for ``owner``.
+
+        Args:
+            owner: Hashable session identifier
+
+        Yields:
+            MediaPipe Hands instance
+        """
+        graph = self.acquire(owner)
+        try:
+            yield graph.hands
+        finally:
+            self.release(graph)
+
+    def forget(self, owner) -> None:
+        """
+        Detach graphs from a finished session so new sessions prefer them.
+
+        Args:
+            owner: Hashable session identifier
+        """
+        with self._cond:
+            for graph in self._graphs:
+                if graph.owner == owner:
+                    graph.owner = None
+                    if graph.busy:
+                        graph.needs_reset = True  # Reset by the next acquire
+                    else:
+                        graph.hands.reset()
+
+    def evict_idle(self) -> int:
+        """
+        Close graphs that have not been used for ``idle_timeout`` seconds.
+
+        Returns:
+            int: Number of graphs closed
+        """
+        now = time.monotonic()
+        with self._cond:
+            idle = [graph for graph in self._graphs
+                    if not graph.busy and now - graph.last_used > self.idle_timeout]
+            for graph in idle:
+                self._graphs.remove(graph)
+
+        for graph in idle:
+            graph.hands.close()
+        return len(idle)
+
+    def close(self) -> None:
+        """Close every graph that is not currently leased."""
+        with self._cond:
+            graphs = [graph for graph in self._graphs if not graph.busy]
+            self._graphs = [graph for graph in self._graphs if graph.busy]
+
+        for graph in graphs:
+            graph.hands.close()
@@ -0,0 +1,83 @@
+"""Latest-frame-wins ingest stage for WebSocket connections."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+
+class MailboxClosed(Exception):
+    """Raised by :meth:`FrameMailbox.get` once the producer has gone away."""
+
+
+class FrameMailbox:
+    """
+    One-slot mailbox holding only the newest undelivered frame.
+
+    Frames that arrive while a previous one is still waiting replace it and
+    are counted as dropped, so a slow consumer lowers its frame rate instead
+    of building up a backlog.
+    """
+
+    def __init__(self):
+        """Initialize an empty mailbox."""
+        self._item: Optional[Tuple[Any, float]] = None
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.received = 0
+        self.dropped = 0
+        self._dropped_unreported = 0
+
+    def put(self, message: Any) -> None:
+        """
+        Store a frame, replacing (and dropping) any frame not yet taken.
+
+        Args:
+            message: Raw, still-encoded frame message
+        """
+        if self._item is not None:
+            self.dropped += 1
+            self._dropped_unreported += 1
+        self._item = (message, time.monotonic())
+        self.received += 1
+        self._ready.set()
+
+    async def get(self) -> Tuple[Any, float, int]:
+        """
+        Wait for the newest frame.
+
+        Returns:
+            Tuple[Any, float, int]: Message, monotonic receive time and number
+            of frames dropped since the previous ``get``
+
+        Raises:
+            MailboxClosed: When the mailbox is closed and empty
+        """
+        while self._item is None:
+            if self._closed:
+                raise MailboxClosed()
+            self._ready.clear()
+            await self._ready.wait()
+
+        (message, received_at), self._item = self._item, None
+        dropped, self._dropped_unreported = self._dropped_unreported, 0
+        return message, received_at, dropped
+
+    def close(self) -> None:
+        """Stop accepting frames and wake up a waiting consumer."""
+        self._closed = True
+        self._ready.set()
+
+
+async def pump(receive: Callable[[], Awaitable[Any]], mailbox: FrameMailbox) -> None:
+    """
+    Move messages from ``receive`` into ``mailbox`` until it raises.
+
+    Args:
+        receive (Callable[[], Awaitable[Any]]): Coroutine function returning the next message
+        mailbox (FrameMailbox): Destination mailbox, closed when receiving stops
+    """
+    try:
+        while True:
+            mailbox.put(await receive())
+    finally:
+        mailbox.close()
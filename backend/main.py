@@ -1,15 +1,40 @@
 """FastAPI backend for gesture control system."""
 
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 import cv2
 import numpy as np
 import json
 import asyncio
-from typing import Dict, Any
-import base64
-from src.gesture_control import GestureController
-from src.gesture_features import GestureFeatures
+import os
+import time
+from typing import Dict, Any, Optional, Tuple
+from backend.protocol import (
+    CODEC_LANDMARKS,
+    PROTOCOL_BINARY,
+    RESPONSE_FRAME,
+    build_binary_reply,
+    build_json_reply,
+    decode_image,
+    encode_image,
+    landmarks_to_json,
+    negotiate,
+    pack_landmarks,
+    parse_binary_frame,
+    parse_json_frame,
+)
+from backend.hands_pool import HandsPool
+from backend.ingest import FrameMailbox, MailboxClosed, pump
+from backend.metrics import CONTENT_TYPE, render_metrics
+from backend.sessions import GestureSession, SessionManager
+from backend.socket_server import GestureSocketServer
+from backend.workers import FrameWorkerPool
+from src.actions import ActionDispatcher
+from src.classifier import LandmarkClassifier
+from src.filters import LandmarkFilterBank
+from src.prediction import FrameSkipper
+from src.profiling import StageProfiler
+from src.roi import InferenceInput
 
 app = FastAPI()
 
@@ -23,64 +48,203 @@ app.add_middleware(
 )
 
 # Global state
-controller = GestureController(max_hands=2, trajectory_points=32)
-features = GestureFeatures()
+workers = FrameWorkerPool.from_env()
+profiler = StageProfiler.from_env()
+classifier = LandmarkClassifier.from_env()  # Stateless, shared by all sessions
+actions = ActionDispatcher.from_env()
+sessions = SessionManager(
+    HandsPool.from_env(max_hands=2),
+    max_hands=2,
+    trajectory_points=32,
+    gesture_library=os.environ.get("GESTURE_LIBRARY"),
+    profiler=profiler,
+    controller_options=lambda: {
+        "inference_input": InferenceInput.from_env(),
+        "frame_skipper": FrameSkipper.from_env(),
+        "landmark_filter": LandmarkFilterBank.from_env(),
+        "classifier": classifier,
+    },
+    dispatcher=actions,
+)
 active_connections: Dict[int, WebSocket] = {}
-connection_counter = 0
+
+def process_image(session: GestureSession, header: Dict[str, Any],
+                  image_bytes) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[np.ndarray]]:
+    """
+    Run gesture detection on one compressed frame.
+    
+    CPU-bound; called on a worker thread, never on the event loop. Sessions
+    that asked for landmark replies skip drawing and re-encoding entirely.
+
+    Args:
+        session (GestureSession): Tracking state of the connection
+        header (Dict[str, Any]): Frame header (mode, codec, ...)
+        image_bytes: Compressed image bytes
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Any], Optional[np.ndarray]]: Reply
+        metadata, frame analysis and encoded annotated frame (None when the
+        session wants landmarks only)
+    """
+    with profiler.stage("decode"):
+        frame = decode_image(image_bytes, header["codec"])
+    
+    with session.graph() as controller:
+        # Process frame
+        analysis = controller.analyze_frame(frame)
+    
+    annotated_frame = None
+    if session.response == RESPONSE_FRAME:
+        with profiler.stage("annotate"):
+            annotated_frame = controller.annotate_frame(analysis)
+    
+    # Handle mode-specific features with the first detected hand
+    features = session.features
+    landmarks = analysis["landmarks"]
+    if len(landmarks):
+        with profiler.stage("features"):
+            if header["mode"] == "mouse":
+                features.handle_mouse_control(landmarks[0], frame.shape[:2])
+            elif header["mode"] == "volume":
+                features.handle_volume_control(landmarks[0])
+            elif header["mode"] == "drawing" and annotated_frame is not None:
+                annotated_frame = features.handle_drawing(landmarks[0], annotated_frame)
+    
+    metadata = {
+        "gestures": analysis["gestures"],
+        "handedness": analysis["handedness"],
+        "hand_ids": analysis["hand_ids"],
+        "predicted": analysis["predicted"],
+    }
+    if annotated_frame is None:
+        return metadata, analysis, None
+    with profiler.stage("encode"):
+        buffer = encode_image(annotated_frame, header["codec"])
+    return metadata, analysis, buffer
+
+def frame_stats(received_at: float, dropped: int, mailbox: FrameMailbox) -> Dict[str, Any]:
+    """Backpressure fields added to every reply."""
+    latency = time.monotonic() - received_at
+    profiler.observe("frame", latency)
+    return {
+        "dropped": dropped,
+        "dropped_total": mailbox.dropped,
+        "latency_ms": round(latency * 1000, 2),
+    }
+
+def handle_binary_frame(session: GestureSession, message: bytes, received_at: float,
+                        dropped: int, mailbox: FrameMailbox) -> bytes:
+    """Parse, process and answer one binary protocol frame."""
+    profiler.observe("queue", time.monotonic() - received_at)
+    # Raw header + image bytes, decoded without intermediate copies
+    header, image_bytes = parse_binary_frame(message)
+    metadata, analysis, buffer = process_image(session, header, image_bytes)
+    metadata.update(frame_stats(received_at, dropped, mailbox))
+    if buffer is None:
+        layout, payload = pack_landmarks(analysis["landmarks"], analysis["trajectories"])
+        metadata.update(layout)
+        return build_binary_reply(header, metadata, payload, CODEC_LANDMARKS)
+    return build_binary_reply(header, metadata, buffer, header["codec"])
+
+def handle_json_frame(session: GestureSession, message, received_at: float,
+                      dropped: int, mailbox: FrameMailbox) -> str:
+    """Parse, process and answer one legacy JSON protocol frame."""
+    profiler.observe("queue", time.monotonic() - received_at)
+    frame_data = json.loads(message) if isinstance(message, str) else message
+    header, image_bytes = parse_json_frame(frame_data)
+    metadata, analysis, buffer = process_image(session, header, image_bytes)
+    metadata.update(frame_stats(received_at, dropped, mailbox))
+    if buffer is None:
+        metadata.update(landmarks_to_json(analysis["landmarks"], analysis["trajectories"]))
+        return json.dumps(metadata)
+    return json.dumps(build_json_reply(metadata, buffer))
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    global connection_counter
     await websocket.accept()
     
-    # Assign unique ID to connection
-    connection_id = connection_counter
-    connection_counter += 1
+    # Each connection gets its own tracking state
+    session = sessions.open()
+    connection_id = session.session_id
     active_connections[connection_id] = websocket
+    mailbox = FrameMailbox()
+    reader = None
     
     try:
+        # The first text message selects the protocol; legacy clients
+        # start sending JSON frames straight away.
+        protocol, session.response, pending = negotiate(await websocket.receive_text())
+        if pending is None:
+            await websocket.send_json({"protocol": protocol, "response": session.response})
+        else:
+            mailbox.put(pending)
+        
+        if protocol == PROTOCOL_BINARY:
+            handler, receive, send = handle_binary_frame, websocket.receive_bytes, websocket.send_bytes
+        else:
+            handler, receive, send = handle_json_frame, websocket.receive_text, websocket.send_text
+        
+        # Frames are received as fast as they arrive but only the newest one
+        # is processed; stale frames are dropped before they are decoded.
+        reader = asyncio.create_task(pump(receive, mailbox))
         while True:
-            # Receive frame data from client
-            data = await websocket.receive_text()
-            frame_data = json.loads(data)
-            
-            # Convert base64 image to numpy array
-            frame_bytes = base64.b64decode(frame_data["image"].split(",")[1])
-            frame_arr = np.frombuffer(frame_bytes, dtype=np.uint8)
-            frame = cv2.imdecode(frame_arr, cv2.IMREAD_COLOR)
-            
-            # Process frame
-            gestures, annotated_frame = controller.process_frame(frame)
-            
-            # Handle mode-specific features
-            if frame_data["mode"] == "mouse":
-                features.handle_mouse_control(frame)
-            elif frame_data["mode"] == "volume":
-                features.handle_volume_control(frame)
-            elif frame_data["mode"] == "drawing":
-                annotated_frame = features.handle_drawing(frame)
-            
-            # Convert processed frame back to base64
-            _, buffer = cv2.imencode('.jpg', annotated_frame)
-            img_str = base64.b64encode(buffer).decode('utf-8')
-            
-            # Send results back to client
-            await websocket.send_json({
-                "gestures": gestures,
-                "processed_image": f"data:image/jpeg;base64,{img_str}"
-            })
+            try:
+                message, received_at, dropped = await mailbox.get()
+            except MailboxClosed:
+                break
+            session.frames_dropped += dropped
+            reply = await workers.run(handler, session, message, received_at, dropped, mailbox)
+            with profiler.stage("send"):
+                await send(reply)
     
     except Exception as e:
         print(f"Error: {str(e)}")
     finally:
+        if reader is not None:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
         del active_connections[connection_id]
+        sessions.close(connection_id)
+
+# Socket.IO for the browser frontend, next to the raw WebSocket endpoint.
+# Serve both with ``uvicorn backend.main:asgi_app`` from the repository root.
+socket_server = GestureSocketServer(sessions, workers.run, process_image)
+asgi_app = socket_server.asgi_app(app)
+
+def action_stats() -> Dict[str, int]:
+    """OS action dispatcher counters, prefixed with ``actions_``."""
+    return {f"actions_{name}": value for name, value in actions.stats().items()}
+
+@app.get("/status")
+async def status() -> Dict[str, Any]:
+    """Report worker pool load, OS action counters and connection count."""
+    return dict(workers.stats(), **sessions.stats(), **action_stats(),
+                **socket_server.stats(), connections=len(active_connections))
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """Export stage latencies, frame counters and load in Prometheus text format."""
+    gauges = dict(workers.stats(), **sessions.stats(), **action_stats(),
+                  **socket_server.stats(), connections=len(active_connections))
+    text = render_metrics(profiler, list(sessions.sessions.values()),
+                          sessions.frame_counts(), gauges)
+    return Response(content=text, media_type=CONTENT_TYPE)
+
+async def evict_idle_graphs():
+    """Periodically close MediaPipe graphs nobody has used for a while."""
+    while True:
+        await asyncio.sleep(max(sessions.pool.idle_timeout / 2, 1.0))
+        await workers.run(sessions.pool.evict_idle)
 
 @app.on_event("startup")
 async def startup():
+    asyncio.create_task(evict_idle_graphs())
     print("Gesture Control Backend Started")
 
 @app.on_event("shutdown")
 async def shutdown():
     # Cleanup resources
-    controller.close()
+    workers.close()
+    sessions.close_all()
+    actions.close()
     cv2.destroyAllWindows()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""Prometheus text exposition of backend metrics."""
+
+import math
+from typing import Any, Dict, Iterable, List
+
+from src.profiling import QUANTILES, StageProfiler
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _metric(lines: List[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def render_metrics(profiler: StageProfiler, sessions: Iterable[Any], totals: Dict[str, int],
+                   gauges: Dict[str, int]) -> str:
+    """
+    Render metrics in the Prometheus text format.
+
+    Args:
+        profiler (StageProfiler): Stage profiler (summaries are empty when disabled)
+        sessions (Iterable[Any]): Open sessions, with ``session_id``,
+            ``frames_processed`` and ``frames_dropped``
+        totals (Dict[str, int]): Lifetime ``processed`` and ``dropped`` frame counts
+        gauges (Dict[str, int]): Point-in-time values, exported as ``gesture_<key>``
+
+    Returns:
+        str: Exposition text
+    """
+    lines: List[str] = []
+
+    _metric(lines, "gesture_stage_seconds", "summary", "Time spent in each processing stage.")
+    for stage, histogram in profiler.snapshot():
+        for q in QUANTILES:
+            lines.append(f'gesture_stage_seconds{{stage="{stage}",quantile="{q}"}} '
+                         f"{_format(histogram.quantile(q))}")
+        lines.append(f'gesture_stage_seconds_sum{{stage="{stage}"}} {_format(histogram.sum)}')
+        lines.append(f'gesture_stage_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+    sessions = list(sessions)
+    for kind, attribute, help_text in (
+        ("processed", "frames_processed", "Frames processed"),
+        ("dropped", "frames_dropped", "Frames dropped in favour of newer ones"),
+    ):
+        name = f"gesture_frames_{kind}_total"
+        _metric(lines, name, "counter", f"{help_text}, all connections.")
+        lines.append(f"{name} {totals[kind]}")
+        _metric(lines, f"gesture_connection_frames_{kind}_total", "counter",
+                f"{help_text}, per open connection.")
+        for session in sessions:
+            lines.append(f'gesture_connection_frames_{kind}_total{{connection="{session.session_id}"}} '
+                         f"{getattr(session, attribute)}")
+
+    for key, value in sorted(gauges.items()):
+        _metric(lines, f"gesture_{key}", "gauge", key.replace("_", " ").capitalize() + ".")
+        lines.append(f"gesture_{key} {value}")
+
+    return "\n".join(lines) + "\n"
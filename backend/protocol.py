@@ -0,0 +1,317 @@
+"""Wire protocols spoken over the gesture control WebSocket."""
+
+import base64
+import json
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Protocol names negotiated in the first text message of a connection
+PROTOCOL_JSON = "json"
+PROTOCOL_BINARY = "binary"
+PROTOCOLS = (PROTOCOL_BINARY, PROTOCOL_JSON)
+
+# Reply contents: the annotated frame, or structured results only
+RESPONSE_FRAME = "frame"
+RESPONSE_LANDMARKS = "landmarks"
+RESPONSES = (RESPONSE_FRAME, RESPONSE_LANDMARKS)
+
+# Control modes, in wire order
+MODES = ("normal", "mouse", "volume", "drawing")
+
+# Payload codecs
+CODEC_JPEG = 0
+CODEC_WEBP = 1
+CODEC_LANDMARKS = 2  # float32 landmarks followed by float32 trajectory points
+CODEC_EXTENSIONS = {CODEC_JPEG: ".jpg", CODEC_WEBP: ".webp"}
+
+# Client -> server: frame id, client timestamp (ms), mode, codec
+FRAME_HEADER = struct.Struct("<IdBB")
+
+# Server -> client: frame id, echoed client timestamp (ms), codec, metadata length
+REPLY_HEADER = struct.Struct("<IdBI")
+
+
+class ProtocolError(ValueError):
+    """Raised when a client message cannot be parsed."""
+
+
+def negotiate(message: str) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+    """
+    Pick the protocol for a connection from its first text message.
+
+    Clients opt into the binary protocol by sending ``{"protocol": "binary"}``
+    and into structured-only replies with ``"response": "landmarks"``.
+    Anything else is treated as the legacy JSON protocol; if the first message
+    already carries a frame it is returned so it can be processed.
+
+    Args:
+        message (str): First text message received on the socket
+
+    Returns:
+        Tuple[str, str, Optional[Dict[str, Any]]]: Chosen protocol, response
+        kind and a pending legacy frame message, if any
+    """
+    try:
+        data = json.loads(message)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"Invalid handshake: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ProtocolError("Handshake must be a JSON object")
+
+    response = data.get("response", RESPONSE_FRAME)
+    if response not in RESPONSES:
+        response = RESPONSE_FRAME
+
+    if "image" in data:
+        return PROTOCOL_JSON, response, data
+
+    protocol = data.get("protocol", PROTOCOL_JSON)
+    if protocol not in PROTOCOLS:
+        protocol = PROTOCOL_JSON
+    return protocol, response, None
+
+
+def decode_image(buffer, codec: int = CODEC_JPEG) -> np.ndarray:
+    """
+    Decode a compressed image straight from a bytes-like buffer.
+
+    Args:
+        buffer: Bytes-like object holding the compressed image
+        codec (int): Payload codec (decoding is format-agnostic)
+
+    Returns:
+        np.ndarray: Decoded BGR frame
+    """
+    frame = cv2.imdecode(np.frombuffer(buffer, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise ProtocolError("Could not decode image payload")
+    return frame
+
+
+def encode_image(frame: np.ndarray, codec: int = CODEC_JPEG, quality: int = 95) -> np.ndarray:
+    """
+    Compress a frame with the requested codec.
+
+    Args:
+        frame (np.ndarray): BGR frame
+        codec (int): Output codec
+        quality (int): Encoder quality (0-100)
+
+    Returns:
+        np.ndarray: Encoded bytes as a uint8 array
+    """
+    if codec == CODEC_WEBP:
+        params = [cv2.IMWRITE_WEBP_QUALITY, quality]
+    elif codec == CODEC_JPEG:
+        params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+    else:
+        raise ProtocolError(f"Cannot encode frames as codec {codec}")
+
+    ok, buffer = cv2.imencode(CODEC_EXTENSIONS[codec], frame, params)
+    if not ok:
+        raise ProtocolError("Could not encode frame")
+    return buffer
+
+
+def parse_binary_frame(message: bytes) -> Tuple[Dict[str, Any], memoryview]:
+    """
+    Split a binary frame message into its header and image payload.
+
+    Args:
+        message (bytes): Raw WebSocket binary message
+
+    Returns:
+        Tuple[Dict[str, Any], memoryview]: Header fields and a zero-copy
+        view of the compressed image bytes
+    """
+    if len(message) <= FRAME_HEADER.size:
+        raise ProtocolError("Binary frame is too short")
+
+    frame_id, timestamp, mode, codec = FRAME_HEADER.unpack_from(message)
+    if mode >= len(MODES):
+        raise ProtocolError(f"Unknown mode {mode}")
+    if codec not in CODEC_EXTENSIONS:  # Frames carry images; landmarks are reply-only
+        raise ProtocolError(f"Unsupported frame codec {codec}")
+
+    header = {
+        "frame_id": frame_id,
+        "timestamp": timestamp,
+        "mode": MODES[mode],
+        "codec": codec,
+    }
+    return header, memoryview(message)[FRAME_HEADER.size:]
+
+
+def build_binary_frame(frame_id: int, timestamp: float, mode: str,
+                       payload: bytes, codec: int = CODEC_JPEG) -> bytes:
+    """
+    Build a client binary frame message (used by clients and benchmarks).
+
+    Args:
+        frame_id (int): Client frame counter
+        timestamp (float): Client timestamp in milliseconds
+        mode (str): Control mode name
+        payload (bytes): Compressed image bytes
+        codec (int): Payload codec
+
+    Returns:
+        bytes: Binary message
+    """
+    return FRAME_HEADER.pack(frame_id, timestamp, MODES.index(mode), codec) + bytes(payload)
+
+
+def build_binary_reply(header: Dict[str, Any], metadata: Dict[str, Any],
+                       payload: bytes, codec: int = CODEC_JPEG) -> bytes:
+    """
+    Build a server binary reply.
+
+    The reply is a fixed header, a JSON metadata block of the advertised
+    length and the raw payload bytes.
+
+    Args:
+        header (Dict[str, Any]): Parsed header of the frame being answered
+        metadata (Dict[str, Any]): JSON-serialisable results (gestures, ...)
+        payload (bytes): Encoded reply payload
+        codec (int): Payload codec
+
+    Returns:
+        bytes: Binary message
+    """
+    meta = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+    return b"".join((
+        REPLY_HEADER.pack(header["frame_id"], header["timestamp"], codec, len(meta)),
+        meta,
+        payload,
+    ))
+
+
+def parse_binary_reply(message: bytes) -> Tuple[Dict[str, Any], memoryview]:
+    """
+    Split a server binary reply into its metadata and payload.
+
+    Args:
+        message (bytes): Raw reply message
+
+    Returns:
+        Tuple[Dict[str, Any], memoryview]: Header fields merged with the
+        metadata block, and a view of the payload bytes
+    """
+    if len(message) < REPLY_HEADER.size:
+        raise ProtocolError("Binary reply is too short")
+
+    frame_id, timestamp, codec, meta_len = REPLY_HEADER.unpack_from(message)
+    start = REPLY_HEADER.size
+    metadata = json.loads(bytes(message[start:start + meta_len]))
+    metadata.update(frame_id=frame_id, timestamp=timestamp, codec=codec)
+    return metadata, memoryview(message)[start + meta_len:]
+
+
+def parse_json_frame(data: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Extract the header fields and image bytes from a legacy JSON frame.
+
+    Args:
+        data (Dict[str, Any]): Parsed JSON message with a data-URL ``image``
+
+    Returns:
+        Tuple[Dict[str, Any], bytes]: Header fields and compressed image bytes
+    """
+    try:
+        image = data["image"]
+    except KeyError as e:
+        raise ProtocolError("JSON frame has no image") from e
+
+    header = {
+        "frame_id": data.get("frame_id", 0),
+        "timestamp": data.get("timestamp", 0.0),
+        "mode": data.get("mode", "normal"),
+        "codec": CODEC_JPEG,
+    }
+    return header, base64.b64decode(image.split(",", 1)[-1])
+
+
+def build_json_reply(metadata: Dict[str, Any], payload: bytes) -> Dict[str, Any]:
+    """
+    Build a legacy JSON reply carrying a base64 data-URL image.
+
+    Args:
+        metadata (Dict[str, Any]): Results to include in the reply
+        payload (bytes): JPEG encoded frame
+
+    Returns:
+        Dict[str, Any]: JSON-serialisable reply
+    """
+    img_str = base64.b64encode(payload).decode("utf-8")
+    return dict(metadata, processed_image=f"data:image/jpeg;base64,{img_str}")
+
+
+def pack_landmarks(landmarks: np.ndarray,
+                   trajectories: Dict[Any, np.ndarray]) -> Tuple[Dict[str, Any], bytes]:
+    """
+    Pack landmarks and trajectories into a compact float32 payload.
+
+    Args:
+        landmarks (np.ndarray): Landmarks of shape (hands, 21, 3)
+        trajectories (Dict[Any, np.ndarray]): Hand id to (points, 2) trajectory
+
+    Returns:
+        Tuple[Dict[str, Any], bytes]: Metadata describing the layout and the
+        payload (landmarks, then each trajectory in ``trajectory_ids`` order)
+    """
+    ids = list(trajectories)
+    parts = [np.ascontiguousarray(landmarks, dtype=np.float32)]
+    parts.extend(np.ascontiguousarray(trajectories[i], dtype=np.float32) for i in ids)
+    metadata = {
+        "hands": int(landmarks.shape[0]),
+        "trajectory_ids": ids,
+        "trajectory_lengths": [int(len(trajectories[i])) for i in ids],
+    }
+    return metadata, b"".join(part.tobytes() for part in parts)
+
+
+def unpack_landmarks(metadata: Dict[str, Any],
+                     payload) -> Tuple[np.ndarray, Dict[Any, np.ndarray]]:
+    """
+    Inverse of :func:`pack_landmarks`.
+
+    Args:
+        metadata (Dict[str, Any]): Reply metadata
+        payload: Payload bytes
+
+    Returns:
+        Tuple[np.ndarray, Dict[Any, np.ndarray]]: Landmarks and trajectories
+    """
+    values = np.frombuffer(payload, dtype=np.float32)
+    offset = metadata["hands"] * 21 * 3
+    landmarks = values[:offset].reshape(-1, 21, 3)
+    trajectories = {}
+    for hand_id, length in zip(metadata["trajectory_ids"], metadata["trajectory_lengths"]):
+        trajectories[hand_id] = values[offset:offset + 2 * length].reshape(-1, 2)
+        offset += 2 * length
+    return landmarks, trajectories
+
+
+def landmarks_to_json(landmarks: np.ndarray, trajectories: Dict[Any, np.ndarray],
+                      decimals: int = 4) -> Dict[str, Any]:
+    """
+    Structured results for JSON protocol replies.
+
+    Args:
+        landmarks (np.ndarray): Landmarks of shape (hands, 21, 3)
+        trajectories (Dict[Any, np.ndarray]): Hand id to (points, 2) trajectory
+        decimals (int): Rounding applied to coordinates
+
+    Returns:
+        Dict[str, Any]: JSON-serialisable landmarks and trajectories
+    """
+    return {
+        "landmarks": np.round(landmarks, decimals).tolist(),
+        "trajectories": {
+            str(hand_id): np.round(points, decimals).tolist()
+            for hand_id, points in trajectories.items()
+        },
+    }
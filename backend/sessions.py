@@ -0,0 +1,168 @@
+"""Per-connection gesture sessions backed by a pool of MediaPipe graphs."""
+
+import itertools
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from src.actions import ActionDispatcher
+from src.gesture_control import GestureController
+from src.gesture_features import GestureFeatures
+from src.profiling import StageProfiler
+from backend.hands_pool import HandsPool
+
+
+class GestureSession:
+    """Gesture tracking state belonging to a single connection."""
+
+    def __init__(self, session_id: int, pool: HandsPool, max_hands: int = 2,
+                 trajectory_points: int = 32, gesture_library: Optional[str] = None,
+                 profiler: Optional[StageProfiler] = None,
+                 dispatcher: Optional[ActionDispatcher] = None, **controller_options):
+        """
+        Initialize a session.
+
+        Args:
+            session_id (int): Unique session identifier
+            pool (HandsPool): Pool that graphs are leased from
+            max_hands (int): Maximum number of hands to detect
+            trajectory_points (int): Number of points to store for gesture trajectories
+            gesture_library (Optional[str]): Shared custom gesture library path
+            profiler (Optional[StageProfiler]): Shared stage profiler
+            dispatcher (Optional[ActionDispatcher]): Shared OS action dispatcher
+            **controller_options: Further :class:`GestureController` arguments
+                (per-session stages such as ``inference_input``)
+        """
+        self.session_id = session_id
+        self.pool = pool
+        self.controller = GestureController(
+            max_hands=max_hands,
+            trajectory_points=trajectory_points,
+            gesture_library=gesture_library,
+            profiler=profiler,
+            **controller_options
+        )
+        self.features = GestureFeatures(dispatcher)
+        self.response = "frame"  # Reply with the annotated frame or landmarks only
+        self.created = time.monotonic()
+        self.frames_processed = 0
+        self.frames_dropped = 0
+
+    @contextmanager
+    def graph(self) -> Iterator[GestureController]:
+        """
+        Bind a pooled graph to this session's controller for one frame.
+
+        Yields:
+            GestureController: The session's controller, ready to process a frame
+        """
+        with self.pool.lease(self.session_id) as hands:
+            self.controller.hands = hands
+            try:
+                yield self.controller
+            finally:
+                self.controller.hands = None
+                self.frames_processed += 1
+
+    def close(self) -> None:
+        """Release the session's hold on pooled graphs."""
+        self.pool.forget(self.session_id)
+        self.controller.close()
+
+
+class SessionManager:
+    """Creates and tracks per-connection gesture sessions."""
+
+    def __init__(self, pool: HandsPool, max_hands: int = 2, trajectory_points: int = 32,
+                 gesture_library: Optional[str] = None, profiler: Optional[StageProfiler] = None,
+                 controller_options: Optional[Callable[[], Dict[str, Any]]] = None,
+                 dispatcher: Optional[ActionDispatcher] = None):
+        """
+        Initialize the session manager.
+
+        Args:
+            pool (HandsPool): Graph pool shared by all sessions
+            max_hands (int): Maximum number of hands to detect per session
+            trajectory_points (int): Number of points to store for gesture trajectories
+            gesture_library (Optional[str]): Custom gesture library every session
+                loads (memory-mapped, so shared) and records into
+            profiler (Optional[StageProfiler]): Stage profiler shared by all
+                sessions (disabled by default)
+            controller_options (Optional[Callable[[], Dict[str, Any]]]):
+                Called once per session for extra :class:`GestureController`
+                arguments, so stateful stages are never shared
+            dispatcher (Optional[ActionDispatcher]): OS action dispatcher
+                shared by all sessions, so actions from every connection
+                are coalesced and rate-limited together
+        """
+        self.pool = pool
+        self.max_hands = max_hands
+        self.trajectory_points = trajectory_points
+        self.gesture_library = gesture_library
+        self.profiler = profiler if profiler is not None else StageProfiler()
+        self.controller_options = controller_options
+        self.dispatcher = dispatcher
+        self.sessions: Dict[int, GestureSession] = {}
+        self._ids = itertools.count()
+        # Frame counts of sessions that have already closed
+        self.closed_processed = 0
+        self.closed_dropped = 0
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def open(self) -> GestureSession:
+        """
+        Create a session for a new connection.
+
+        Returns:
+            GestureSession: Fresh session
+        """
+        options = self.controller_options() if self.controller_options else {}
+        session = GestureSession(next(self._ids), self.pool, self.max_hands,
+                                 self.trajectory_points, self.gesture_library, self.profiler,
+                                 self.dispatcher, **options)
+        self.sessions[session.session_id] = session
+        return session
+
+    def close(self, session_id: int) -> None:
+        """
+        Close and forget a session.
+
+        Args:
+            session_id (int): Session identifier
+        """
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            self.closed_processed += session.frames_processed
+            self.closed_dropped += session.frames_dropped
+            session.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of session and graph counts.
+
+        Returns:
+            Dict[str, int]: Open sessions and live graphs
+        """
+        return {"sessions": len(self.sessions), "graphs": len(self.pool)}
+
+    def frame_counts(self) -> Dict[str, int]:
+        """
+        Frames processed and dropped over the lifetime of the manager.
+
+        Returns:
+            Dict[str, int]: ``processed`` and ``dropped`` totals, closed
+            sessions included
+        """
+        sessions = list(self.sessions.values())
+        return {
+            "processed": self.closed_processed + sum(s.frames_processed for s in sessions),
+            "dropped": self.closed_dropped + sum(s.frames_dropped for s in sessions),
+        }
+
+    def close_all(self) -> None:
+        """Close every session and the graph pool."""
+        for session_id in list(self.sessions):
+            self.close(session_id)
+        self.pool.close()
@@ -0,0 +1,187 @@
+"""Socket.IO transport for the browser frontend, served next to the FastAPI app."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import socketio
+
+from backend.ingest import FrameMailbox, MailboxClosed
+from backend.protocol import (
+    MODES,
+    RESPONSE_LANDMARKS,
+    ProtocolError,
+    parse_binary_frame,
+    parse_json_frame,
+)
+
+
+class SocketClient:
+    """Per-connection state of a Socket.IO client."""
+
+    def __init__(self, sid: str, session):
+        """
+        Initialize a client.
+
+        Args:
+            sid (str): Socket.IO session ID
+            session (GestureSession): Gesture session of the connection
+        """
+        self.sid = sid
+        self.session = session
+        self.mode = "normal"
+        self.mailbox = FrameMailbox()
+        self.last_gestures: Optional[Tuple[str, ...]] = None
+        self.task: Optional[asyncio.Task] = None
+
+
+class GestureSocketServer:
+    """
+    Socket.IO server speaking the frontend's events.
+
+    Clients send ``frame`` events, either binary protocol frames (bytes) or
+    JSON frames with a data-URL ``image``. Only the newest frame of a client
+    is processed; older ones are dropped. ``gesture_detected`` is emitted
+    when a client's gestures change, not on every frame, to the client and
+    every room it has joined, so viewers that ``join`` the same room see
+    its gestures too. ``change_mode`` sets the control mode of frames that
+    do not carry one.
+    """
+
+    def __init__(self, sessions, run: Callable[..., Awaitable[Any]],
+                 process: Callable[..., Tuple[Dict[str, Any], Dict[str, Any], Any]],
+                 sio: Optional[socketio.AsyncServer] = None):
+        """
+        Initialize the server and register its event handlers.
+
+        Args:
+            sessions (SessionManager): Creates a gesture session per client
+            run (Callable[..., Awaitable[Any]]): Runs CPU-bound work off the
+                event loop (``FrameWorkerPool.run``)
+            process (Callable): ``process(session, header, image_bytes)``
+                returning ``(metadata, analysis, encoded_frame)``
+            sio (Optional[socketio.AsyncServer]): Server to register on (an
+                ASGI server allowing any origin when omitted)
+        """
+        self.sessions = sessions
+        self.run = run
+        self.process = process
+        self.sio = sio if sio is not None else socketio.AsyncServer(
+            async_mode="asgi", cors_allowed_origins="*")
+        self.clients: Dict[str, SocketClient] = {}
+        self.frames = 0
+        self.events = 0
+        for event in ("connect", "disconnect", "frame", "change_mode", "join", "leave"):
+            self.sio.on(event, getattr(self, f"on_{event}"))
+
+    def asgi_app(self, other_app=None) -> socketio.ASGIApp:
+        """
+        Wrap another ASGI app, serving Socket.IO on ``/socket.io/``.
+
+        Args:
+            other_app: App receiving every other request (e.g. FastAPI)
+
+        Returns:
+            socketio.ASGIApp: Combined ASGI application
+        """
+        return socketio.ASGIApp(self.sio, other_asgi_app=other_app)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of Socket.IO counters.
+
+        Returns:
+            Dict[str, int]: Connected clients, frames processed and gesture
+            events emitted
+        """
+        return {"socket_clients": len(self.clients), "socket_frames": self.frames,
+                "socket_events": self.events}
+
+    async def on_connect(self, sid: str, environ: Dict[str, Any], auth=None) -> None:
+        session = self.sessions.open()
+        session.response = RESPONSE_LANDMARKS  # Gestures only, no frames back
+        client = self.clients[sid] = SocketClient(sid, session)
+        client.task = asyncio.create_task(self._consume(client))
+
+    async def on_disconnect(self, sid: str, *args) -> None:
+        client = self.clients.pop(sid, None)
+        if client is None:
+            return
+        client.mailbox.close()
+        await asyncio.gather(client.task, return_exceptions=True)
+        self.sessions.close(client.session.session_id)
+
+    async def on_frame(self, sid: str, data) -> None:
+        client = self.clients.get(sid)
+        if client is not None:
+            client.mailbox.put(data)
+
+    async def on_change_mode(self, sid: str, data) -> Dict[str, Any]:
+        client = self.clients.get(sid)
+        mode = data.get("mode") if isinstance(data, dict) else None
+        if client is None or mode not in MODES:
+            return {"error": f"Unknown mode {mode}"}
+        client.mode = mode
+        return {"mode": mode}
+
+    async def on_join(self, sid: str, data) -> Dict[str, Any]:
+        room = data.get("room") if isinstance(data, dict) else None
+        if not room:
+            return {"error": "No room given"}
+        await self.sio.enter_room(sid, room)
+        return {"room": room}
+
+    async def on_leave(self, sid: str, data) -> Dict[str, Any]:
+        room = data.get("room") if isinstance(data, dict) else None
+        if not room:
+            return {"error": "No room given"}
+        await self.sio.leave_room(sid, room)
+        return {"room": room}
+
+    def _process_frame(self, client: SocketClient, message) -> Dict[str, Any]:
+        # Runs on a worker thread
+        if isinstance(message, dict):
+            header, image_bytes = parse_json_frame(message)
+            header["mode"] = message.get("mode", client.mode)
+        else:
+            header, image_bytes = parse_binary_frame(message)
+        metadata, _, _ = self.process(client.session, header, image_bytes)
+        metadata["mode"] = header["mode"]
+        return metadata
+
+    async def _consume(self, client: SocketClient) -> None:
+        while True:
+            try:
+                message, received_at, dropped = await client.mailbox.get()
+            except MailboxClosed:
+                return
+            client.session.frames_dropped += dropped
+            try:
+                metadata = await self.run(self._process_frame, client, message)
+            except ProtocolError as e:
+                await self.sio.emit("frame_error", {"message": str(e)}, to=client.sid)
+                continue
+            except Exception as e:  # Keep serving the client's next frames
+                print(f"Error: {str(e)}")
+                await self.sio.emit("frame_error", {"message": "Frame processing failed"},
+                                    to=client.sid)
+                continue
+            self.frames += 1
+            await self._publish(client, metadata, received_at)
+
+    async def _publish(self, client: SocketClient, metadata: Dict[str, Any],
+                       received_at: float) -> None:
+        gestures: List[str] = list(metadata["gestures"])
+        if tuple(gestures) == client.last_gestures:
+            return
+        client.last_gestures = tuple(gestures)
+        event = {
+            "gesture": gestures[0] if gestures else "None",
+            "gestures": gestures,
+            "hand_ids": list(metadata.get("hand_ids", [])),
+            "mode": metadata["mode"],
+            "latency_ms": round((time.monotonic() - received_at) * 1000, 2),
+        }
+        # The client's own room plus every room it joined, each client once
+        await self.sio.emit("gesture_detected", event, to=list(self.sio.rooms(client.sid)))
+        self.events += 1
@@ -0,0 +1,112 @@
+"""Worker pool that keeps CPU-bound frame processing off the event loop."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class FrameWorkerPool:
+    """
+    Bounded thread pool for decode, inference and encode stages.
+
+    OpenCV and MediaPipe release the GIL inside their native code, so threads
+    scale across cores while per-connection state stays in this process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        """
+        Initialize the worker pool.
+
+        Args:
+            max_workers (Optional[int]): Number of worker threads (defaults to the CPU count)
+            max_pending (Optional[int]): Maximum number of submitted jobs, running or
+                queued, before submitters wait (defaults to 4x the worker count)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="gesture-worker"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._slots = None
+
+    @classmethod
+    def from_env(cls) -> "FrameWorkerPool":
+        """
+        Create a pool sized by ``GESTURE_WORKERS`` and ``GESTURE_MAX_PENDING``.
+
+        Returns:
+            FrameWorkerPool: Configured pool
+        """
+        return cls(
+            max_workers=int(os.environ.get("GESTURE_WORKERS", 0)) or None,
+            max_pending=int(os.environ.get("GESTURE_MAX_PENDING", 0)) or None,
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs submitted but not yet picked up by a worker."""
+        with self._lock:
+            return self._pending - self._running
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of the pool state.
+
+        Returns:
+            Dict[str, int]: Worker count, queue depth and jobs in flight
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "queue_depth": self._pending - self._running,
+                "running": self._running,
+            }
+
+    def _call(self, func: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._pending -= 1
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run ``func(*args)`` on a worker thread and await its result.
+
+        Waits for a free slot when ``max_pending`` jobs are already in flight.
+
+        Args:
+            func (Callable[..., Any]): CPU-bound callable
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Any: Result of ``func``
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        async with self._slots:
+            with self._lock:
+                self._pending += 1
+            loop = asyncio.get_running_loop()
+            try:
+                future = loop.run_in_executor(self._executor, self._call, func, *args)
+            except RuntimeError:
+                with self._lock:
+                    self._pending -= 1
+                raise
+            return await future
+
+    def close(self) -> None:
+        """Wait for running jobs and stop the worker threads."""
+        self._executor.shutdown(wait=True)
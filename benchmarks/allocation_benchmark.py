@@ -0,0 +1,84 @@
+"""Per-frame memory allocation of the frame pipeline, measured with tracemalloc.
+
+Runs ``analyze_frame`` and ``annotate_frame`` on synthetic frames with the
+pooled flip and colour conversion buffers, and with a pool that allocates
+fresh arrays every frame (the previous behaviour). Reports the peak memory
+each frame allocates on top of the steady state. Inference is replaced by
+replayed synthetic hands so only the pipeline's own allocations are
+counted; ``--mediapipe`` runs the real model instead.
+
+    python -m benchmarks.allocation_benchmark --frames 100
+"""
+
+import argparse
+import tracemalloc
+from types import SimpleNamespace
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_frame, synthetic_hand, to_protobuf
+from src.buffers import FramePool
+from src.gesture_control import GestureController
+
+RESOLUTIONS = {"480p": (640, 480), "720p": (1280, 720), "1080p": (1920, 1080)}
+
+
+class FreshPool(FramePool):
+    """A pool that never reuses buffers."""
+
+    def get(self, name, shape, dtype=np.uint8):
+        self.allocations += 1
+        return np.empty(tuple(shape), dtype=dtype)
+
+
+class ReplayHands:
+    """Stands in for MediaPipe Hands, returning the same two hands every frame."""
+
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        hands = [synthetic_hand(5, center=(0.3, 0.6), rng=rng),
+                 synthetic_hand(2, center=(0.7, 0.6), rng=rng)]
+        labels = [SimpleNamespace(classification=[SimpleNamespace(label=label, score=0.9)])
+                  for label in ("Left", "Right")]
+        self.results = SimpleNamespace(multi_hand_landmarks=[to_protobuf(h) for h in hands],
+                                       multi_handedness=labels)
+
+    def process(self, image):
+        return self.results
+
+
+def measure(frame: np.ndarray, pool: FramePool, frames: int, mediapipe: bool) -> float:
+    """Mean peak bytes allocated per frame once warmed up."""
+    controller = GestureController(hands=None if mediapipe else ReplayHands(), frame_pool=pool)
+    for _ in range(10):  # Warm up buffers, trajectories and overlays
+        controller.annotate_frame(controller.analyze_frame(frame))
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(frames):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        controller.annotate_frame(controller.analyze_frame(frame))
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+    controller.close()
+    return float(np.mean(peaks))
+
+
+def main():
+    """Run the allocation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--mediapipe", action="store_true", help="Run real inference")
+    args = parser.parse_args()
+
+    print(f"{'resolution':>10}{'frame KiB':>12}{'fresh KiB':>12}{'pooled KiB':>12}")
+    for name, (width, height) in RESOLUTIONS.items():
+        frame = synthetic_frame(width, height)
+        fresh = measure(frame, FreshPool(), args.frames, args.mediapipe)
+        pooled = measure(frame, FramePool(), args.frames, args.mediapipe)
+        print(f"{name:>10}{frame.nbytes / 1024:>12.0f}{fresh / 1024:>12.1f}{pooled / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
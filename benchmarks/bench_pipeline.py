@@ -0,0 +1,244 @@
+"""Per-stage timings of the per-frame hot path (pytest-benchmark).
+
+Image stages run on synthetic frames at 480p, 720p and 1080p; gesture
+stages run on replayed landmarks (two moving hands), so no camera or real
+hand images are needed. Every stage is its own benchmark group.
+
+The file is not collected by the normal test run; run it explicitly:
+
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-json=results.json
+
+Save a baseline and compare later runs against it, failing on regressions:
+
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-save=baseline
+    python -m pytest benchmarks/bench_pipeline.py --benchmark-compare=0001 \\
+        --benchmark-compare-fail=median:15%
+"""
+
+import base64
+import itertools
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from backend.protocol import CODEC_JPEG, decode_image, encode_image
+from benchmarks.replay_benchmark import synthetic_recording
+from benchmarks.synthetic import synthetic_frame, synthetic_hand, to_protobuf
+from src.classifier import landmark_features, train_classifier
+from src.drawing import DrawingCanvas
+from src.filters import KalmanFilterBank, OneEuroFilterBank
+from src.gesture_control import GestureController
+from src.recording import LandmarkReplay
+from src.tracking import HandTracker
+
+RESOLUTIONS = {"480p": (640, 480), "720p": (1280, 720), "1080p": (1920, 1080)}
+
+
+@pytest.fixture(params=list(RESOLUTIONS), scope="module")
+def resolution(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def frame(resolution):
+    return synthetic_frame(*RESOLUTIONS[resolution])
+
+
+@pytest.fixture(scope="module")
+def replay(tmp_path_factory):
+    path = os.path.join(tmp_path_factory.mktemp("replay"), "hands.glr")
+    synthetic_recording(path, 600)
+    return LandmarkReplay.load(path)
+
+
+@pytest.fixture
+def controller(replay):
+    controller = GestureController()
+    rng = np.random.default_rng(1)
+    for i in range(20):
+        controller.record_custom_gesture(f"g{i}", synthetic_hand(i % 6, rng=rng))
+    # Warm the trajectories so drawing has full-length paths
+    for _ in replay.replay(controller, limit=controller.trajectory_length):
+        pass
+    yield controller
+    controller.close()
+
+
+def hands_cycle(replay):
+    """Endless (timestamp, hand) pairs from the replay."""
+    return itertools.cycle(
+        (recorded.timestamp, hand) for recorded in replay for hand in recorded.landmarks
+    )
+
+
+def _info(benchmark, resolution=None):
+    if resolution:
+        benchmark.extra_info["resolution"] = resolution
+
+
+# Image stages
+
+@pytest.mark.benchmark(group="flip")
+def test_flip(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    benchmark(cv2.flip, frame, 1)
+
+
+@pytest.mark.benchmark(group="bgr_to_rgb")
+def test_bgr_to_rgb(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    benchmark(cv2.cvtColor, frame, cv2.COLOR_BGR2RGB)
+
+
+@pytest.mark.benchmark(group="hands_process")
+def test_hands_process(benchmark, frame, resolution, controller):
+    _info(benchmark, resolution)
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    benchmark(controller.hands.process, rgb)
+
+
+@pytest.mark.benchmark(group="draw_landmarks")
+def test_draw_landmarks(benchmark, frame, resolution, controller, replay):
+    _info(benchmark, resolution)
+    image = frame.copy()
+    hands = [to_protobuf(hand) for hand in replay.frames[0].landmarks]
+
+    def draw():
+        for hand in hands:
+            controller.mp_draw.draw_landmarks(image, hand, controller.mp_hands.HAND_CONNECTIONS)
+
+    benchmark(draw)
+
+
+@pytest.mark.benchmark(group="draw_trajectories")
+def test_draw_trajectories(benchmark, frame, resolution, controller):
+    _info(benchmark, resolution)
+    image = frame.copy()
+    benchmark(controller.draw_trajectories, image)
+
+
+@pytest.mark.benchmark(group="draw_gesture_history")
+def test_draw_gesture_history(benchmark, frame, resolution, controller):
+    _info(benchmark, resolution)
+    image = frame.copy()
+    benchmark(controller.draw_gesture_history, image)
+
+
+@pytest.mark.benchmark(group="drawing_composite")
+def test_drawing_composite(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    image = frame.copy()
+    canvas = DrawingCanvas()
+    canvas.begin_stroke((0, 255, 0), 2)
+    for t in np.linspace(0, 2 * np.pi, 60):  # A small circle of ink
+        canvas.add_point(0.5 + 0.1 * np.cos(t), 0.5 + 0.1 * np.sin(t))
+    benchmark(canvas.composite, image)
+
+
+@pytest.mark.benchmark(group="jpeg_encode")
+def test_jpeg_encode(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    benchmark(encode_image, frame, CODEC_JPEG)
+
+
+@pytest.mark.benchmark(group="jpeg_decode")
+def test_jpeg_decode(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    jpeg = encode_image(frame, CODEC_JPEG).tobytes()
+    benchmark(decode_image, jpeg, CODEC_JPEG)
+
+
+@pytest.mark.benchmark(group="base64_encode")
+def test_base64_encode(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    jpeg = encode_image(frame, CODEC_JPEG).tobytes()
+    benchmark(base64.b64encode, jpeg)
+
+
+@pytest.mark.benchmark(group="base64_decode")
+def test_base64_decode(benchmark, frame, resolution):
+    _info(benchmark, resolution)
+    encoded = base64.b64encode(encode_image(frame, CODEC_JPEG).tobytes())
+    benchmark(base64.b64decode, encoded)
+
+
+# Gesture stages (resolution independent, replayed landmarks)
+
+@pytest.mark.benchmark(group="trajectory_update")
+def test_trajectory_update(benchmark, controller, replay):
+    hands = hands_cycle(replay)
+    benchmark(lambda: controller.update_trajectory(0, next(hands)[1]))
+
+
+@pytest.mark.benchmark(group="dynamic_gesture")
+def test_dynamic_gesture(benchmark, controller, replay):
+    hands = hands_cycle(replay)
+
+    def detect():
+        timestamp, hand = next(hands)
+        controller.detect_dynamic_gesture(hand, timestamp)
+
+    benchmark(detect)
+
+
+@pytest.mark.benchmark(group="static_gestures")
+@pytest.mark.parametrize("method", ["rules", "classifier"])
+def test_static_gestures(benchmark, controller, replay, method):
+    if method == "classifier":
+        hands = np.concatenate([recorded.landmarks for recorded in replay.frames[:200]])
+        labels = [controller.detect_gesture(hand) for hand in hands]
+        controller.classifier = train_classifier(landmark_features(hands), labels, epochs=50)
+    frames = itertools.cycle(replay.frames)
+
+    def classify():
+        recorded = next(frames)
+        controller.detect_gestures(recorded.landmarks, recorded.handedness)
+
+    benchmark(classify)
+
+
+@pytest.mark.benchmark(group="custom_match")
+def test_custom_match(benchmark, controller, replay):
+    hands = hands_cycle(replay)
+    benchmark(lambda: controller.match_custom_gesture(next(hands)[1]))
+
+
+@pytest.mark.benchmark(group="analyze_landmarks")
+def test_analyze_landmarks(benchmark, controller, replay):
+    frames = itertools.cycle(replay.frames)
+
+    def analyze():
+        recorded = next(frames)
+        controller.analyze_landmarks(recorded.landmarks, recorded.handedness, recorded.timestamp)
+
+    benchmark(analyze)
+
+
+@pytest.mark.benchmark(group="smoothing")
+@pytest.mark.parametrize("bank", ["one_euro", "kalman"])
+def test_smoothing(benchmark, replay, bank):
+    filters = {"one_euro": OneEuroFilterBank, "kalman": KalmanFilterBank}[bank]()
+    frames = itertools.cycle(replay.frames)
+    clock = itertools.count()
+
+    def smooth():
+        recorded = next(frames)
+        filters.filter(["Left", "Right"][:len(recorded.landmarks)], recorded.landmarks,
+                       next(clock) / 30)
+
+    benchmark(smooth)
+
+
+@pytest.mark.benchmark(group="tracking")
+def test_tracking(benchmark, replay):
+    tracker = HandTracker()
+    frames = itertools.cycle(replay.frames)
+    clock = itertools.count()
+
+    def track():
+        recorded = next(frames)
+        tracker.update(recorded.landmarks, recorded.handedness, next(clock) / 30)
+
+    benchmark(track)
@@ -0,0 +1,90 @@
+"""Micro-benchmark: protobuf attribute access vs. the NumPy landmark array.
+
+Times the per-hand gesture logic (finger counting, palm position, trajectory
+update, custom gesture matching and feature distances) on the original
+protobuf implementation and on the array path, including the one-off
+conversion of each hand.
+
+    python -m benchmarks.landmark_benchmark --iterations 5000
+"""
+
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_hand, to_protobuf
+from src.gesture_control import GestureController
+from src.landmarks import PINKY_TIP, THUMB_TIP, landmarks_to_array
+
+
+def legacy_per_hand(hand_landmarks, templates, trajectory):
+    """The pre-array implementation of the per-hand gesture logic."""
+    # count_fingers
+    count = 0
+    if hand_landmarks.landmark[4].x < hand_landmarks.landmark[3].x:
+        count += 1
+    for tip in [8, 12, 16, 20]:
+        if hand_landmarks.landmark[tip].y < hand_landmarks.landmark[tip - 2].y:
+            count += 1
+    # detect_dynamic_gesture palm position
+    palm_pos = (hand_landmarks.landmark[0].x, hand_landmarks.landmark[0].y)
+    # update_trajectory
+    trajectory.append(np.mean([(hand_landmarks.landmark[i].x, hand_landmarks.landmark[i].y)
+                               for i in [0, 5, 17]], axis=0))
+    # match_custom_gesture
+    current = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+    for pattern in templates:
+        np.mean([np.sqrt((c[0] - p[0])**2 + (c[1] - p[1])**2 + (c[2] - p[2])**2)
+                 for c, p in zip(current, pattern)])
+    # GestureFeatures._calculate_distance
+    a, b = hand_landmarks.landmark[4], hand_landmarks.landmark[20]
+    ((a.x - b.x) ** 2 + (a.y - b.y) ** 2 + (a.z - b.z) ** 2) ** 0.5
+    return count, palm_pos
+
+
+def array_per_hand(controller: GestureController, hand_landmarks) -> None:
+    """The array implementation, converting the hand once."""
+    landmarks = landmarks_to_array(hand_landmarks)
+    controller.count_fingers(landmarks)
+    landmarks[0, :2].copy()
+    controller.update_trajectory(0, landmarks)
+    controller.match_custom_gesture(landmarks)
+    float(np.linalg.norm(landmarks[THUMB_TIP] - landmarks[PINKY_TIP]))
+
+
+def main():
+    """Run the landmark benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--templates", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    hand = to_protobuf(synthetic_hand(5, rng=rng))
+    controller = GestureController()
+    templates = []
+    for i in range(args.templates):
+        pattern = synthetic_hand(i % 6, rng=rng)
+        controller.record_custom_gesture(f"g{i}", pattern)
+        templates.append([tuple(row) for row in pattern])
+
+    trajectory = deque(maxlen=32)
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        legacy_per_hand(hand, templates, trajectory)
+    legacy = (time.perf_counter() - start) / args.iterations
+
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        array_per_hand(controller, hand)
+    vectorized = (time.perf_counter() - start) / args.iterations
+
+    print(f"{args.templates} custom templates, {args.iterations} iterations")
+    print(f"protobuf path: {legacy * 1e6:8.1f} us/hand")
+    print(f"array path:    {vectorized * 1e6:8.1f} us/hand  ({legacy / vectorized:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
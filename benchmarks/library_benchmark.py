@@ -0,0 +1,56 @@
+"""Startup cost of the persistent custom gesture library.
+
+Writes a library of N templates, then times loading it (memory-mapped and
+fully read), matching against it and appending one more template.
+
+    python -m benchmarks.library_benchmark --templates 5000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from src.gesture_library import append_template, load_templates, save_templates
+from src.gesture_templates import GestureTemplates
+
+
+def main():
+    """Run the library benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--templates", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    templates = GestureTemplates()
+    for i, hand in enumerate(rng.random((args.templates, 21, 3)).astype(np.float32)):
+        templates.add(f"gesture-{i}", hand)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gestures.gtpl")
+
+        start = time.perf_counter()
+        save_templates(templates, path)
+        print(f"save {args.templates} templates: {(time.perf_counter() - start) * 1000:.2f} ms "
+              f"({os.path.getsize(path) / 1024:.0f} KiB)")
+
+        for mmap in (True, False):
+            start = time.perf_counter()
+            loaded = load_templates(path, mmap=mmap)
+            elapsed = time.perf_counter() - start
+            print(f"load ({'mmap' if mmap else 'read'}): {elapsed * 1000:.2f} ms")
+
+        query = rng.random((21, 3)).astype(np.float32)
+        start = time.perf_counter()
+        loaded.match(query, threshold=0.2)
+        print(f"first match: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        start = time.perf_counter()
+        append_template(path, "new-gesture", query)
+        print(f"append one template: {(time.perf_counter() - start) * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Load test for the WebSocket backend's latest-frame-wins backpressure.
+
+Fake clients push synthetic frames faster than the server can process them
+and check that end-to-end latency stays bounded (frames are dropped instead
+of queued). Without ``--url`` the backend is started in-process.
+
+    python -m benchmarks.load_test --clients 4 --fps 120 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+
+import numpy as np
+import websockets
+
+from backend.protocol import (
+    CODEC_JPEG,
+    build_binary_frame,
+    encode_image,
+    parse_binary_reply,
+)
+from benchmarks.synthetic import synthetic_frame
+
+
+async def fake_client(url: str, payload: bytes, fps: float, duration: float, mode: str,
+                      response: str = "frame"):
+    """
+    Send frames at a fixed rate while reading replies concurrently.
+
+    Returns:
+        Tuple[List[float], List[float], int, int, List[int]]: Round-trip
+        latencies (ms), server-reported latencies (ms), frames sent, frames
+        dropped and reply sizes (bytes)
+    """
+    round_trips, server_latencies, reply_sizes = [], [], []
+    dropped = 0
+    sent = 0
+
+    async with websockets.connect(url, max_size=None) as ws:
+        await ws.send(json.dumps({"protocol": "binary", "response": response}))
+        await ws.recv()
+
+        async def sender():
+            nonlocal sent
+            interval = 1.0 / fps
+            start = time.perf_counter()
+            while time.perf_counter() - start < duration:
+                await ws.send(build_binary_frame(sent, time.perf_counter() * 1000, mode, payload))
+                sent += 1
+                await asyncio.sleep(max(0.0, start + sent * interval - time.perf_counter()))
+
+        async def receiver():
+            nonlocal dropped
+            async for message in ws:
+                metadata, _ = parse_binary_reply(message)
+                reply_sizes.append(len(message))
+                round_trips.append(time.perf_counter() * 1000 - metadata["timestamp"])
+                server_latencies.append(metadata["latency_ms"])
+                dropped = metadata["dropped_total"]
+
+        reading = asyncio.create_task(receiver())
+        await sender()
+        # Give the server a moment to answer the last frame it picked up
+        await asyncio.sleep(1.0)
+        reading.cancel()
+        await asyncio.gather(reading, return_exceptions=True)
+
+    return round_trips, server_latencies, sent, dropped, reply_sizes
+
+
+def serve_in_background() -> str:
+    """Start the backend with uvicorn on a free port and return its URL."""
+    import uvicorn
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config("backend.main:app", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"ws://127.0.0.1:{port}/ws"
+
+
+async def run(args) -> bool:
+    """Run all clients and print a latency report."""
+    url = args.url or serve_in_background()
+    payload = encode_image(synthetic_frame(args.width, args.height), CODEC_JPEG).tobytes()
+
+    results = await asyncio.gather(*[
+        fake_client(url, payload, args.fps, args.duration, args.mode, args.response)
+        for _ in range(args.clients)
+    ])
+
+    round_trips = np.concatenate([np.asarray(r[0]) for r in results])
+    server_latencies = np.concatenate([np.asarray(r[1]) for r in results])
+    sent = sum(r[2] for r in results)
+    dropped = sum(r[3] for r in results)
+    reply_sizes = np.concatenate([np.asarray(r[4]) for r in results])
+
+    if not len(round_trips):
+        print("No replies received")
+        return False
+
+    # Latency over the last quarter of the run shows whether lag accumulates
+    tail = round_trips[-max(1, len(round_trips) // 4):]
+    p50, p95, p99 = np.percentile(round_trips, [50, 95, 99])
+    print(f"{args.clients} clients x {args.fps} fps for {args.duration}s at {args.width}x{args.height}")
+    print(f"sent {sent}, answered {len(round_trips)}, dropped {dropped}")
+    print(f"mean reply size: {reply_sizes.mean():.0f} bytes ({args.response})")
+    print(f"effective fps per client: {len(round_trips) / args.clients / args.duration:.1f}")
+    print(f"round trip ms  p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f}  max {round_trips.max():.1f}")
+    print(f"server ms      p50 {np.percentile(server_latencies, 50):.1f}  "
+          f"p95 {np.percentile(server_latencies, 95):.1f}")
+    print(f"last-quarter round trip p95 {np.percentile(tail, 95):.1f} ms")
+
+    bounded = np.percentile(tail, 95) <= args.max_latency_ms
+    print("PASS: latency bounded" if bounded else
+          f"FAIL: latency exceeds {args.max_latency_ms} ms")
+    return bounded
+
+
+def main():
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Backend WebSocket URL (default: start one in-process)")
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--fps", type=float, default=120.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--mode", default="normal")
+    parser.add_argument("--response", choices=("frame", "landmarks"), default="frame")
+    parser.add_argument("--max-latency-ms", type=float, default=500.0)
+    args = parser.parse_args()
+
+    raise SystemExit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Motion gesture matching against 10, 100 and 1000 DTW templates.
+
+Compares scoring every template with banded DTW against the LB_Keogh
+pruned search, reports the share of templates that still needed DTW and
+how often both searches agree. Queries are recorded strokes performed again
+at another position, size and pace, with noise.
+
+    python -m benchmarks.motion_benchmark --queries 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.motion_templates import MotionTemplates, normalize_trajectory
+
+
+def random_stroke(rng) -> np.ndarray:
+    """A stroke through 3-6 random points, like a letter drawn in the air."""
+    corners = rng.uniform(0, 1, (int(rng.integers(3, 7)), 2))
+    t = np.linspace(0, len(corners) - 1, 40)
+    return np.column_stack([np.interp(t, np.arange(len(corners)), corners[:, 0]),
+                            np.interp(t, np.arange(len(corners)), corners[:, 1])])
+
+
+def perform(stroke, rng) -> np.ndarray:
+    """Redraw a stroke elsewhere, at another size and an uneven pace."""
+    kept = np.sort(rng.choice(len(stroke), 28, replace=False))
+    scale = rng.uniform(0.2, 0.4)
+    return stroke[kept] * scale + rng.uniform(0.2, 0.5, 2) + rng.normal(0, 0.003, (28, 2))
+
+
+def main():
+    """Run the motion template benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'templates':>10}{'full us':>12}{'pruned us':>12}{'DTW share':>12}{'agreement':>12}")
+    for count in (10, 100, 1000):
+        strokes = [random_stroke(rng) for _ in range(count)]
+        templates = MotionTemplates()
+        for i, stroke in enumerate(strokes):
+            templates.add(f"g{i}", stroke)
+        queries = [perform(strokes[int(rng.integers(count))], rng) for _ in range(args.queries)]
+
+        scored = []
+        dtw = templates.dtw
+
+        def counting_dtw(query, slots):
+            scored.append(len(slots))
+            return dtw(query, slots)
+
+        templates.dtw = counting_dtw
+        start = time.perf_counter()
+        pruned = [templates.match(query, args.threshold)[0] for query in queries]
+        pruned_time = (time.perf_counter() - start) / len(queries)
+        templates.dtw = dtw
+
+        start = time.perf_counter()
+        full = []
+        for query in queries:
+            costs = templates.dtw(normalize_trajectory(query), np.arange(count))
+            best = int(np.argmin(costs))
+            distance = np.sqrt(costs[best] / templates.length)
+            full.append(templates.names[best] if distance < args.threshold else None)
+        full_time = (time.perf_counter() - start) / len(queries)
+
+        share = sum(scored) / (count * len(queries))
+        agree = np.mean([a == b for a, b in zip(pruned, full)])
+        print(f"{count:>10}{full_time * 1e6:>12.1f}{pruned_time * 1e6:>12.1f}"
+              f"{share * 100:>11.1f}%{agree * 100:>11.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Prediction error and inference savings of frame skipping.
+
+Replays a landmark recording (or a synthetic one), treats skipped frames as
+unknown, and compares the constant-velocity predictions with the recorded
+landmarks. Optical flow needs images and is not covered here.
+
+    python -m benchmarks.prediction_benchmark --recording session.glr
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.replay_benchmark import synthetic_recording
+from src.prediction import FrameSkipper
+from src.recording import LandmarkReplay
+
+
+def main():
+    """Run the prediction benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="Landmark recording (default: synthetic)")
+    parser.add_argument("--frames", type=int, default=3000, help="Synthetic frames")
+    parser.add_argument("--width", type=int, default=640, help="Frame width for pixel errors")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.recording
+        if path is None:
+            path = os.path.join(tmp, "synthetic.glr")
+            synthetic_recording(path, args.frames)
+        replay = LandmarkReplay.load(path)
+
+    print(f"{'interval':>9}{'adaptive':>10}{'inferred':>10}{'err px':>9}{'p95 px':>9}{'predict us':>12}")
+    for interval in (1, 2, 3, 4, 6):
+        for adaptive in (False, True):
+            skipper = FrameSkipper(interval=interval, adaptive=adaptive)
+            inferred, errors, predict_time = 0, [], 0.0
+            for frame in replay:
+                if skipper.should_infer(frame.timestamp):
+                    skipper.observe(frame.timestamp, frame.landmarks, frame.handedness)
+                    inferred += 1
+                    continue
+                start = time.perf_counter()
+                predicted, _ = skipper.predict(frame.timestamp)
+                predict_time += time.perf_counter() - start
+                if len(predicted) == len(frame.landmarks) and len(predicted):
+                    error = np.linalg.norm(predicted[..., :2] - frame.landmarks[..., :2], axis=-1)
+                    errors.append(error.mean() * args.width)
+            skipped = len(replay) - inferred
+            err = f"{np.mean(errors):9.2f}{np.percentile(errors, 95):9.2f}" if errors else f"{'-':>9}{'-':>9}"
+            per_predict = predict_time / skipped * 1e6 if skipped else 0.0
+            print(f"{interval:>9}{str(adaptive):>10}{inferred / len(replay) * 100:>9.1f}%{err}"
+                  f"{per_predict:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
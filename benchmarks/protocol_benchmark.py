@@ -0,0 +1,86 @@
+"""Compare the JSON/base64 and binary WebSocket protocols.
+
+Measures bytes per frame in each direction and the server CPU time spent
+parsing, decoding, re-encoding and packing a reply (inference excluded).
+
+    python -m benchmarks.protocol_benchmark --frames 200
+"""
+
+import argparse
+import base64
+import json
+import time
+
+from benchmarks.synthetic import synthetic_frame
+from backend.protocol import (
+    CODEC_JPEG,
+    build_binary_frame,
+    build_binary_reply,
+    build_json_reply,
+    decode_image,
+    encode_image,
+    parse_binary_frame,
+    parse_json_frame,
+)
+
+
+def bench_json(jpeg: bytes, frames: int):
+    """Time the legacy JSON protocol round trip on the server side."""
+    message = json.dumps({
+        "image": "data:image/jpeg;base64," + base64.b64encode(jpeg).decode(),
+        "mode": "normal",
+    })
+    reply_size = 0
+    start = time.process_time()
+    for _ in range(frames):
+        header, image_bytes = parse_json_frame(json.loads(message))
+        decoded = decode_image(image_bytes, header["codec"])
+        buffer = encode_image(decoded, header["codec"])
+        reply = json.dumps(build_json_reply({"gestures": []}, buffer))
+        reply_size = len(reply)
+    elapsed = time.process_time() - start
+    return len(message), reply_size, elapsed / frames
+
+
+def bench_binary(jpeg: bytes, frames: int):
+    """Time the binary protocol round trip on the server side."""
+    message = build_binary_frame(1, time.time() * 1000, "normal", jpeg, CODEC_JPEG)
+    reply_size = 0
+    start = time.process_time()
+    for _ in range(frames):
+        header, image_bytes = parse_binary_frame(message)
+        decoded = decode_image(image_bytes, header["codec"])
+        buffer = encode_image(decoded, header["codec"])
+        reply = build_binary_reply(header, {"gestures": []}, buffer, header["codec"])
+        reply_size = len(reply)
+    elapsed = time.process_time() - start
+    return len(message), reply_size, elapsed / frames
+
+
+def main():
+    """Run the protocol benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    frame = synthetic_frame(args.width, args.height)
+    jpeg = encode_image(frame, CODEC_JPEG).tobytes()
+
+    print(f"Frame {args.width}x{args.height}, JPEG payload {len(jpeg)} bytes")
+    print(f"{'protocol':<10}{'in bytes':>12}{'out bytes':>12}{'cpu ms/frame':>15}")
+    results = {}
+    for name, bench in (("json", bench_json), ("binary", bench_binary)):
+        results[name] = bench(jpeg, args.frames)
+        size_in, size_out, cpu = results[name]
+        print(f"{name:<10}{size_in:>12}{size_out:>12}{cpu * 1000:>15.3f}")
+
+    json_in, json_out, json_cpu = results["json"]
+    bin_in, bin_out, bin_cpu = results["binary"]
+    print(f"\nBinary saves {100 * (1 - (bin_in + bin_out) / (json_in + json_out)):.1f}% "
+          f"of bytes and {100 * (1 - bin_cpu / json_cpu):.1f}% of protocol CPU time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Post-inference gesture pipeline throughput on replayed landmarks.
+
+Replays a landmark recording (or a synthetic one: two hands drifting across
+the frame through every finger count) through the gesture logic without
+MediaPipe, with a set of custom gesture templates loaded.
+
+    python -m benchmarks.replay_benchmark --frames 5000
+    python -m benchmarks.replay_benchmark --recording session.glr
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_hand
+from src.gesture_control import GestureController
+from src.recording import LandmarkRecorder, LandmarkReplay
+
+
+def synthetic_recording(path: str, frames: int, fps: float = 30.0) -> None:
+    """Write a recording of two moving hands."""
+    rng = np.random.default_rng(0)
+    with LandmarkRecorder(path) as recorder:
+        for i in range(frames):
+            phase = i / fps
+            hands = np.stack([
+                synthetic_hand((i // 15) % 6, center=(0.3 + 0.2 * np.sin(phase), 0.6), rng=rng),
+                synthetic_hand((i // 20) % 6, center=(0.7, 0.5 + 0.2 * np.cos(phase)), rng=rng),
+            ])
+            recorder.write(phase, hands, [("Left", 0.95), ("Right", 0.95)])
+
+
+def main():
+    """Run the replay benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="Landmark recording (default: synthetic)")
+    parser.add_argument("--frames", type=int, default=5000, help="Synthetic frames")
+    parser.add_argument("--templates", type=int, default=20, help="Custom gestures loaded")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.recording
+        if path is None:
+            path = os.path.join(tmp, "synthetic.glr")
+            synthetic_recording(path, args.frames)
+        start = time.perf_counter()
+        replay = LandmarkReplay.load(path)
+        load_time = time.perf_counter() - start
+
+    controller = GestureController()
+    rng = np.random.default_rng(1)
+    for i in range(args.templates):
+        controller.record_custom_gesture(f"g{i}", synthetic_hand(i % 6, rng=rng))
+
+    gestures = 0
+    start = time.perf_counter()
+    for analysis in replay.replay(controller):
+        gestures += len(analysis["gestures"])
+    elapsed = time.perf_counter() - start
+    controller.close()
+
+    hands = sum(len(frame.landmarks) for frame in replay)
+    print(f"Loaded {len(replay)} frames ({hands} hands, {replay.duration:.1f}s) "
+          f"in {load_time * 1000:.1f} ms")
+    print(f"Replayed in {elapsed:.2f}s: {len(replay) / elapsed:.0f} frames/s, "
+          f"{elapsed / len(replay) * 1e6:.1f} us/frame, {gestures} gestures")
+
+
+if __name__ == "__main__":
+    main()
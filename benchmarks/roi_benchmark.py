@@ -0,0 +1,98 @@
+"""Accuracy vs. latency of inference downscaling and hand cropping.
+
+Replays a recorded clip (video file or frame directory) through the
+controller at several inference sizes, with and without hand-ROI cropping,
+and compares landmarks against full-resolution inference on every frame.
+Without ``--video`` synthetic 1080p frames are used, which contain no hands
+and therefore only measure latency.
+
+    python -m benchmarks.roi_benchmark --video recordings/session.mp4 --frames 300
+"""
+
+import argparse
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_frame
+from src.batch import iter_frames
+from src.gesture_control import GestureController
+from src.roi import InferenceInput
+
+CONFIGS = [
+    ("full", None),
+    ("640", dict(max_side=640, crop=False)),
+    ("480", dict(max_side=480, crop=False)),
+    ("320", dict(max_side=320, crop=False)),
+    ("640+roi", dict(max_side=640, crop=True)),
+    ("320+roi", dict(max_side=320, crop=True)),
+    ("256+roi", dict(max_side=256, crop=True)),
+]
+
+
+def run(frames: List[np.ndarray], options: Optional[dict], redetect: int):
+    """Per-frame latencies (s) and landmarks for one configuration."""
+    inference_input = InferenceInput(redetect_interval=redetect, **options) if options else None
+    controller = GestureController(inference_input=inference_input)
+    controller.analyze_frame(frames[0])  # Load the graph before timing
+    controller.hands.reset()
+    if inference_input is not None:
+        inference_input.reset()
+
+    latencies, landmarks = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        analysis = controller.analyze_frame(frame)
+        latencies.append(time.perf_counter() - start)
+        landmarks.append(analysis["landmarks"].copy())
+    controller.close()
+    return np.array(latencies), landmarks
+
+
+def landmark_error(reference: np.ndarray, hands: np.ndarray, shape) -> Optional[float]:
+    """Mean landmark distance in pixels, matching hands by wrist position."""
+    if not len(reference) or not len(hands):
+        return None
+    scale = np.array([shape[1], shape[0]])
+    errors = []
+    for hand in reference:
+        nearest = hands[np.argmin(np.linalg.norm(hands[:, 0, :2] - hand[0, :2], axis=1))]
+        errors.append(np.linalg.norm((nearest[:, :2] - hand[:, :2]) * scale, axis=1).mean())
+    return float(np.mean(errors))
+
+
+def main():
+    """Run the ROI benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--video", help="Video file or frame directory")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--redetect", type=int, default=10, help="Full-frame detection interval")
+    args = parser.parse_args()
+
+    if args.video:
+        frames = [frame for index, _, frame in iter_frames(args.video) if index < args.frames]
+    else:
+        frames = [synthetic_frame(1920, 1080, seed=i % 8) for i in range(args.frames)]
+    shape = frames[0].shape
+    print(f"{len(frames)} frames at {shape[1]}x{shape[0]}")
+
+    baseline = None
+    print(f"{'config':>10}{'p50 ms':>9}{'p95 ms':>9}{'speedup':>9}{'detected':>10}"
+          f"{'agree':>8}{'err px':>8}")
+    for name, options in CONFIGS:
+        latencies, landmarks = run(frames, options, args.redetect)
+        if baseline is None:
+            baseline = (latencies, landmarks)
+        detected = np.mean([len(hands) > 0 for hands in landmarks])
+        agree = np.mean([len(a) == len(b) for a, b in zip(baseline[1], landmarks)])
+        errors = [landmark_error(a, b, shape) for a, b in zip(baseline[1], landmarks)]
+        errors = [e for e in errors if e is not None]
+        error = f"{np.mean(errors):8.2f}" if errors else f"{'-':>8}"
+        speedup = np.median(baseline[0]) / np.median(latencies)
+        print(f"{name:>10}{np.median(latencies) * 1000:>9.2f}{np.percentile(latencies, 95) * 1000:>9.2f}"
+              f"{speedup:>8.2f}x{detected * 100:>9.1f}%{agree * 100:>7.1f}%{error}")
+
+
+if __name__ == "__main__":
+    main()
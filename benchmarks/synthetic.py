@@ -0,0 +1,74 @@
+"""Synthetic frames and hand landmarks for benchmarks."""
+
+import cv2
+import numpy as np
+
+# Finger base (MCP) x offsets and joint heights, in hand units (y points down)
+_FINGER_BASES = (-0.12, 0.0, 0.12, 0.22)
+_UP_JOINTS = (-0.4, -0.6, -0.7, -0.8)
+_DOWN_JOINTS = (-0.4, -0.55, -0.45, -0.4)
+
+
+def synthetic_frame(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """Build a camera-like test frame (gradient, shapes and sensor noise)."""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    frame = np.dstack([x + 0 * y, y + 0 * x, (x + y) / 2]).astype(np.uint8)
+    for _ in range(8):
+        center = (int(rng.integers(width)), int(rng.integers(height)))
+        color = tuple(int(c) for c in rng.integers(0, 255, 3))
+        cv2.circle(frame, center, int(rng.integers(20, height // 4)), color, -1)
+    noise = rng.integers(-8, 8, frame.shape, dtype=np.int16)
+    return np.clip(frame.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def synthetic_hand(fingers_up: int = 5, center=(0.5, 0.6), scale: float = 0.3,
+                   rng=None) -> np.ndarray:
+    """
+    Build a plausible (21, 3) hand with the first ``fingers_up`` fingers raised.
+
+    Fingers are raised thumb first. ``rng`` adds small landmark jitter.
+    """
+    hand = np.zeros((21, 3), dtype=np.float32)
+    thumb_up = fingers_up >= 1
+    hand[1:5, :2] = [(-0.15, -0.1), (-0.25, -0.2), (-0.32, -0.28),
+                     (-0.4, -0.35) if thumb_up else (-0.2, -0.3)]
+    for finger, base_x in enumerate(_FINGER_BASES):
+        joints = _UP_JOINTS if finger + 1 < fingers_up else _DOWN_JOINTS
+        start = 5 + 4 * finger
+        hand[start:start + 4, 0] = base_x
+        hand[start:start + 4, 1] = joints
+    hand[:, 2] = -0.02 * np.arange(21) / 20
+    hand[:, :2] = hand[:, :2] * scale + center
+    if rng is not None:
+        hand += rng.normal(0, 0.002, hand.shape).astype(np.float32)
+    return hand
+
+
+def hand_at(x: float, y: float, size: float = 0.0, seed: int = 0) -> np.ndarray:
+    """
+    Build a (21, 3) hand whose landmarks span a ``size`` box at (x, y).
+
+    The wrist sits at (x, y) and the thumb base at the opposite corner; the
+    rest are spread randomly inside the box. ``size=0`` puts every landmark
+    on (x, y).
+    """
+    rng = np.random.default_rng(seed)
+    hand = np.empty((21, 3), dtype=np.float32)
+    hand[:, 0] = x + rng.uniform(0, size, 21)
+    hand[:, 1] = y + rng.uniform(0, size, 21)
+    hand[:, 2] = rng.uniform(-size / 2, size / 2, 21)
+    hand[0, :2] = (x, y)
+    hand[1, :2] = (x + size, y + size)
+    return hand
+
+
+def to_protobuf(hand: np.ndarray):
+    """Wrap a (21, 3) array in a MediaPipe ``NormalizedLandmarkList``."""
+    from mediapipe.framework.formats import landmark_pb2
+
+    hand_landmarks = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in hand:
+        hand_landmarks.landmark.add(x=float(x), y=float(y), z=float(z))
+    return hand_landmarks
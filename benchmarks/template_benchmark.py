@@ -0,0 +1,84 @@
+"""Custom gesture matching against 10, 100 and 1000 templates.
+
+Compares the original per-template Python loop with the vectorised
+template array (exact) and the PCA index, and reports how often the index
+picks the same template as the exact search.
+
+    python -m benchmarks.template_benchmark --queries 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_hand
+from src.gesture_templates import GestureTemplates
+
+
+def legacy_match(patterns, landmarks, threshold: float):
+    """The original dict-of-tuples matcher."""
+    current = [tuple(row) for row in landmarks]
+    best_match, min_distance = None, float("inf")
+    for name, pattern in patterns.items():
+        distance = np.mean([np.sqrt(
+            (c[0] - p[0])**2 + (c[1] - p[1])**2 + (c[2] - p[2])**2
+        ) for c, p in zip(current, pattern)])
+        if distance < threshold and distance < min_distance:
+            min_distance, best_match = distance, name
+    return best_match
+
+
+def random_hand(rng) -> np.ndarray:
+    """A synthetic hand at a random pose, position, size and roll."""
+    hand = synthetic_hand(int(rng.integers(6)), center=rng.uniform(0.3, 0.7, 2),
+                          scale=rng.uniform(0.15, 0.35), rng=rng)
+    hand += rng.normal(0, 0.01, hand.shape).astype(np.float32)
+    angle = rng.uniform(-0.5, 0.5)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    hand[:, :2] = (hand[:, :2] - hand[0, :2]) @ rotation.T + hand[0, :2]
+    return hand
+
+
+def time_per_query(func, queries) -> float:
+    """Mean seconds per call of ``func`` over ``queries``."""
+    start = time.perf_counter()
+    for query in queries:
+        func(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    """Run the template matching benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    queries = [random_hand(rng) for _ in range(args.queries)]
+
+    print(f"{'templates':>10}{'legacy us':>12}{'exact us':>12}{'index us':>12}{'agreement':>12}")
+    for count in (10, 100, 1000):
+        hands = [random_hand(rng) for _ in range(count)]
+        legacy = {f"g{i}": [tuple(row) for row in hand] for i, hand in enumerate(hands)}
+
+        exact = GestureTemplates(index_threshold=count + 1)
+        indexed = GestureTemplates(index_threshold=1)
+        for i, hand in enumerate(hands):
+            exact.add(f"g{i}", hand)
+            indexed.add(f"g{i}", hand)
+
+        legacy_time = time_per_query(lambda q: legacy_match(legacy, q, args.threshold),
+                                     queries[:max(10, args.queries // 10)])
+        exact_time = time_per_query(lambda q: exact.match(q, args.threshold), queries)
+        index_time = time_per_query(lambda q: indexed.match(q, args.threshold), queries)
+
+        agree = np.mean([exact.match(q, args.threshold)[0] == indexed.match(q, args.threshold)[0]
+                         for q in queries])
+        print(f"{count:>10}{legacy_time * 1e6:>12.1f}{exact_time * 1e6:>12.1f}"
+              f"{index_time * 1e6:>12.1f}{agree * 100:>11.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Per-update cost of volume changes: process spawning vs. persistent channels.
+
+Times the old ``os.system`` call per change against the persistent
+``amixer --stdin`` pipe, OSC over UDP, and what the frame loop pays when
+changes go through the action dispatcher. Without ``amixer`` the spawn and
+pipe rows fall back to ``true`` and ``cat``, which show the process and
+pipe overhead alone.
+
+    python -m benchmarks.volume_benchmark --updates 200
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import time
+
+from src.actions import ActionDispatcher, RecordingBackend
+from src.volume import AmixerVolume, OscVolume
+
+
+def per_update(set_volume, updates: int) -> float:
+    """Mean seconds per call of ``set_volume`` over levels 0-100."""
+    start = time.perf_counter()
+    for i in range(updates):
+        set_volume(i % 101)
+    return (time.perf_counter() - start) / updates
+
+
+def main():
+    """Run the volume benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+
+    amixer = shutil.which("amixer") is not None
+    spawn = "amixer -q sset Master {}%" if amixer else "true {}"
+    pipe = ("amixer", "-q", "--stdin") if amixer else ("cat",)
+
+    rows = [(f"os.system({spawn.split()[0]})",
+             per_update(lambda level: os.system(spawn.format(level)), args.updates))]
+
+    channel = AmixerVolume(command=pipe)
+    rows.append((f"persistent {pipe[0]} pipe", per_update(channel.set, args.updates)))
+    channel.close()
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    osc = OscVolume("127.0.0.1", receiver.getsockname()[1])
+    rows.append(("OSC over UDP", per_update(osc.set, args.updates)))
+    osc.close()
+    receiver.close()
+
+    dispatcher = ActionDispatcher(RecordingBackend())
+    rows.append(("dispatcher submit", per_update(dispatcher.set_volume, args.updates)))
+    dispatcher.close()
+
+    baseline = rows[0][1]
+    print(f"{args.updates} updates per backend")
+    for name, seconds in rows:
+        print(f"{name:<26}{seconds * 1e6:10.1f} us/update  ({baseline / seconds:8.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,8 @@ def main():
     
     print("Advanced Gesture Control Demo with Features")
     print("\nControl Modes:")
-    print("1. Normal Mode (5 fingers)")
-    print("   - Open Palm: Spotlight search")
+    print("1. Normal Mode (Open Palm)")
+    print("   - 1 Finger: Spotlight search")
     print("   - Closed Fist: Close window")
     print("   - 2 Fingers: App switcher")
     print("   - 3 Fingers: Minimize window")
@@ -27,7 +27,7 @@ def main():
     print("   - Move index finger: Move cursor")
     print("   - Pinch (thumb + index): Click")
     
-    print("\n3. Volume Control Mode (Victory gesture)")
+    print("\n3. Volume Control Mode (Victory gesture, needs a trained classifier)")
     print("   - Thumb-pinky distance controls volume")
     
     print("\n4. Drawing Mode (ILY gesture)")
@@ -39,15 +39,19 @@ def main():
     print("- Press 'q' to quit")
     print("- Press 'm' to cycle through modes")
     
+    frame = None
     try:
         while cap.isOpened():
-            success, frame = cap.read()
+            # Capture into the previous frame's buffer
+            success, frame = cap.read(frame)
             if not success:
                 print("Failed to read from webcam.")
                 break
             
-            # Process frame and detect gestures
-            gestures, annotated_frame = controller.process_frame(frame)
+            # Process frame and detect gestures (inference runs once)
+            analysis = controller.analyze_frame(frame)
+            annotated_frame = controller.annotate_frame(analysis)
+            gestures = analysis["gestures"]
             
             # Handle keyboard input
             key = cv2.waitKey(1) & 0xFF
@@ -69,20 +73,17 @@ def main():
                 # Check for mode switch gestures
                 features.handle_mode_switch(gestures[0])
                 
-                # Process gestures based on current mode
-                results = controller.hands.process(
-                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                )
-                
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
+                # Process gestures based on current mode, reusing this
+                # frame's landmarks (in the flipped frame's coordinates)
+                if len(analysis["landmarks"]):
+                    hand_landmarks = analysis["landmarks"][0]
                     
                     if features.current_mode == "normal":
                         features.handle_shortcuts(gestures[0])
                     elif features.current_mode == "mouse":
                         features.handle_mouse_control(
                             hand_landmarks,
-                            (frame.shape[1], frame.shape[0])
+                            frame.shape[:2]
                         )
                     elif features.current_mode == "volume":
                         features.handle_volume_control(hand_landmarks)
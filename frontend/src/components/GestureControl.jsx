@@ -22,6 +22,7 @@ const GestureControl = () => {
   const [isRecording, setIsRecording] = useState(false);
   const toast = useToast();
   const socketRef = useRef(null);
+  const modeRef = useRef('normal');
 
   useEffect(() => {
     // Connect to Python backend
@@ -49,7 +50,16 @@ const GestureControl = () => {
       });
     });
 
+    // Stream webcam frames; the server only replies when the gesture changes
+    const frameTimer = setInterval(() => {
+      const image = webcamRef.current?.getScreenshot();
+      if (image && socketRef.current?.connected) {
+        socketRef.current.emit('frame', { image, mode: modeRef.current });
+      }
+    }, 100);
+
     return () => {
+      clearInterval(frameTimer);
       if (socketRef.current) {
         socketRef.current.disconnect();
       }
@@ -58,6 +68,7 @@ const GestureControl = () => {
 
   const handleModeChange = (newMode) => {
     setMode(newMode);
+    modeRef.current = newMode;
     socketRef.current?.emit('change_mode', { mode: newMode });
   };
 
@@ -85,6 +96,7 @@ const GestureControl = () => {
           <Webcam
             ref={webcamRef}
             mirrored
+            screenshotFormat="image/jpeg"
             style={{ width: '100%', borderRadius: '8px' }}
           />
         </Box>
@@ -135,7 +147,7 @@ const GestureControl = () => {
           </Heading>
           {mode === 'normal' && (
             <VStack align="stretch" spacing={2}>
-              <Text>• Open Palm: Spotlight search</Text>
+              <Text>• 1 Finger: Spotlight search</Text>
               <Text>• Closed Fist: Close window</Text>
               <Text>• 2 Fingers: App switcher</Text>
               <Text>• 3 Fingers: Minimize window</Text>
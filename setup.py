@@ -13,6 +13,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "pytest-benchmark>=4.0.0",
         ],
     },
     author="Shreyash Danke",
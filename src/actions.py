@@ -0,0 +1,382 @@
+"""Non-blocking dispatch of mouse, keyboard and volume actions."""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from src.volume import VolumeBackend
+
+
+class ActionBackend:
+    """Performs OS actions; subclasses talk to a real desktop or record calls."""
+
+    def screen_size(self) -> Tuple[int, int]:
+        """Screen width and height in pixels."""
+        raise NotImplementedError
+
+    def move(self, x: int, y: int) -> None:
+        """Move the cursor to (x, y)."""
+        raise NotImplementedError
+
+    def click(self) -> None:
+        """Click the primary mouse button."""
+        raise NotImplementedError
+
+    def hotkey(self, *keys: str) -> None:
+        """Press a key combination."""
+        raise NotImplementedError
+
+    def set_volume(self, level: int) -> None:
+        """Set the output volume (0-100)."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release OS resources held by the backend."""
+
+
+class DesktopBackend(ActionBackend):
+    """
+    Real desktop actions: pyautogui for input, a :class:`VolumeBackend` for volume.
+
+    pyautogui is imported when the backend is created, so nothing needs a
+    display until an action is actually dispatched.
+    """
+
+    def __init__(self, volume: Optional[VolumeBackend] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            volume (Optional[VolumeBackend]): Volume backend (chosen by
+                ``GESTURE_VOLUME`` when omitted)
+        """
+        import pyautogui
+
+        self._gui = pyautogui
+        self.volume = volume if volume is not None else VolumeBackend.from_env()
+        pyautogui.FAILSAFE = False
+        pyautogui.PAUSE = 0  # The dispatcher paces actions, not pyautogui
+
+    def screen_size(self) -> Tuple[int, int]:
+        width, height = self._gui.size()
+        return int(width), int(height)
+
+    def move(self, x: int, y: int) -> None:
+        self._gui.moveTo(x, y)
+
+    def click(self) -> None:
+        self._gui.click()
+
+    def hotkey(self, *keys: str) -> None:
+        self._gui.hotkey(*keys)
+
+    def set_volume(self, level: int) -> None:
+        self.volume.set(level)
+
+    def close(self) -> None:
+        self.volume.close()
+
+
+class RecordingBackend(ActionBackend):
+    """
+    Records actions instead of performing them (for tests and dry runs).
+
+    Attributes:
+        calls (List[Tuple]): ``(action, *args)`` in execution order
+    """
+
+    def __init__(self, size: Tuple[int, int] = (1920, 1080), delay: float = 0.0):
+        """
+        Initialize the fake backend.
+
+        Args:
+            size (Tuple[int, int]): Reported screen size
+            delay (float): Seconds every action takes (to mimic slow OS calls)
+        """
+        self.size = size
+        self.delay = delay
+        self.calls: List[Tuple] = []
+
+    def _record(self, *call) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        self.calls.append(call)
+
+    def screen_size(self) -> Tuple[int, int]:
+        return self.size
+
+    def move(self, x: int, y: int) -> None:
+        self._record("move", x, y)
+
+    def click(self) -> None:
+        self._record("click")
+
+    def hotkey(self, *keys: str) -> None:
+        self._record("hotkey", *keys)
+
+    def set_volume(self, level: int) -> None:
+        self._record("volume", level)
+
+
+class ActionDispatcher:
+    """
+    Runs OS actions on a background thread so the frame loop never waits.
+
+    Cursor moves and volume changes are coalesced: only the newest pending
+    target is performed, and volume is applied at most once per
+    ``volume_interval``. Discrete actions (clicks, hotkeys) go through a
+    bounded queue; when it is full new ones are dropped. Each discrete
+    action is debounced (a gesture held over many frames fires once, and
+    fires again only after it has not been requested for ``debounce``
+    seconds), and hotkeys are rate-limited to one per ``hotkey_interval``.
+    """
+
+    def __init__(self, backend: Optional[ActionBackend] = None, max_pending: int = 16,
+                 debounce: float = 0.5, hotkey_interval: float = 1.0,
+                 volume_interval: float = 0.05, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the dispatcher; the worker thread starts on first use.
+
+        Args:
+            backend (Optional[ActionBackend]): Action backend (a
+                :class:`DesktopBackend` is created on first use when omitted)
+            max_pending (int): Discrete actions queued before new ones are dropped
+            debounce (float): Seconds a repeated action must pause to fire again
+            hotkey_interval (float): Minimum seconds between two hotkeys
+            volume_interval (float): Minimum seconds between two volume changes
+            clock (Callable[[], float]): Time source
+        """
+        self._backend = backend
+        self.max_pending = max_pending
+        self.debounce = debounce
+        self.hotkey_interval = hotkey_interval
+        self.volume_interval = volume_interval
+        self.clock = clock
+
+        self._cond = threading.Condition()
+        self._move: Optional[Tuple[int, int]] = None
+        self._volume: Optional[int] = None
+        self._queue: Deque[Tuple[str, Tuple[Any, ...]]] = deque()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._last_request: Dict[Hashable, float] = {}
+        self._last_hotkey = float("-inf")
+        self._last_volume = float("-inf")
+
+        self.submitted = 0
+        self.coalesced = 0
+        self.suppressed = 0
+        self.dropped = 0
+        self.executed = 0
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+
+    @classmethod
+    def from_env(cls, backend: Optional[ActionBackend] = None) -> "ActionDispatcher":
+        """
+        Create a dispatcher configured by ``GESTURE_ACTION_DEBOUNCE``,
+        ``GESTURE_HOTKEY_INTERVAL`` and ``GESTURE_VOLUME_INTERVAL`` (seconds).
+
+        Args:
+            backend (Optional[ActionBackend]): Action backend
+
+        Returns:
+            ActionDispatcher: Configured dispatcher
+        """
+        return cls(
+            backend,
+            debounce=float(os.environ.get("GESTURE_ACTION_DEBOUNCE", 0.5)),
+            hotkey_interval=float(os.environ.get("GESTURE_HOTKEY_INTERVAL", 1.0)),
+            volume_interval=float(os.environ.get("GESTURE_VOLUME_INTERVAL", 0.05)),
+        )
+
+    @property
+    def backend(self) -> ActionBackend:
+        """The action backend (created on first access when not given)."""
+        if self._backend is None:
+            self._backend = DesktopBackend()
+        return self._backend
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Snapshot of dispatch counters.
+
+        Returns:
+            Dict[str, int]: Actions submitted, coalesced away, suppressed by
+            debouncing or rate limiting, dropped on a full queue, executed,
+            and failed
+        """
+        with self._cond:
+            return {
+                "submitted": self.submitted,
+                "coalesced": self.coalesced,
+                "suppressed": self.suppressed,
+                "dropped": self.dropped,
+                "executed": self.executed,
+                "errors": self.errors,
+            }
+
+    def _start(self) -> None:
+        # Called with the lock held
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="gesture-actions", daemon=True)
+            self._thread.start()
+
+    def move(self, x: int, y: int) -> None:
+        """
+        Move the cursor, replacing any move still pending.
+
+        Args:
+            x (int): Screen x in pixels
+            y (int): Screen y in pixels
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self.submitted += 1
+            if self._move is not None:
+                self.coalesced += 1
+            self._move = (int(x), int(y))
+            self._start()
+            self._cond.notify()
+
+    def set_volume(self, level: int) -> None:
+        """
+        Set the output volume, replacing any change still pending.
+
+        Args:
+            level (int): Volume (0-100)
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self.submitted += 1
+            if self._volume is not None:
+                self.coalesced += 1
+            self._volume = int(level)
+            self._start()
+            self._cond.notify()
+
+    def click(self) -> bool:
+        """
+        Click once per debounced request.
+
+        Returns:
+            bool: True if the click was queued
+        """
+        return self._submit("click", ())
+
+    def hotkey(self, *keys: str) -> bool:
+        """
+        Press a key combination, debounced and rate-limited.
+
+        Args:
+            *keys (str): Keys, as understood by the backend
+
+        Returns:
+            bool: True if the hotkey was queued
+        """
+        return self._submit("hotkey", keys)
+
+    def _submit(self, action: str, args: Tuple[Any, ...]) -> bool:
+        key = (action, args)
+        now = self.clock()
+        with self._cond:
+            if self._closed:
+                return False
+            self.submitted += 1
+            last = self._last_request.get(key)
+            if last is not None and now - last < self.debounce:
+                # Still held since it last fired
+                self._last_request[key] = now
+                self.suppressed += 1
+                return False
+            if action == "hotkey" and now - self._last_hotkey < self.hotkey_interval:
+                # Not recorded as requested, so it fires once the interval passes
+                self.suppressed += 1
+                return False
+            if len(self._queue) >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._last_request[key] = now
+            if action == "hotkey":
+                self._last_hotkey = now
+            self._queue.append((action, args))
+            self._start()
+            self._cond.notify()
+            return True
+
+    def _next(self) -> Tuple[Optional[Tuple[str, Tuple[Any, ...]]], Optional[float]]:
+        # Called with the lock held; discrete actions keep their order.
+        # Returns the action to perform, or None and how long to wait.
+        if self._queue:
+            return self._queue.popleft(), None
+        if self._move is not None:
+            move, self._move = self._move, None
+            return ("move", move), None
+        if self._volume is not None:
+            now = self.clock()
+            due = self._last_volume + self.volume_interval
+            if now < due and not self._closed:
+                return None, due - now
+            volume, self._volume = self._volume, None
+            self._last_volume = now
+            return ("set_volume", (volume,)), None
+        return None, None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                action, delay = self._next()
+                while action is None and not self._closed:
+                    self._cond.wait(delay)
+                    action, delay = self._next()
+                if action is None:
+                    return
+                self._busy = True
+            name, args = action
+            try:
+                getattr(self.backend, name)(*args)
+                with self._cond:
+                    self.executed += 1
+            except Exception as error:  # An OS hiccup must not kill the worker
+                with self._cond:
+                    self.errors += 1
+                    self.last_error = error
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every pending action has been performed.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait
+
+        Returns:
+            bool: True if the dispatcher is idle
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not (self._busy or self._queue or self._move or self._volume is not None),
+                timeout,
+            )
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Stop accepting actions, finish pending ones and stop the worker.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the worker
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        if self._backend is not None:
+            self._backend.close()
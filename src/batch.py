@@ -0,0 +1,420 @@
+"""Offline batch gesture detection over recorded videos and frame directories.
+
+Each input (a video file or a directory of images) is processed by one
+worker process that owns a single MediaPipe graph. Frames are decoded on a
+reader thread that prefetches ahead of inference. Results are written as
+columnar ``.npz`` files, one per input::
+
+    frame       int64   (N,)               source frame index
+    timestamp   float64 (N,)               seconds from the start of the input
+    num_hands   uint8   (N,)
+    landmarks   float32 (N, hands, 21, 3)  NaN where no hand was detected
+    handedness  int8    (N, hands)         0 = Left, 1 = Right, -1 = none
+    gestures    str     (N,)               detected gestures joined by ";"
+
+Progress is checkpointed every ``chunk_size`` frames, so an interrupted run
+picks up where it stopped.
+
+    python -m src.batch recordings/*.mp4 --output results/ --workers 4
+"""
+
+import argparse
+import glob
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from src.gesture_control import GestureController
+from src.landmarks import NUM_LANDMARKS
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+HANDEDNESS_CODES = {"Left": 0, "Right": 1}
+
+# One MediaPipe graph per worker process, created by the pool initializer
+_worker_hands = None
+
+
+def _list_images(directory: str) -> List[str]:
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+
+
+def iter_frames(source: str, start: int = 0,
+                fps: float = 30.0) -> Iterator[Tuple[int, float, np.ndarray]]:
+    """
+    Decode frames from a video file or a directory of images.
+
+    Args:
+        source (str): Video path or image directory
+        start (int): Index of the first frame to yield
+        fps (float): Frame rate of image directories (videos use their own)
+
+    Yields:
+        Tuple[int, float, np.ndarray]: Frame index, timestamp (s) and BGR frame
+    """
+    if os.path.isdir(source):
+        for index, path in enumerate(_list_images(source)[start:], start):
+            frame = cv2.imread(path, cv2.IMREAD_COLOR)
+            if frame is not None:
+                yield index, index / fps, frame
+        return
+
+    capture = cv2.VideoCapture(source)
+    if not capture.isOpened():
+        raise IOError(f"Cannot open video {source}")
+    try:
+        fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        if start:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, start)
+        index = start
+        while True:
+            success, frame = capture.read()
+            if not success:
+                break
+            yield index, index / fps, frame
+            index += 1
+    finally:
+        capture.release()
+
+
+class PrefetchReader:
+    """Decode frames on a background thread into a bounded queue."""
+
+    _END = object()
+
+    def __init__(self, source: str, start: int = 0, prefetch: int = 32, fps: float = 30.0):
+        """
+        Start reading.
+
+        Args:
+            source (str): Video path or image directory
+            start (int): Index of the first frame to read
+            prefetch (int): Maximum number of decoded frames held in memory
+            fps (float): Frame rate of image directories
+        """
+        self._queue = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._read, args=(source, start, fps), name="frame-reader", daemon=True
+        )
+        self._thread.start()
+
+    def _read(self, source: str, start: int, fps: float) -> None:
+        try:
+            for item in iter_frames(source, start, fps):
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if self._stop.is_set():
+                    return
+        except BaseException as e:  # Re-raised on the consumer side
+            self._error = e
+        finally:
+            self._queue.put(self._END)
+
+    def __iter__(self) -> Iterator[Tuple[int, float, np.ndarray]]:
+        while True:
+            item = self._queue.get()
+            if item is self._END:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
+
+    def close(self) -> None:
+        """Stop the reader thread."""
+        self._stop.set()
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+class ColumnBuffer:
+    """Accumulates per-frame results as columns."""
+
+    def __init__(self, max_hands: int):
+        """
+        Initialize empty columns.
+
+        Args:
+            max_hands (int): Number of hand slots per frame
+        """
+        self.max_hands = max_hands
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def clear(self) -> None:
+        """Drop all buffered rows."""
+        self.frame: List[int] = []
+        self.timestamp: List[float] = []
+        self.landmarks: List[np.ndarray] = []
+        self.handedness: List[np.ndarray] = []
+        self.gestures: List[str] = []
+
+    def append(self, index: int, timestamp: float, analysis: Dict[str, Any]) -> None:
+        """
+        Add one analysed frame.
+
+        Args:
+            index (int): Frame index
+            timestamp (float): Frame timestamp in seconds
+            analysis (Dict[str, Any]): Result of ``GestureController.analyze_frame``
+        """
+        landmarks = np.full((self.max_hands, NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+        handedness = np.full(self.max_hands, -1, dtype=np.int8)
+        count = min(len(analysis["landmarks"]), self.max_hands)
+        landmarks[:count] = analysis["landmarks"][:count]
+        for slot, (label, _) in enumerate(analysis["handedness"][:count]):
+            handedness[slot] = HANDEDNESS_CODES.get(label, -1)
+
+        self.frame.append(index)
+        self.timestamp.append(timestamp)
+        self.landmarks.append(landmarks)
+        self.handedness.append(handedness)
+        self.gestures.append(";".join(analysis["gestures"]))
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Buffered rows as column arrays.
+
+        Returns:
+            Dict[str, np.ndarray]: Columns keyed by name
+        """
+        handedness = np.array(self.handedness, dtype=np.int8).reshape(-1, self.max_hands)
+        return {
+            "frame": np.array(self.frame, dtype=np.int64),
+            "timestamp": np.array(self.timestamp, dtype=np.float64),
+            "num_hands": (handedness >= 0).sum(axis=1).astype(np.uint8),
+            "landmarks": np.array(self.landmarks, dtype=np.float32).reshape(
+                -1, self.max_hands, NUM_LANDMARKS, 3),
+            "handedness": handedness,
+            "gestures": np.array(self.gestures, dtype=str),
+        }
+
+
+def output_paths(source: str, output_dir: str) -> Tuple[str, str]:
+    """
+    Result and checkpoint paths for an input.
+
+    Args:
+        source (str): Video path or image directory
+        output_dir (str): Output directory
+
+    Returns:
+        Tuple[str, str]: ``.npz`` result path and ``.checkpoint.json`` path
+    """
+    stem = os.path.splitext(os.path.basename(os.path.normpath(source)))[0]
+    base = os.path.join(output_dir, stem)
+    return f"{base}.npz", f"{base}.checkpoint.json"
+
+
+def _load_checkpoint(path: str) -> Dict[str, Any]:
+    if os.path.exists(path):
+        with open(path) as handle:
+            return json.load(handle)
+    return {"next_frame": 0, "chunks": [], "frames": 0, "seconds": 0.0}
+
+
+def _save_checkpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as handle:
+        json.dump(checkpoint, handle)
+    os.replace(tmp, path)
+
+
+def _init_worker(max_hands: int) -> None:
+    global _worker_hands
+    _worker_hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=max_hands,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.5
+    )
+
+
+def process_source(source: str, output_dir: str, max_hands: int = 2,
+                   chunk_size: int = 500, prefetch: int = 32,
+                   fps: float = 30.0) -> Dict[str, Any]:
+    """
+    Run gesture detection over one input, resuming from its checkpoint.
+
+    Args:
+        source (str): Video path or image directory
+        output_dir (str): Output directory
+        max_hands (int): Maximum number of hands to detect
+        chunk_size (int): Frames per checkpointed chunk
+        prefetch (int): Frames decoded ahead of inference
+        fps (float): Frame rate of image directories, which sets the
+            timestamps tracking and dynamic gestures see
+
+    Returns:
+        Dict[str, Any]: Summary with ``source``, ``output``, ``frames``,
+        ``seconds`` (inference CPU time) and ``resumed_from``
+    """
+    result_path, checkpoint_path = output_paths(source, output_dir)
+    if os.path.exists(result_path) and not os.path.exists(checkpoint_path):
+        return {"source": source, "output": result_path, "frames": 0,
+                "seconds": 0.0, "resumed_from": None, "skipped": True}
+
+    if _worker_hands is None:
+        _init_worker(max_hands)
+    _worker_hands.reset()
+    controller = GestureController(max_hands=max_hands, hands=_worker_hands)
+
+    checkpoint = _load_checkpoint(checkpoint_path)
+    resumed_from = checkpoint["next_frame"]
+    buffer = ColumnBuffer(max_hands)
+
+    def flush() -> None:
+        chunk = f"{result_path[:-4]}.part{len(checkpoint['chunks']):05d}.npz"
+        np.savez(chunk, **buffer.columns())
+        checkpoint["chunks"].append(chunk)
+        checkpoint["next_frame"] = buffer.frame[-1] + 1
+        checkpoint["frames"] += len(buffer)
+        checkpoint["seconds"] += elapsed
+        _save_checkpoint(checkpoint_path, checkpoint)
+        buffer.clear()
+
+    reader = PrefetchReader(source, start=resumed_from, prefetch=prefetch, fps=fps)
+    elapsed = 0.0
+    try:
+        for index, timestamp, frame in reader:
+            # Media time, so results do not depend on decode speed; thread
+            # CPU time excludes the prefetch reader's decoding
+            start = time.thread_time()
+            analysis = controller.analyze_frame(frame, timestamp)
+            elapsed += time.thread_time() - start
+            buffer.append(index, timestamp, analysis)
+            if len(buffer) >= chunk_size:
+                flush()
+                elapsed = 0.0
+        if len(buffer):
+            flush()
+    finally:
+        reader.close()
+
+    # Merge chunks into the final columnar file
+    parts = [dict(np.load(chunk)) for chunk in checkpoint["chunks"]]
+    if parts:
+        merged = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+    else:
+        merged = ColumnBuffer(max_hands).columns()
+    np.savez(result_path, **merged)
+    for chunk in checkpoint["chunks"]:
+        os.remove(chunk)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    return {"source": source, "output": result_path, "frames": checkpoint["frames"],
+            "seconds": checkpoint["seconds"], "resumed_from": resumed_from or None,
+            "skipped": False}
+
+
+def expand_inputs(inputs: List[str]) -> List[str]:
+    """
+    Expand glob patterns into video files and frame directories.
+
+    Args:
+        inputs (List[str]): Paths or glob patterns
+
+    Returns:
+        List[str]: Existing inputs, in order, without duplicates
+    """
+    sources = []
+    for pattern in inputs:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            if os.path.exists(path) and path not in sources:
+                sources.append(path)
+    return sources
+
+
+def run_batch(sources: List[str], output_dir: str, workers: Optional[int] = None,
+              max_hands: int = 2, chunk_size: int = 500, prefetch: int = 32,
+              fps: float = 30.0) -> List[Dict[str, Any]]:
+    """
+    Process many inputs in parallel, one worker process per input at a time.
+
+    Args:
+        sources (List[str]): Video paths or image directories
+        output_dir (str): Output directory
+        workers (Optional[int]): Worker processes (defaults to the CPU count)
+        max_hands (int): Maximum number of hands to detect
+        chunk_size (int): Frames per checkpointed chunk
+        prefetch (int): Frames decoded ahead of inference
+        fps (float): Frame rate of image directories
+
+    Returns:
+        List[Dict[str, Any]]: Per-input summaries, in completion order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, max(len(sources), 1))
+    summaries = []
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(max_hands,)) as pool:
+        futures = {
+            pool.submit(process_source, source, output_dir, max_hands, chunk_size,
+                        prefetch, fps): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries.append(summary)
+            if summary["skipped"]:
+                print(f"{summary['source']}: already done")
+                continue
+            rate = summary["frames"] / summary["seconds"] if summary["seconds"] else 0.0
+            resumed = f" (resumed at frame {summary['resumed_from']})" if summary["resumed_from"] else ""
+            print(f"{summary['source']}: {summary['frames']} frames, "
+                  f"{rate:.1f} frames/s per core{resumed}")
+
+    wall = time.perf_counter() - start
+    frames = sum(summary["frames"] for summary in summaries)
+    cpu = sum(summary["seconds"] for summary in summaries)
+    print(f"Total: {frames} frames in {wall:.1f}s with {workers} workers "
+          f"({frames / wall if wall else 0:.1f} frames/s, "
+          f"{frames / cpu if cpu else 0:.1f} frames/s per core)")
+    return summaries
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Offline batch gesture detection")
+    parser.add_argument("inputs", nargs="+", help="Video files, frame directories or glob patterns")
+    parser.add_argument("--output", required=True, help="Output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--max-hands", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=500, help="Frames per checkpoint")
+    parser.add_argument("--prefetch", type=int, default=32, help="Frames decoded ahead")
+    parser.add_argument("--fps", type=float, default=30.0,
+                        help="Frame rate of image directories (videos use their own)")
+    args = parser.parse_args()
+
+    sources = expand_inputs(args.inputs)
+    if not sources:
+        parser.error("no inputs found")
+    run_batch(sources, args.output, args.workers, args.max_hands, args.chunk_size,
+              args.prefetch, args.fps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Reusable per-frame image buffers."""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+class FramePool:
+    """
+    Preallocated image buffers reused from frame to frame.
+
+    Each named buffer (``"flip"``, ``"rgb"``, ...) has ``depth`` slots used
+    in rotation, so an array handed out stays valid while the next
+    ``depth - 1`` frames are processed. A slot is reallocated only when the
+    requested shape or dtype changes, e.g. when the camera resolution
+    changes, so memory stays bounded.
+    """
+
+    def __init__(self, depth: int = 2):
+        """
+        Initialize an empty pool.
+
+        Args:
+            depth (int): Slots per buffer name
+        """
+        self.depth = depth
+        self.allocations = 0
+        self._slots: Dict[str, List[np.ndarray]] = {}
+        self._next: Dict[str, int] = {}
+
+    def get(self, name: str, shape: Sequence[int], dtype=np.uint8) -> np.ndarray:
+        """
+        Take the next buffer for ``name`` (contents are undefined).
+
+        Args:
+            name (str): Buffer name
+            shape (Sequence[int]): Required shape
+            dtype: Required dtype
+
+        Returns:
+            np.ndarray: Buffer of the requested shape and dtype
+        """
+        slots = self._slots.get(name)
+        if slots is None:
+            slots = self._slots[name] = []
+            self._next[name] = 0
+        index = self._next[name]
+        self._next[name] = (index + 1) % self.depth
+        shape = tuple(shape)
+        if index == len(slots):
+            slots.append(np.empty(shape, dtype=dtype))
+            self.allocations += 1
+        elif slots[index].shape != shape or slots[index].dtype != dtype:
+            slots[index] = np.empty(shape, dtype=dtype)
+            self.allocations += 1
+        return slots[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by all buffers."""
+        return sum(array.nbytes for slots in self._slots.values() for array in slots)
+
+    def clear(self) -> None:
+        """Free every buffer."""
+        self._slots.clear()
+        self._next.clear()
@@ -0,0 +1,309 @@
+"""Trainable static gesture classifier with NumPy-only inference.
+
+Hands are turned into pose features (normalised landmarks plus fingertip
+distances, left hands mirrored onto right ones) and classified by a small
+MLP. Training also uses NumPy only, so neither step needs scikit-learn.
+
+Train on landmark recordings, one or more per gesture::
+
+    python -m src.classifier Pinch=pinch.glr Victory=victory.glr ILY=ily.glr \\
+        "Open Palm=palm.glr" --output gestures.npz
+
+and load the model with ``GESTURE_CLASSIFIER=gestures.npz`` or
+``GestureController(classifier=LandmarkClassifier.load("gestures.npz"))``.
+"""
+
+import argparse
+import itertools
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.landmarks import FINGER_TIPS, MIDDLE_MCP, NUM_LANDMARKS, THUMB_TIP, WRIST
+from src.recording import read_recording
+
+_TIPS = np.concatenate([[THUMB_TIP], FINGER_TIPS])
+_TIP_PAIRS = np.array(list(itertools.combinations(_TIPS, 2)))
+
+# Number of features per hand: landmarks except the wrist, and tip distances
+NUM_FEATURES = 20 * 3 + len(_TIP_PAIRS)
+
+
+def landmark_features(landmarks: np.ndarray,
+                      handedness: Optional[Sequence[Tuple[str, float]]] = None) -> np.ndarray:
+    """
+    Pose features of a batch of hands.
+
+    The landmarks are normalised as by
+    :func:`~src.gesture_templates.normalize_landmarks` (wrist at the origin,
+    palm length 1, palm pointing up); fingertip distances follow from the
+    raw landmarks since they do not depend on rotation or mirroring.
+
+    Args:
+        landmarks (np.ndarray): Landmarks of shape (hands, 21, 3)
+        handedness (Optional[Sequence[Tuple[str, float]]]): (label, score)
+            per hand; ``"Left"`` hands are mirrored
+
+    Returns:
+        np.ndarray: float32 features of shape (hands, NUM_FEATURES)
+    """
+    hands = np.asarray(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+    count = len(hands)
+    centered = hands[:, 1:] - hands[:, WRIST:WRIST + 1]
+    axis = centered[:, MIDDLE_MCP - 1, :2]
+    scale = np.hypot(axis[:, 0], axis[:, 1])
+    scale[scale < 1e-6] = 1.0
+    inverse = 1.0 / scale
+    cos, sin = -axis[:, 1] * inverse ** 2, -axis[:, 0] * inverse ** 2
+    mirror = 1.0
+    if handedness:
+        mirror = np.array([-1.0 if label == "Left" else 1.0 for label, _ in handedness[:count]]
+                          + [1.0] * (count - len(handedness)), dtype=np.float32)
+
+    # One matrix per hand: rotate the palm upright, scale, mirror left hands
+    transform = np.zeros((count, 3, 3), dtype=np.float32)
+    transform[:, 0, 0], transform[:, 1, 0] = cos * mirror, -sin * mirror
+    transform[:, 0, 1], transform[:, 1, 1] = sin, cos
+    transform[:, 2, 2] = inverse
+
+    features = np.empty((count, NUM_FEATURES), dtype=np.float32)
+    np.matmul(centered, transform, out=features[:, :60].reshape(count, 20, 3))
+    tips = hands[:, _TIP_PAIRS[:, 0]] - hands[:, _TIP_PAIRS[:, 1]]
+    features[:, 60:] = np.sqrt(np.einsum("hpd,hpd->hp", tips, tips)) * inverse[:, None]
+    return features
+
+
+class LandmarkClassifier:
+    """
+    Small MLP (one ReLU hidden layer, softmax output) over pose features.
+
+    All hands of a frame are classified in one batched pass.
+    """
+
+    def __init__(self, classes: Sequence[str], mean: np.ndarray, scale: np.ndarray,
+                 hidden: Tuple[np.ndarray, np.ndarray], output: Tuple[np.ndarray, np.ndarray],
+                 threshold: float = 0.6):
+        """
+        Initialize a trained classifier.
+
+        Args:
+            classes (Sequence[str]): Gesture name of each output
+            mean (np.ndarray): Feature means used for standardisation
+            scale (np.ndarray): Feature standard deviations
+            hidden (Tuple[np.ndarray, np.ndarray]): Hidden layer weights and bias
+            output (Tuple[np.ndarray, np.ndarray]): Output layer weights and bias
+            threshold (float): Minimum probability for :meth:`predict` to
+                report a gesture
+        """
+        self.classes = list(classes)
+        self.threshold = threshold
+        # Fold standardisation into the first layer: ((x - m) / s) W = x W' + b'
+        weights, bias = hidden
+        self._w1 = (weights / scale[:, None]).astype(np.float32)
+        self._b1 = (bias - (mean / scale) @ weights).astype(np.float32)
+        self._w2, self._b2 = (np.asarray(a, dtype=np.float32) for a in output)
+        self._parameters = (mean, scale, hidden, output)
+
+    @classmethod
+    def from_env(cls) -> Optional["LandmarkClassifier"]:
+        """
+        Load the model named by ``GESTURE_CLASSIFIER``.
+
+        Returns:
+            Optional[LandmarkClassifier]: Loaded model, or None when unset
+        """
+        path = os.environ.get("GESTURE_CLASSIFIER")
+        return cls.load(path) if path else None
+
+    def predict_proba(self, landmarks: np.ndarray,
+                      handedness: Optional[Sequence[Tuple[str, float]]] = None) -> np.ndarray:
+        """
+        Class probabilities of a batch of hands.
+
+        Args:
+            landmarks (np.ndarray): Landmarks of shape (hands, 21, 3)
+            handedness (Optional[Sequence[Tuple[str, float]]]): (label, score) per hand
+
+        Returns:
+            np.ndarray: Probabilities of shape (hands, classes)
+        """
+        return self.predict_features(landmark_features(landmarks, handedness))
+
+    def predict_features(self, features: np.ndarray) -> np.ndarray:
+        """
+        Class probabilities of precomputed features.
+
+        Args:
+            features (np.ndarray): Features of shape (hands, NUM_FEATURES)
+
+        Returns:
+            np.ndarray: Probabilities of shape (hands, classes)
+        """
+        logits = np.maximum(features @ self._w1 + self._b1, 0) @ self._w2 + self._b2
+        logits -= logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict(self, landmarks: np.ndarray,
+                handedness: Optional[Sequence[Tuple[str, float]]] = None) -> List[Optional[str]]:
+        """
+        Most likely gesture of each hand.
+
+        Args:
+            landmarks (np.ndarray): Landmarks of shape (hands, 21, 3)
+            handedness (Optional[Sequence[Tuple[str, float]]]): (label, score) per hand
+
+        Returns:
+            List[Optional[str]]: Gesture name per hand, None below ``threshold``
+        """
+        if not len(landmarks):
+            return []
+        probabilities = self.predict_proba(landmarks, handedness)
+        best = probabilities.argmax(axis=1)
+        return [self.classes[c] if p >= self.threshold else None
+                for c, p in zip(best.tolist(), probabilities[np.arange(len(best)), best].tolist())]
+
+    def save(self, path: str) -> None:
+        """
+        Write the model to a ``.npz`` file.
+
+        Args:
+            path (str): Output path
+        """
+        mean, scale, (w1, b1), (w2, b2) = self._parameters
+        np.savez(path, classes=np.array(self.classes), mean=mean, scale=scale,
+                 w1=w1, b1=b1, w2=w2, b2=b2)
+
+    @classmethod
+    def load(cls, path: str, threshold: float = 0.6) -> "LandmarkClassifier":
+        """
+        Read a model written by :meth:`save`.
+
+        Args:
+            path (str): Model path
+            threshold (float): Minimum probability to report a gesture
+
+        Returns:
+            LandmarkClassifier: Loaded model
+        """
+        with np.load(path) as data:
+            return cls([str(name) for name in data["classes"]], data["mean"], data["scale"],
+                       (data["w1"], data["b1"]), (data["w2"], data["b2"]), threshold)
+
+
+def train_classifier(features: np.ndarray, labels: Sequence[str], hidden: int = 32,
+                     epochs: int = 500, learning_rate: float = 0.01,
+                     weight_decay: float = 1e-4, seed: int = 0) -> LandmarkClassifier:
+    """
+    Fit a classifier with full-batch Adam on cross-entropy.
+
+    Args:
+        features (np.ndarray): Features of shape (samples, NUM_FEATURES)
+        labels (Sequence[str]): Gesture name of each sample
+        hidden (int): Hidden layer width
+        epochs (int): Optimisation steps
+        learning_rate (float): Adam step size
+        weight_decay (float): L2 penalty on the weights
+        seed (int): Weight initialisation seed
+
+    Returns:
+        LandmarkClassifier: Trained model
+    """
+    classes = sorted(set(labels))
+    targets = np.searchsorted(classes, labels)
+    x = np.asarray(features, dtype=np.float64)
+    mean, scale = x.mean(axis=0), x.std(axis=0) + 1e-6
+    x = (x - mean) / scale
+    onehot = np.eye(len(classes))[targets]
+
+    rng = np.random.default_rng(seed)
+    params = [rng.normal(0, np.sqrt(2 / x.shape[1]), (x.shape[1], hidden)), np.zeros(hidden),
+              rng.normal(0, np.sqrt(1 / hidden), (hidden, len(classes))), np.zeros(len(classes))]
+    moments = [np.zeros_like(p) for p in params]
+    velocities = [np.zeros_like(p) for p in params]
+    beta1, beta2 = 0.9, 0.999
+
+    for step in range(1, epochs + 1):
+        w1, b1, w2, b2 = params
+        h = np.maximum(x @ w1 + b1, 0)
+        logits = h @ w2 + b2
+        logits -= logits.max(axis=1, keepdims=True)
+        p = np.exp(logits)
+        p /= p.sum(axis=1, keepdims=True)
+
+        # Backpropagate the mean cross-entropy
+        d_logits = (p - onehot) / len(x)
+        d_h = (d_logits @ w2.T) * (h > 0)
+        grads = [x.T @ d_h + weight_decay * w1, d_h.sum(axis=0),
+                 h.T @ d_logits + weight_decay * w2, d_logits.sum(axis=0)]
+        for i, grad in enumerate(grads):
+            moments[i] = beta1 * moments[i] + (1 - beta1) * grad
+            velocities[i] = beta2 * velocities[i] + (1 - beta2) * grad ** 2
+            corrected = moments[i] / (1 - beta1 ** step)
+            params[i] -= learning_rate * corrected / (np.sqrt(velocities[i] / (1 - beta2 ** step)) + 1e-8)
+
+    w1, b1, w2, b2 = params
+    return LandmarkClassifier(classes, mean, scale, (w1, b1), (w2, b2))
+
+
+def load_training_data(sources: Dict[str, List[str]]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Features and labels from landmark recordings.
+
+    Every hand in a recording is labelled with the recording's gesture.
+
+    Args:
+        sources (Dict[str, List[str]]): Gesture name to recording paths
+
+    Returns:
+        Tuple[np.ndarray, List[str]]: Features of shape (samples,
+        NUM_FEATURES) and the label of each sample
+    """
+    features, labels = [], []
+    for label, paths in sources.items():
+        for path in paths:
+            for frame in read_recording(path):
+                if len(frame.landmarks):
+                    features.append(landmark_features(frame.landmarks, frame.handedness))
+                    labels += [label] * len(frame.landmarks)
+    if not features:
+        raise ValueError("The recordings contain no hands")
+    return np.concatenate(features), labels
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Train a static gesture classifier")
+    parser.add_argument("recordings", nargs="+", metavar="GESTURE=PATH",
+                        help="Landmark recording of a gesture (repeat per file)")
+    parser.add_argument("--output", required=True, help="Model path (.npz)")
+    parser.add_argument("--hidden", type=int, default=32, help="Hidden layer width")
+    parser.add_argument("--epochs", type=int, default=500)
+    parser.add_argument("--holdout", type=float, default=0.2, help="Share of samples kept for validation")
+    args = parser.parse_args()
+
+    sources: Dict[str, List[str]] = {}
+    for item in args.recordings:
+        label, sep, path = item.partition("=")
+        if not sep or not label or not path:
+            parser.error(f"expected GESTURE=PATH, got {item!r}")
+        sources.setdefault(label, []).append(path)
+
+    features, labels = load_training_data(sources)
+    labels = np.array(labels)
+    order = np.random.default_rng(0).permutation(len(labels))
+    split = int(len(order) * (1 - args.holdout))
+    train, test = order[:split], order[split:]
+
+    model = train_classifier(features[train], labels[train].tolist(), args.hidden, args.epochs)
+    if len(test):
+        predicted = np.array(model.classes)[model.predict_features(features[test]).argmax(axis=1)]
+        print(f"Validation accuracy: {np.mean(predicted == labels[test]) * 100:.1f}% "
+              f"on {len(test)} hands")
+    model.save(args.output)
+    print(f"Saved {len(model.classes)} gestures to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
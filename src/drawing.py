@@ -0,0 +1,222 @@
+"""Air-drawing canvas: vector strokes composited tile by tile."""
+
+import json
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+class Stroke:
+    """One continuous line, in normalised frame coordinates."""
+
+    __slots__ = ("color", "thickness", "points")
+
+    def __init__(self, color: Tuple[int, int, int], thickness: int,
+                 points: Optional[List[Tuple[float, float]]] = None):
+        """
+        Initialize a stroke.
+
+        Args:
+            color (Tuple[int, int, int]): BGR colour
+            thickness (int): Line width in pixels
+            points (Optional[List[Tuple[float, float]]]): Normalised (x, y) points
+        """
+        self.color = tuple(int(c) for c in color)
+        self.thickness = int(thickness)
+        self.points = points if points is not None else []
+
+
+class DrawingCanvas:
+    """
+    Strokes kept as polylines and rasterised into a cached ink layer.
+
+    The frame is divided into ``tile`` x ``tile`` pixel tiles and a mask
+    records which tiles hold ink, so compositing blends only those tiles
+    into the frame, in place: the cost follows the inked area, not the
+    frame size. Points are stored normalised to the frame, so when the
+    frame size changes the ink layer is re-rendered from the strokes.
+    """
+
+    def __init__(self, tile: int = 32, opacity: float = 0.5):
+        """
+        Initialize an empty canvas.
+
+        Args:
+            tile (int): Tile side in pixels
+            opacity (float): Weight of the ink added to the frame
+        """
+        self.tile = tile
+        self.opacity = opacity
+        self.strokes: List[Stroke] = []
+        self.drawing = False  # Whether the last stroke is still being drawn
+        self.shape: Optional[Tuple[int, int]] = None
+        self._ink: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+
+    @property
+    def inked_tiles(self) -> int:
+        """Number of tiles that hold ink."""
+        return 0 if self._mask is None else int(np.count_nonzero(self._mask))
+
+    def resize(self, shape: Sequence[int]) -> None:
+        """
+        Match the ink layer to a frame size, re-rendering strokes if it changed.
+
+        Args:
+            shape (Sequence[int]): Frame shape (height, width, ...)
+        """
+        shape = (int(shape[0]), int(shape[1]))
+        if shape == self.shape:
+            return
+        self.shape = shape
+        self._ink = np.zeros((*shape, 3), dtype=np.uint8)
+        self._mask = np.zeros((-(-shape[0] // self.tile), -(-shape[1] // self.tile)), dtype=bool)
+        for stroke in self.strokes:
+            pixels = self._pixels(stroke.points)
+            for start, end in zip(pixels, pixels[1:]):
+                self._segment(start, end, stroke)
+
+    def _pixels(self, points: List[Tuple[float, float]]) -> List[Tuple[int, int]]:
+        height, width = self.shape
+        return [(int(x * width), int(y * height)) for x, y in points]
+
+    def _segment(self, start: Tuple[int, int], end: Tuple[int, int], stroke: Stroke) -> None:
+        cv2.line(self._ink, start, end, stroke.color, stroke.thickness)
+        # Mark every tile the line (with its width) can touch
+        reach = stroke.thickness // 2 + 1
+        rows, cols = self._mask.shape
+        top = max((min(start[1], end[1]) - reach) // self.tile, 0)
+        bottom = min((max(start[1], end[1]) + reach) // self.tile, rows - 1)
+        left = max((min(start[0], end[0]) - reach) // self.tile, 0)
+        right = min((max(start[0], end[0]) + reach) // self.tile, cols - 1)
+        if top <= bottom and left <= right:
+            self._mask[top:bottom + 1, left:right + 1] = True
+
+    def begin_stroke(self, color: Tuple[int, int, int], thickness: int) -> None:
+        """
+        Start a new stroke.
+
+        Args:
+            color (Tuple[int, int, int]): BGR colour
+            thickness (int): Line width in pixels
+        """
+        self.strokes.append(Stroke(color, thickness))
+        self.drawing = True
+
+    def add_point(self, x: float, y: float) -> None:
+        """
+        Extend the current stroke.
+
+        Args:
+            x (float): Normalised x coordinate
+            y (float): Normalised y coordinate
+        """
+        stroke = self.strokes[-1]
+        stroke.points.append((float(x), float(y)))
+        if self._ink is not None and len(stroke.points) > 1:
+            start, end = self._pixels(stroke.points[-2:])
+            self._segment(start, end, stroke)
+
+    def end_stroke(self) -> None:
+        """Finish the current stroke; a single point leaves no ink and is dropped."""
+        if self.drawing and len(self.strokes[-1].points) < 2:
+            self.strokes.pop()
+        self.drawing = False
+
+    def clear(self) -> None:
+        """Remove every stroke."""
+        self.strokes.clear()
+        self.drawing = False
+        if self._mask is not None:
+            # Only inked tiles can be non-zero
+            for top, left, bottom, right in self._runs():
+                self._ink[top:bottom, left:right] = 0
+            self._mask[:] = False
+
+    def _runs(self) -> List[Tuple[int, int, int, int]]:
+        # Pixel rectangles (top, left, bottom, right) of horizontal runs of inked tiles
+        runs = []
+        tile = self.tile
+        for row in np.flatnonzero(self._mask.any(axis=1)).tolist():
+            cols = np.flatnonzero(self._mask[row]).tolist()
+            start = previous = cols[0]
+            for col in cols[1:] + [None]:
+                if col != previous + 1:
+                    runs.append((row * tile, start * tile, (row + 1) * tile, (previous + 1) * tile))
+                    start = col
+                previous = col
+        return runs
+
+    def composite(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Blend the ink into a frame, in place.
+
+        Args:
+            frame (np.ndarray): BGR frame; its size becomes the canvas size
+
+        Returns:
+            np.ndarray: The same frame, with ink added
+        """
+        self.resize(frame.shape)
+        for top, left, bottom, right in self._runs():
+            region = frame[top:bottom, left:right]
+            cv2.addWeighted(region, 1, self._ink[top:bottom, left:right], self.opacity, 0,
+                            dst=region)
+        return frame
+
+    def to_json(self) -> str:
+        """
+        Serialise the strokes.
+
+        Returns:
+            str: JSON with each stroke's ``color`` (BGR), ``thickness`` and
+            normalised ``points``
+        """
+        return json.dumps({"strokes": [
+            {"color": list(s.color), "thickness": s.thickness, "points": s.points}
+            for s in self.strokes
+        ]})
+
+    @classmethod
+    def from_json(cls, text: str, **kwargs) -> "DrawingCanvas":
+        """
+        Restore strokes written by :meth:`to_json`.
+
+        Args:
+            text (str): JSON text
+            **kwargs: Options forwarded to the constructor
+
+        Returns:
+            DrawingCanvas: Canvas holding the strokes
+        """
+        canvas = cls(**kwargs)
+        for data in json.loads(text)["strokes"]:
+            points = [(float(x), float(y)) for x, y in data["points"]]
+            canvas.strokes.append(Stroke(data["color"], data["thickness"], points))
+        return canvas
+
+    def to_svg(self, width: Optional[int] = None, height: Optional[int] = None) -> str:
+        """
+        Render the strokes as an SVG document.
+
+        Args:
+            width (Optional[int]): Image width (defaults to the canvas width, or 640)
+            height (Optional[int]): Image height (defaults to the canvas height, or 480)
+
+        Returns:
+            str: SVG markup with one polyline per stroke
+        """
+        default_height, default_width = self.shape or (480, 640)
+        width, height = width or default_width, height or default_height
+        lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                 f'viewBox="0 0 {width} {height}">']
+        for stroke in self.strokes:
+            blue, green, red = stroke.color
+            points = " ".join(f"{x * width:.1f},{y * height:.1f}" for x, y in stroke.points)
+            lines.append(f'  <polyline points="{points}" fill="none" '
+                         f'stroke="#{red:02x}{green:02x}{blue:02x}" '
+                         f'stroke-width="{stroke.thickness}" '
+                         f'stroke-linecap="round" stroke-linejoin="round"/>')
+        lines.append("</svg>")
+        return "\n".join(lines) + "\n"
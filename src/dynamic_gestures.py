@@ -0,0 +1,259 @@
+"""Sliding-window dynamic gesture detection over per-hand motion histories."""
+
+import math
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+from src.landmarks import INDEX_TIP, MIDDLE_MCP, PALM_POINTS, THUMB_TIP, as_landmark_array
+
+# Columns of a motion history sample
+_X, _Y, _SIZE, _PATH, _TURN = range(5)
+
+# Landmarks the detector reads: palm points, middle finger base, pinch tips
+_POINTS = [*PALM_POINTS, MIDDLE_MCP, THUMB_TIP, INDEX_TIP]
+
+
+class MotionHistory:
+    """
+    Fixed-size ring buffer of timestamped palm samples for one hand.
+
+    Besides position and apparent hand size, every sample stores the
+    cumulative path length and signed turning angle, so any window's path
+    and turning are the difference of two samples. Direction only updates
+    once the palm has moved ``min_step`` from the last anchor, so sensor
+    jitter adds neither path nor turning.
+    """
+
+    def __init__(self, capacity: int = 128, min_step: float = 0.01):
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity (int): Samples kept; older ones are overwritten
+            min_step (float): Palm movement that counts as a step
+        """
+        self.capacity = capacity
+        self.min_step = min_step
+        self.times = np.zeros(capacity)
+        self.samples = np.zeros((capacity, 5))
+        self.count = 0  # Samples ever pushed; the newest is count - 1
+        self.start = 0  # Oldest sample still eligible for detection
+        self._tails: Dict[float, int] = {}
+        self._anchor = (0.0, 0.0)
+        self._heading: Optional[float] = None
+        # Pinch-drag state
+        self.pinched = False
+        self.dragging = False
+        self.pinch_point = (0.0, 0.0)
+
+    def __len__(self) -> int:
+        return min(self.count - self.start, self.capacity)
+
+    def push(self, timestamp: float, x: float, y: float, size: float) -> None:
+        """
+        Append a sample, overwriting the oldest when full.
+
+        Args:
+            timestamp (float): Capture time in seconds
+            x (float): Palm x in normalised frame units
+            y (float): Palm y in normalised frame units
+            size (float): Log of the apparent hand size
+        """
+        path = turn = 0.0
+        if self.count:
+            previous = self.samples[(self.count - 1) % self.capacity]
+            path, turn = previous[_PATH], previous[_TURN]
+            dx, dy = x - self._anchor[0], y - self._anchor[1]
+            step = math.hypot(dx, dy)
+            if step >= self.min_step:
+                heading = math.atan2(dy, dx)
+                if self._heading is not None:
+                    turn += (heading - self._heading + math.pi) % (2 * math.pi) - math.pi
+                path += step
+                self._heading = heading
+                self._anchor = (x, y)
+        else:
+            self._anchor = (x, y)
+
+        i = self.count % self.capacity
+        self.times[i] = timestamp
+        self.samples[i] = (x, y, size, path, turn)
+        self.count += 1
+
+    def newest(self) -> np.ndarray:
+        """The latest sample (x, y, size, path, turn)."""
+        return self.samples[(self.count - 1) % self.capacity]
+
+    def oldest(self, window: float) -> np.ndarray:
+        """
+        The oldest sample within ``window`` seconds of the newest.
+
+        Each window keeps its own tail that only moves forward, so the
+        lookup is amortised O(1).
+
+        Args:
+            window (float): Window length in seconds
+
+        Returns:
+            np.ndarray: Sample (x, y, size, path, turn)
+        """
+        floor = max(self.start, self.count - self.capacity)
+        tail = max(self._tails.get(window, floor), floor)
+        horizon = self.times[(self.count - 1) % self.capacity] - window
+        while tail < self.count - 1 and self.times[tail % self.capacity] < horizon:
+            tail += 1
+        self._tails[window] = tail
+        return self.samples[tail % self.capacity]
+
+    def clear(self) -> None:
+        """Restart detection from the newest sample."""
+        self.start = max(self.count - 1, 0)
+        if self.count:
+            x, y = self.newest()[:2]
+            self._anchor = (x, y)
+        self._heading = None
+
+
+class DynamicGestureDetector:
+    """
+    Detects movement gestures per hand on every frame.
+
+    Swipes, circles and push/pull are judged on sliding windows ending at
+    the current frame; once one fires, that hand's window restarts. Push
+    and pull follow the apparent hand size (palm length including its z
+    extent): MediaPipe reports z relative to the wrist, so size is the
+    usable depth cue. While thumb and index are pinched, only pinch-drag
+    is reported.
+    """
+
+    def __init__(self, swipe_window: float = 1.0, swipe_distance: float = 0.2,
+                 straightness: float = 0.7, circle_window: float = 2.0,
+                 circle_turn: float = 1.8 * math.pi, circle_path: float = 0.25,
+                 push_ratio: float = 1.3, pinch_threshold: float = 0.35,
+                 release_threshold: float = 0.5, drag_distance: float = 0.05,
+                 capacity: int = 128):
+        """
+        Initialize the detector.
+
+        Args:
+            swipe_window (float): Seconds over which swipes and push/pull are measured
+            swipe_distance (float): Palm displacement, in frame units, of a swipe
+            straightness (float): Minimum displacement to path length ratio of a swipe
+            circle_window (float): Seconds over which circles are measured
+            circle_turn (float): Signed turning angle (radians) of a circle
+            circle_path (float): Minimum path length of a circle
+            push_ratio (float): Hand size change of a push (or its inverse, pull)
+            pinch_threshold (float): Thumb-index distance, in palm lengths,
+                that starts a pinch
+            release_threshold (float): Distance that ends it
+            drag_distance (float): Pinch movement that starts a drag
+            capacity (int): Samples kept per hand
+        """
+        self.swipe_window = swipe_window
+        self.swipe_distance = swipe_distance
+        self.straightness = straightness
+        self.circle_window = circle_window
+        self.circle_turn = circle_turn
+        self.circle_path = circle_path
+        self.push_size = math.log(push_ratio)
+        self.pinch_threshold = pinch_threshold
+        self.release_threshold = release_threshold
+        self.drag_distance = drag_distance
+        self.capacity = capacity
+        self.histories: Dict[Hashable, MotionHistory] = {}
+
+    def __contains__(self, hand_id: Hashable) -> bool:
+        return hand_id in self.histories
+
+    def update(self, hand_id: Hashable, landmarks, timestamp: float) -> Optional[str]:
+        """
+        Add one frame of a hand and report a gesture it completes.
+
+        Args:
+            hand_id (Hashable): Stable ID of the hand
+            landmarks: (21, 3) landmark array or MediaPipe hand landmarks
+            timestamp (float): Capture time in seconds
+
+        Returns:
+            Optional[str]: Detected dynamic gesture name if any
+        """
+        landmarks = as_landmark_array(landmarks)
+        history = self.histories.get(hand_id)
+        if history is None:
+            history = self.histories[hand_id] = MotionHistory(self.capacity)
+
+        # Pure-Python arithmetic on the few landmarks needed beats NumPy here
+        (wrist, index_mcp, pinky_mcp, middle_mcp, thumb_tip,
+         index_tip) = landmarks[_POINTS].tolist()
+        x = (wrist[0] + index_mcp[0] + pinky_mcp[0]) / 3
+        y = (wrist[1] + index_mcp[1] + pinky_mcp[1]) / 3
+        palm = max(math.dist(middle_mcp, wrist), 1e-6)
+        history.push(timestamp, x, y, math.log(palm))
+
+        pinch = math.dist(thumb_tip, index_tip) / palm
+        pinch_point = ((thumb_tip[0] + index_tip[0]) / 2, (thumb_tip[1] + index_tip[1]) / 2)
+        if history.pinched or pinch < self.pinch_threshold:
+            return self._pinch(history, pinch, pinch_point)
+        return self._motion(history)
+
+    def _pinch(self, history: MotionHistory, pinch: float, point: Tuple[float, float]) -> Optional[str]:
+        if not history.pinched:
+            history.pinched, history.dragging = True, False
+            history.pinch_point = point
+            return None
+        if pinch > self.release_threshold:
+            history.pinched = False
+            history.clear()  # Movement while pinched is not a swipe
+            return "Pinch Drop" if history.dragging else None
+        if not history.dragging:
+            moved = math.hypot(point[0] - history.pinch_point[0], point[1] - history.pinch_point[1])
+            if moved > self.drag_distance:
+                history.dragging = True
+                return "Pinch Drag"
+        return None
+
+    def _motion(self, history: MotionHistory) -> Optional[str]:
+        if len(history) < 2:
+            return None
+        newest = history.newest()
+
+        # Circle: the palm kept turning one way for a full revolution
+        first = history.oldest(self.circle_window)
+        turn = newest[_TURN] - first[_TURN]
+        if abs(turn) >= self.circle_turn and newest[_PATH] - first[_PATH] >= self.circle_path:
+            history.clear()
+            # Image y points down, so a positive turn is clockwise on screen
+            return "Circle Clockwise" if turn > 0 else "Circle Counterclockwise"
+
+        first = history.oldest(self.swipe_window)
+        dx, dy = newest[_X] - first[_X], newest[_Y] - first[_Y]
+        distance = math.hypot(dx, dy)
+
+        # Push/pull: the hand grew or shrank without moving across the frame
+        growth = newest[_SIZE] - first[_SIZE]
+        if abs(growth) >= self.push_size and distance < self.swipe_distance:
+            history.clear()
+            return "Push" if growth > 0 else "Pull"
+
+        # Swipe: a fast, roughly straight movement
+        path = newest[_PATH] - first[_PATH]
+        if distance > self.swipe_distance and distance >= self.straightness * path:
+            history.clear()
+            if abs(dx) >= abs(dy):
+                return "Swipe Right" if dx > 0 else "Swipe Left"
+            return "Swipe Down" if dy > 0 else "Swipe Up"
+        return None
+
+    def forget(self, hand_id: Hashable) -> None:
+        """
+        Free the history of a hand.
+
+        Args:
+            hand_id (Hashable): Hand ID
+        """
+        self.histories.pop(hand_id, None)
+
+    def reset(self) -> None:
+        """Free every history."""
+        self.histories.clear()
@@ -0,0 +1,218 @@
+"""Vectorised landmark smoothing filters with per-hand state."""
+
+import math
+import os
+from typing import Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class LandmarkFilterBank:
+    """
+    Base class for filters smoothing (21, 3) hands keyed by a hand ID.
+
+    All hands of a frame are filtered together in one NumPy operation. State
+    older than ``max_age`` seconds is discarded, so a hand that reappears
+    starts from its raw position instead of being dragged from where it was
+    last seen. A hand measured again at the same (or an earlier) timestamp
+    is held at its last estimate; its state is left untouched.
+
+    The first element of a hand's state is its smoothed landmarks.
+    """
+
+    def __init__(self, max_age: float = 0.5):
+        """
+        Initialize an empty filter bank.
+
+        Args:
+            max_age (float): Seconds after which a hand's state is discarded
+        """
+        self.max_age = max_age
+        self._state: Dict[Hashable, Tuple[float, Tuple[np.ndarray, ...]]] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional["LandmarkFilterBank"]:
+        """
+        Create the filter named by ``GESTURE_SMOOTHING`` (``one_euro`` or ``kalman``).
+
+        Returns:
+            Optional[LandmarkFilterBank]: Configured filter, or None when unset
+        """
+        name = os.environ.get("GESTURE_SMOOTHING", "").lower()
+        if not name or name == "none":
+            return None
+        filters = {"one_euro": OneEuroFilterBank, "kalman": KalmanFilterBank}
+        if name not in filters:
+            raise ValueError(f"Unknown GESTURE_SMOOTHING {name!r}, expected one of {sorted(filters)}")
+        return filters[name]()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def __contains__(self, hand_id: Hashable) -> bool:
+        return hand_id in self._state
+
+    def _initial(self, landmarks: np.ndarray) -> Tuple[np.ndarray, ...]:
+        raise NotImplementedError
+
+    def _step(self, landmarks: np.ndarray, dt: np.ndarray,
+              state: Tuple[np.ndarray, ...]) -> Tuple[np.ndarray, Tuple[np.ndarray, ...]]:
+        raise NotImplementedError
+
+    def filter(self, hand_ids: Sequence[Hashable], landmarks: np.ndarray,
+               timestamp: float) -> np.ndarray:
+        """
+        Smooth one frame of hands.
+
+        Args:
+            hand_ids (Sequence[Hashable]): Stable ID of each hand
+            landmarks (np.ndarray): Raw landmarks of shape (hands, 21, 3)
+            timestamp (float): Capture time in seconds
+
+        Returns:
+            np.ndarray: Filtered float32 landmarks of the same shape
+        """
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        filtered = landmarks.copy()
+        known, held = [], []
+        for i, hand_id in enumerate(hand_ids):
+            if hand_id in self._state:
+                dt = timestamp - self._state[hand_id][0]
+                if dt <= 0:
+                    held.append(i)  # Duplicate timestamp: no time to filter over
+                elif dt <= self.max_age:
+                    known.append(i)
+
+        if known:
+            # Stack the state of every known hand and filter them together
+            ids = [hand_ids[i] for i in known]
+            dt = np.array([timestamp - self._state[hand_id][0] for hand_id in ids],
+                          dtype=np.float32)[:, None, None]
+            states = tuple(np.stack(parts) for parts in zip(*(self._state[h][1] for h in ids)))
+            filtered[known], states = self._step(landmarks[known], dt, states)
+            for n, hand_id in enumerate(ids):
+                self._state[hand_id] = (timestamp, tuple(part[n] for part in states))
+
+        for i in held:
+            filtered[i] = self._state[hand_ids[i]][1][0]
+
+        for i, hand_id in enumerate(hand_ids):
+            if i not in known and i not in held:
+                self._state[hand_id] = (timestamp, self._initial(landmarks[i]))
+        return filtered
+
+    def forget(self, hand_id: Hashable) -> None:
+        """
+        Drop the state of a hand.
+
+        Args:
+            hand_id (Hashable): Hand ID
+        """
+        self._state.pop(hand_id, None)
+
+    def prune(self, timestamp: float) -> None:
+        """
+        Drop the state of hands not seen for more than ``max_age`` seconds.
+
+        Args:
+            timestamp (float): Current time in seconds
+        """
+        for hand_id in [h for h, (seen, _) in self._state.items() if timestamp - seen > self.max_age]:
+            del self._state[hand_id]
+
+    def reset(self) -> None:
+        """Drop all state."""
+        self._state.clear()
+
+
+def _alpha(dt: np.ndarray, cutoff) -> np.ndarray:
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilterBank(LandmarkFilterBank):
+    """
+    One-Euro filter: a low-pass filter whose cutoff rises with speed.
+
+    Slow hands are smoothed strongly (no jitter); fast hands barely at all
+    (little lag). Speeds are in normalised frame units per second.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 10.0, d_cutoff: float = 1.0,
+                 max_age: float = 0.5):
+        """
+        Initialize the filter bank.
+
+        Args:
+            min_cutoff (float): Cutoff frequency (Hz) at rest
+            beta (float): Cutoff increase per unit of speed
+            d_cutoff (float): Cutoff frequency (Hz) of the speed estimate
+            max_age (float): Seconds after which a hand's state is discarded
+        """
+        super().__init__(max_age)
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+
+    def _initial(self, landmarks):
+        return landmarks.copy(), np.zeros_like(landmarks)
+
+    def _step(self, landmarks, dt, state):
+        previous, previous_speed = state
+        a_d = _alpha(dt, self.d_cutoff)
+        speed = a_d * (landmarks - previous) / dt + (1 - a_d) * previous_speed
+        a = _alpha(dt, self.min_cutoff + self.beta * np.abs(speed))
+        filtered = a * landmarks + (1 - a) * previous
+        return filtered, (filtered, speed)
+
+
+class KalmanFilterBank(LandmarkFilterBank):
+    """
+    Constant-velocity Kalman filter on every landmark coordinate.
+
+    Coordinates share one noise model and are measured together, so one
+    2x2 covariance per hand serves all 63 of them.
+    """
+
+    def __init__(self, process_noise: float = 2.0, measurement_noise: float = 2e-5,
+                 max_age: float = 0.5):
+        """
+        Initialize the filter bank.
+
+        Args:
+            process_noise (float): Acceleration variance ((units/s^2)^2)
+            measurement_noise (float): Landmark measurement variance (units^2)
+            max_age (float): Seconds after which a hand's state is discarded
+        """
+        super().__init__(max_age)
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+
+    def _initial(self, landmarks):
+        covariance = np.diag([self.measurement_noise, 1.0]).astype(np.float32)
+        return landmarks.copy(), np.zeros_like(landmarks), covariance
+
+    def _step(self, landmarks, dt, state):
+        position, velocity, covariance = state
+        dt = dt[:, 0, 0]
+        q = self.process_noise
+
+        # Predict
+        position = position + velocity * dt[:, None, None]
+        p00, p01, p11 = covariance[:, 0, 0], covariance[:, 0, 1], covariance[:, 1, 1]
+        p00 = p00 + dt * (2 * p01 + dt * p11) + q * dt ** 4 / 4
+        p01 = p01 + dt * p11 + q * dt ** 3 / 2
+        p11 = p11 + q * dt ** 2
+
+        # Update with the measured landmarks
+        innovation = landmarks - position
+        k0 = p00 / (p00 + self.measurement_noise)
+        k1 = p01 / (p00 + self.measurement_noise)
+        position = position + k0[:, None, None] * innovation
+        velocity = velocity + k1[:, None, None] * innovation
+
+        covariance = np.empty_like(covariance)
+        covariance[:, 0, 0] = (1 - k0) * p00
+        covariance[:, 0, 1] = covariance[:, 1, 0] = (1 - k0) * p01
+        covariance[:, 1, 1] = p11 - k1 * p01
+        return position.astype(np.float32), (position, velocity, covariance)
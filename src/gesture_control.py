@@ -5,78 +5,194 @@ import mediapipe as mp
 import numpy as np
 from typing import Tuple, Dict, Any, Optional, List
 from collections import deque
+import os
 import time
+from src.buffers import FramePool
+from src.landmarks import (
+    FINGER_PIPS,
+    FINGER_TIPS,
+    INDEX_TIP,
+    MIDDLE_MCP,
+    PALM_POINTS,
+    PINKY_MCP,
+    THUMB_IP,
+    THUMB_TIP,
+    WRIST,
+    array_to_landmarks,
+    as_landmark_array,
+    hands_to_array,
+)
+from src.gesture_templates import GestureTemplates
+from src.gesture_library import append_template, load_templates, save_templates
+from src.motion_templates import MotionTemplates
+from src.overlays import HistoryOverlay, TrajectoryBuffer, TrajectoryRenderer
+from src.profiling import StageProfiler
+from src.classifier import LandmarkClassifier
+from src.dynamic_gestures import DynamicGestureDetector
+from src.filters import LandmarkFilterBank
+from src.prediction import FrameSkipper
+from src.roi import InferenceInput, map_to_frame
+from src.tracking import HandTracker
+
+# Named poses by which fingers are up (thumb, index, middle, ring, pinky).
+# Only poses that are not the usual way to show a finger count: index and
+# middle stay "2 Fingers" (Victory needs a trained classifier).
+NAMED_POSES = {
+    (True, True, False, False, True): "ILY",
+}
 
 class GestureController:
     """Advanced gesture detection and control system."""
     
-    def __init__(self, max_hands: int = 2, trajectory_points: int = 32):
+    def __init__(self, max_hands: int = 2, trajectory_points: int = 32, hands=None,
+                 gesture_library: Optional[str] = None, recorder=None,
+                 profiler: Optional[StageProfiler] = None,
+                 inference_input: Optional[InferenceInput] = None,
+                 frame_skipper: Optional[FrameSkipper] = None,
+                 landmark_filter: Optional[LandmarkFilterBank] = None,
+                 classifier: Optional[LandmarkClassifier] = None,
+                 frame_pool: Optional[FramePool] = None):
         """
         Initialize the gesture controller.
         
         Args:
             max_hands (int): Maximum number of hands to detect
             trajectory_points (int): Number of points to store for gesture trajectories
+            hands: Optional externally managed MediaPipe Hands instance. When
+                omitted the controller creates (and closes) its own on first use.
+            gesture_library (Optional[str]): Path of a persistent custom gesture
+                library; existing gestures are loaded (memory-mapped) and newly
+                recorded ones are appended to it
+            recorder: Optional :class:`~src.recording.LandmarkRecorder` that
+                logs every analysed frame's landmarks for later replay
+            profiler (Optional[StageProfiler]): Records per-stage durations
+                when enabled (disabled by default)
+            inference_input (Optional[InferenceInput]): Downscales and crops
+                frames before inference (full frames are used when omitted)
+            frame_skipper (Optional[FrameSkipper]): Runs inference only on
+                some frames and predicts landmarks for the others
+            landmark_filter (Optional[LandmarkFilterBank]): Smooths landmarks
+                before any gesture logic, drawing or feature sees them
+            classifier (Optional[LandmarkClassifier]): Trained static gesture
+                model, consulted before the built-in rules
+            frame_pool (Optional[FramePool]): Buffers the flipped and RGB
+                frames are written into (a private pool when omitted)
         """
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_hands,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.max_hands = max_hands
+        self._hands = hands
+        self._owns_hands = False
         self.mp_draw = mp.solutions.drawing_utils
+        self.recorder = recorder
+        self.profiler = profiler if profiler is not None else StageProfiler()
+        self.inference_input = inference_input
+        self.frame_skipper = frame_skipper
+        self.landmark_filter = landmark_filter
+        self.classifier = classifier
+        self.frame_pool = frame_pool if frame_pool is not None else FramePool()
         
         # Gesture trajectory tracking
         self.trajectory_length = trajectory_points
-        self.trajectories = {}  # Store trajectories for each hand
+        self.trajectories = {}  # Store trajectories for each hand, keyed by track ID
+        self.tracker = HandTracker()
         self.gesture_history = deque(maxlen=10)  # Store last 10 gestures
+        self.trajectory_renderer = TrajectoryRenderer(trajectory_points)
+        self.history_overlay = HistoryOverlay()
         
-        # Dynamic gesture recognition
-        self.gesture_start_time = None
-        self.gesture_positions = []
-        self.dynamic_gesture_threshold = 1.0  # seconds
+        # Dynamic gesture recognition (per-hand motion histories)
+        self.dynamic_gestures = DynamicGestureDetector()
+        
+        # Custom gesture mapping (normalised pose templates)
+        self.gesture_library = gesture_library
+        if gesture_library and os.path.exists(gesture_library):
+            self.custom_gestures = load_templates(gesture_library)
+        else:
+            self.custom_gestures = GestureTemplates()
+        
+        # Custom motion gestures (trajectory templates)
+        self.motion_gestures = MotionTemplates()
+        self.min_motion = 0.1  # Trajectory extent (frame units) worth matching
+        
+    @property
+    def hands(self):
+        """MediaPipe Hands graph used for inference."""
+        if self._hands is None:
+            self._hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=self.max_hands,
+                min_detection_confidence=0.7,
+                min_tracking_confidence=0.5
+            )
+            self._owns_hands = True
+        return self._hands
+    
+    @hands.setter
+    def hands(self, hands) -> None:
+        if self._owns_hands and self._hands is not None and self._hands is not hands:
+            self._hands.close()
+        self._hands = hands
+        self._owns_hands = False
+        
+    def finger_states(self, hand_landmarks) -> np.ndarray:
+        """
+        Which fingers are held up, thumb first.
         
-        # Custom gesture mapping
-        self.custom_gestures = {}
+        The thumb counts as up when its tip is farther from the pinky base
+        than its IP joint is, which holds for either hand and any roll.
         
+        Args:
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
+            
+        Returns:
+            np.ndarray: Boolean array of shape (5,)
+        """
+        landmarks = as_landmark_array(hand_landmarks)
+        
+        states = np.empty(5, dtype=bool)
+        pinky_base = landmarks[PINKY_MCP, :2]
+        states[0] = (np.linalg.norm(landmarks[THUMB_TIP, :2] - pinky_base)
+                     > np.linalg.norm(landmarks[THUMB_IP, :2] - pinky_base))
+        states[1:] = landmarks[FINGER_TIPS, 1] < landmarks[FINGER_PIPS, 1]
+        return states
+    
     def count_fingers(self, hand_landmarks) -> int:
         """
         Count number of fingers held up.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
             
         Returns:
             int: Number of fingers detected as being held up
         """
-        finger_tips = [8, 12, 16, 20]  # Index for finger tips (except thumb)
-        thumb_tip = 4
-        count = 0
-        
-        # Check thumb
-        if hand_landmarks.landmark[thumb_tip].x < hand_landmarks.landmark[thumb_tip - 1].x:
-            count += 1
-        
-        # Check other fingers
-        for tip in finger_tips:
-            if hand_landmarks.landmark[tip].y < hand_landmarks.landmark[tip - 2].y:
-                count += 1
-                
-        return count
+        return int(np.count_nonzero(self.finger_states(hand_landmarks)))
     
     def detect_gesture(self, hand_landmarks) -> str:
         """
         Detect basic hand gestures.
         
+        Named poses (Pinch, ILY) take precedence over finger counts.
+        
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
             
         Returns:
             str: Detected gesture name
         """
-        fingers_up = self.count_fingers(hand_landmarks)
-        
+        landmarks = as_landmark_array(hand_landmarks)
+        states = self.finger_states(landmarks)
+        
+        palm = max(float(np.linalg.norm(landmarks[MIDDLE_MCP] - landmarks[WRIST])), 1e-6)
+        pinch = np.linalg.norm(landmarks[THUMB_TIP] - landmarks[INDEX_TIP]) / palm
+        reach = np.linalg.norm(landmarks[INDEX_TIP] - landmarks[WRIST]) / palm
+        # Thumb and index tips touching with the index reaching out (not a fist)
+        if pinch < 0.25 and reach > 1.2:
+            return "Pinch"
+        pose = tuple(states.tolist())
+        if pose in NAMED_POSES:
+            return NAMED_POSES[pose]
+        
+        fingers_up = int(np.count_nonzero(states))
         if fingers_up == 0:
             return "Closed Fist"
         elif fingers_up == 5:
@@ -84,65 +200,230 @@ class GestureController:
         else:
             return f"{fingers_up} Fingers"
     
-    def process_frame(self, frame: np.ndarray) -> Tuple[List[str], np.ndarray]:
+    def detect_gestures(self, landmarks: np.ndarray,
+                        handedness: List[Tuple[str, float]]) -> List[str]:
         """
-        Process a video frame and detect gestures.
+        Detect the static gesture of every hand in a frame.
+        
+        With a classifier, all hands are classified in one batched pass and
+        the rules of :meth:`detect_gesture` only decide hands the model is
+        unsure about.
+        
+        Args:
+            landmarks (np.ndarray): float32 array of shape (hands, 21, 3)
+            handedness (List[Tuple[str, float]]): (label, score) per hand
+            
+        Returns:
+            List[str]: Gesture name per hand
+        """
+        if self.classifier is None or not len(landmarks):
+            return [self.detect_gesture(hand) for hand in landmarks]
+        predicted = self.classifier.predict(landmarks, handedness)
+        return [gesture or self.detect_gesture(hand) for gesture, hand in zip(predicted, landmarks)]
+    
+    def analyze_frame(self, frame: np.ndarray, timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Detect hands and gestures in a video frame without drawing anything.
+        
+        The flipped frame is written into a pooled buffer, so ``image`` is
+        only valid until ``frame_pool.depth - 1`` more frames have been
+        analysed; copy it to keep it longer.
         
         Args:
             frame (np.ndarray): Input video frame
+            timestamp (Optional[float]): Capture time in seconds, used for
+                tracking, smoothing, frame skipping and dynamic gestures
+                (defaults to now; pass the media time for recorded video)
             
         Returns:
-            Tuple[List[str], np.ndarray]: List of detected gestures and annotated frame
+            Dict[str, Any]: Analysis with keys ``image`` (flipped frame),
+            ``landmarks`` (float32 array of shape (hands, 21, 3)), ``handedness`` (list of
+            (label, score)), ``hand_ids`` (persistent track ID per hand),
+            ``gestures``, ``trajectories`` (track ID to float32 array of
+            shape (points, 2)) and ``predicted`` (True when the landmarks
+            were predicted instead of inferred)
         """
+        if timestamp is None:
+            timestamp = time.time()
+        profiler = self.profiler
+        
         # Flip the image horizontally for selfie-view display
-        image = cv2.flip(frame, 1)
+        with profiler.stage("flip"):
+            image = cv2.flip(frame, 1, dst=self.frame_pool.get("flip", frame.shape, frame.dtype))
+        
+        skipper = self.frame_skipper
+        if skipper is not None and not skipper.should_infer(timestamp):
+            # Skipped frame: extrapolate the last inferred hands
+            with profiler.stage("predict"):
+                landmarks, handedness = skipper.predict(timestamp, image)
+            with profiler.stage("gestures"):
+                analysis = self.analyze_landmarks(landmarks, handedness, timestamp)
+            analysis["image"] = image
+            analysis["predicted"] = True
+            return analysis
+        
+        # Downscale and crop to the tracked hands before inference
+        region = None
+        inference_image = image
+        if self.inference_input is not None:
+            with profiler.stage("preprocess"):
+                inference_image, region = self.inference_input.prepare(image)
         
         # Convert BGR image to RGB
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        with profiler.stage("color_convert"):
+            rgb_image = cv2.cvtColor(inference_image, cv2.COLOR_BGR2RGB,
+                                     dst=self.frame_pool.get("rgb", inference_image.shape))
         
         # Process the image and detect hands
-        results = self.hands.process(rgb_image)
+        with profiler.stage("inference"):
+            results = self.hands.process(rgb_image)
+        
+        # Convert every hand once; all gesture logic and drawing use the array
+        landmarks = hands_to_array(results.multi_hand_landmarks)
+        if region is not None:
+            # Back to full-frame coordinates
+            map_to_frame(landmarks, region)
+            self.inference_input.update(landmarks, image.shape)
+        handedness = [
+            (hand.classification[0].label, hand.classification[0].score)
+            for hand in (results.multi_handedness or [])
+        ]
+        if self.recorder is not None:
+            self.recorder.write(timestamp, landmarks, handedness)
+        if skipper is not None:
+            skipper.observe(timestamp, landmarks, handedness, image)
+        
+        with profiler.stage("gestures"):
+            analysis = self.analyze_landmarks(landmarks, handedness, timestamp)
+        analysis["image"] = image
+        return analysis
+    
+    def analyze_landmarks(self, landmarks: np.ndarray, handedness: List[Tuple[str, float]],
+                          timestamp: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run the gesture logic on already detected hands (no inference).
         
+        Args:
+            landmarks (np.ndarray): float32 array of shape (hands, 21, 3)
+            handedness (List[Tuple[str, float]]): (label, score) per hand
+            timestamp (Optional[float]): Capture time in seconds, used for
+                dynamic gestures (defaults to now)
+            
+        Returns:
+            Dict[str, Any]: Analysis as returned by :meth:`analyze_frame`,
+            with ``image`` None
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        hand_ids = self.tracker.update(landmarks, handedness, timestamp)
+        for hand_id in self.tracker.expired:
+            self.forget_hand(hand_id)
+        if self.landmark_filter is not None and len(landmarks):
+            with self.profiler.stage("smoothing"):
+                landmarks = self.landmark_filter.filter(hand_ids, landmarks, timestamp)
         detected_gestures = []
+        # Static gestures of all hands at once
+        static_gestures = self.detect_gestures(landmarks, handedness)
         
-        if results.multi_hand_landmarks:
-            for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                # Draw hand landmarks
-                self.mp_draw.draw_landmarks(
-                    image,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS
-                )
-                
-                # Update hand trajectory
-                self.update_trajectory(idx, hand_landmarks)
-                
-                # Detect static gesture
-                static_gesture = self.detect_gesture(hand_landmarks)
-                if static_gesture:
-                    detected_gestures.append(static_gesture)
-                
-                # Detect dynamic gesture
-                dynamic_gesture = self.detect_dynamic_gesture(hand_landmarks)
-                if dynamic_gesture:
-                    detected_gestures.append(dynamic_gesture)
-                
-                # Check for custom gestures
-                custom_gesture = self.match_custom_gesture(hand_landmarks)
-                if custom_gesture:
-                    detected_gestures.append(f"Custom: {custom_gesture}")
-        
-        # Draw trajectories
-        image = self.draw_trajectories(image)
+        for hand_id, hand_landmarks, static_gesture in zip(hand_ids, landmarks, static_gestures):
+            # Update hand trajectory
+            self.update_trajectory(hand_id, hand_landmarks)
+            
+            if static_gesture:
+                detected_gestures.append(static_gesture)
+            
+            # Detect dynamic gesture
+            dynamic_gesture = self.detect_dynamic_gesture(hand_landmarks, timestamp, hand_id)
+            if dynamic_gesture:
+                detected_gestures.append(dynamic_gesture)
+            
+            # Check for custom gestures
+            custom_gesture = self.match_custom_gesture(hand_landmarks)
+            if custom_gesture:
+                detected_gestures.append(f"Custom: {custom_gesture}")
+            
+            # Check for custom motion gestures
+            motion_gesture = self.match_motion_gesture(hand_id)
+            if motion_gesture:
+                detected_gestures.append(f"Motion: {motion_gesture}")
         
         # Update gesture history
         if detected_gestures:
             self.gesture_history.extend(detected_gestures)
         
+        return {
+            "image": None,
+            "landmarks": landmarks,
+            "handedness": handedness,
+            "hand_ids": hand_ids,
+            "gestures": detected_gestures,
+            "predicted": False,
+            "trajectories": {
+                hand_id: trajectory.points().copy()
+                for hand_id, trajectory in self.trajectories.items()
+            },
+        }
+    
+    def forget_hand(self, hand_id: int) -> None:
+        """
+        Free the trajectory, dynamic gesture and smoothing state of a hand.
+        
+        Args:
+            hand_id (int): Track ID of a hand that is no longer visible
+        """
+        self.trajectories.pop(hand_id, None)
+        self.dynamic_gestures.forget(hand_id)
+        if self.landmark_filter is not None:
+            self.landmark_filter.forget(hand_id)
+    
+    def annotate_frame(self, analysis: Dict[str, Any]) -> np.ndarray:
+        """
+        Draw landmarks, trajectories and gesture history for an analysed frame.
+        
+        Args:
+            analysis (Dict[str, Any]): Result of :meth:`analyze_frame`
+            
+        Returns:
+            np.ndarray: Annotated frame (drawn in place on ``analysis["image"]``)
+        """
+        image = analysis["image"]
+        
+        # Draw hand landmarks (smoothed, predicted or mapped back from a
+        # crop); MediaPipe objects are only built for frames that are drawn
+        for hand in analysis["landmarks"]:
+            self.mp_draw.draw_landmarks(
+                image,
+                array_to_landmarks(hand),
+                self.mp_hands.HAND_CONNECTIONS
+            )
+        
+        # Draw trajectories of the hands in this frame
+        image = self.draw_trajectories(image, analysis.get("hand_ids"))
+        
         # Display gesture history
         self.draw_gesture_history(image)
         
-        return detected_gestures, image
+        return image
+    
+    def process_frame(self, frame: np.ndarray, annotate: bool = True) -> Tuple[List[str], np.ndarray]:
+        """
+        Process a video frame and detect gestures.
+        
+        Args:
+            frame (np.ndarray): Input video frame
+            annotate (bool): Draw landmarks, trajectories and history. When
+                False the flipped frame is returned untouched.
+            
+        Returns:
+            Tuple[List[str], np.ndarray]: List of detected gestures and annotated frame
+        """
+        analysis = self.analyze_frame(frame)
+        if annotate:
+            with self.profiler.stage("annotate"):
+                image = self.annotate_frame(analysis)
+        else:
+            image = analysis["image"]
+        return analysis["gestures"], image
     
     def handle_gesture_command(self, gesture: str, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -177,85 +458,58 @@ class GestureController:
         
         return state
     
-    def detect_dynamic_gesture(self, hand_landmarks) -> Optional[str]:
+    def detect_dynamic_gesture(self, hand_landmarks, timestamp: Optional[float] = None,
+                               hand_id: int = 0) -> Optional[str]:
         """
         Detect gestures based on hand movement.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
+            timestamp (Optional[float]): Capture time in seconds (defaults to now)
+            hand_id (int): Track ID of the hand, so hands move independently
             
         Returns:
             Optional[str]: Detected dynamic gesture name if any
         """
-        palm_pos = (hand_landmarks.landmark[0].x, hand_landmarks.landmark[0].y)
-        
-        if not self.gesture_start_time:
-            self.gesture_start_time = time.time()
-            self.gesture_positions = [palm_pos]
-            return None
-        
-        self.gesture_positions.append(palm_pos)
-        
-        if time.time() - self.gesture_start_time > self.dynamic_gesture_threshold:
-            # Analyze movement pattern
-            if len(self.gesture_positions) > 10:
-                dx = self.gesture_positions[-1][0] - self.gesture_positions[0][0]
-                dy = self.gesture_positions[-1][1] - self.gesture_positions[0][1]
-                
-                # Detect swipe gestures
-                if abs(dx) > 0.2:
-                    gesture = "Swipe Right" if dx > 0 else "Swipe Left"
-                elif abs(dy) > 0.2:
-                    gesture = "Swipe Down" if dy > 0 else "Swipe Up"
-                else:
-                    gesture = None
-                
-                # Reset tracking
-                self.gesture_start_time = None
-                self.gesture_positions = []
-                
-                return gesture
-        
-        return None
+        now = time.time() if timestamp is None else timestamp
+        return self.dynamic_gestures.update(hand_id, hand_landmarks, now)
     
     def update_trajectory(self, hand_id: int, landmarks) -> None:
         """
         Update the trajectory for a specific hand.
         
         Args:
-            hand_id (int): Unique identifier for the hand
-            landmarks: MediaPipe hand landmarks
+            hand_id (int): Track ID of the hand
+            landmarks: (21, 3) landmark array or MediaPipe hand landmarks
         """
         if hand_id not in self.trajectories:
-            self.trajectories[hand_id] = deque(maxlen=self.trajectory_length)
+            self.trajectories[hand_id] = TrajectoryBuffer(self.trajectory_length)
         
         # Track palm center
-        palm_center = np.mean([(landmarks.landmark[i].x, landmarks.landmark[i].y) 
-                             for i in [0, 5, 17]], axis=0)
+        palm_center = as_landmark_array(landmarks)[PALM_POINTS, :2].mean(axis=0)
         self.trajectories[hand_id].append(palm_center)
     
-    def draw_trajectories(self, image: np.ndarray) -> np.ndarray:
+    def draw_trajectories(self, image: np.ndarray,
+                          hand_ids: Optional[List[int]] = None) -> np.ndarray:
         """
         Draw hand movement trajectories on the image.
         
         Args:
             image (np.ndarray): Input image
+            hand_ids (Optional[List[int]]): Track IDs to draw (defaults to
+                every tracked hand, including ones not seen this frame)
             
         Returns:
             np.ndarray: Image with trajectories drawn
         """
-        h, w, _ = image.shape
-        
-        for hand_id, trajectory in self.trajectories.items():
-            points = np.array([(int(x * w), int(y * h)) for x, y in trajectory])
-            if len(points) > 1:
-                # Draw trajectory line with fading effect
-                for i in range(len(points) - 1):
-                    alpha = (i + 1) / len(points)
-                    color = (0, int(255 * alpha), int(255 * (1 - alpha)))
-                    cv2.line(image, tuple(points[i]), tuple(points[i + 1]), color, 2)
-        
-        return image
+        if hand_ids is None:
+            hand_ids = list(self.trajectories)
+        # Batched polylines with a fading colour per segment bucket
+        return self.trajectory_renderer.draw(
+            image,
+            (self.trajectories[hand_id].points() for hand_id in hand_ids
+             if hand_id in self.trajectories),
+        )
     
     def draw_gesture_history(self, image: np.ndarray) -> None:
         """
@@ -264,21 +518,8 @@ class GestureController:
         Args:
             image (np.ndarray): Input image
         """
-        h, w, _ = image.shape
-        y_offset = 30
-        
-        for i, gesture in enumerate(reversed(self.gesture_history)):
-            if i >= 5:  # Show only last 5 gestures
-                break
-            cv2.putText(
-                image,
-                f"Recent: {gesture}",
-                (10, y_offset + i * 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.6,
-                (0, 255, 0),
-                2
-            )
+        # Last 5 gestures, re-rendered only when they change
+        self.history_overlay.draw(image, self.gesture_history)
     
     def record_custom_gesture(self, name: str, landmarks) -> None:
         """
@@ -286,43 +527,100 @@ class GestureController:
         
         Args:
             name (str): Name of the custom gesture
-            landmarks: MediaPipe hand landmarks
+            landmarks: (21, 3) landmark array or MediaPipe hand landmarks
         """
-        # Store normalized landmark positions
-        gesture_pattern = [(lm.x, lm.y, lm.z) for lm in landmarks.landmark]
-        self.custom_gestures[name] = gesture_pattern
+        # Store landmark positions normalised for position, size and rotation
+        landmarks = as_landmark_array(landmarks)
+        self.custom_gestures.add(name, landmarks)
+        if self.gesture_library:
+            append_template(self.gesture_library, name, landmarks)
+    
+    def save_custom_gestures(self, path: str) -> None:
+        """
+        Save all custom gestures to a library file (rewriting it).
+        
+        Args:
+            path (str): Library path
+        """
+        save_templates(self.custom_gestures, path)
+    
+    def load_custom_gestures(self, path: str) -> None:
+        """
+        Replace the custom gestures with those stored in a library file.
+        
+        Args:
+            path (str): Library path
+        """
+        self.custom_gestures = load_templates(path)
     
     def match_custom_gesture(self, landmarks, threshold: float = 0.2) -> Optional[str]:
         """
         Try to match current hand pose with recorded custom gestures.
         
         Args:
-            landmarks: MediaPipe hand landmarks
-            threshold (float): Matching threshold
+            landmarks: (21, 3) landmark array or MediaPipe hand landmarks
+            threshold (float): Matching threshold, as a mean per-landmark
+                distance in palm lengths (wrist to middle-finger MCP)
             
         Returns:
             Optional[str]: Matched gesture name if found
         """
         if not self.custom_gestures:
             return None
-            
-        current_pattern = [(lm.x, lm.y, lm.z) for lm in landmarks.landmark]
         
-        best_match = None
-        min_distance = float('inf')
+        # One vectorised distance computation against all templates
+        best_match, _ = self.custom_gestures.match(as_landmark_array(landmarks), threshold)
+        return best_match
+    
+    def record_motion_gesture(self, name: str, points=None, hand_id: Optional[int] = None) -> None:
+        """
+        Record a motion gesture from a path or a hand's current trajectory.
+        
+        Args:
+            name (str): Gesture name
+            points: Path of shape (N, 2) (defaults to the trajectory of ``hand_id``)
+            hand_id (Optional[int]): Track ID of the hand whose trajectory
+                is recorded (defaults to the newest tracked hand)
+        """
+        if points is None:
+            if hand_id is None:
+                if not self.trajectories:
+                    raise ValueError("No hand trajectory to record")
+                hand_id = max(self.trajectories)
+            points = self.trajectories[hand_id].points().copy()
+        if len(points) < 2:
+            raise ValueError("A motion gesture needs at least two points")
+        self.motion_gestures.add(name, points)
+    
+    def match_motion_gesture(self, hand_id: int, threshold: float = 0.1) -> Optional[str]:
+        """
+        Match a hand's trajectory against the recorded motion gestures.
         
-        for name, pattern in self.custom_gestures.items():
-            # Calculate pattern similarity
-            distance = np.mean([np.sqrt(
-                (c[0] - p[0])**2 + (c[1] - p[1])**2 + (c[2] - p[2])**2
-            ) for c, p in zip(current_pattern, pattern)])
+        A match clears the trajectory, so each performance is reported once.
+        
+        Args:
+            hand_id (int): Track ID of the hand
+            threshold (float): Maximum RMS distance between DTW-aligned
+                points, in units of the trajectory's extent
             
-            if distance < threshold and distance < min_distance:
-                min_distance = distance
-                best_match = name
+        Returns:
+            Optional[str]: Matched gesture name if found
+        """
+        trajectory = self.trajectories.get(hand_id)
+        if not self.motion_gestures or trajectory is None or len(trajectory) < self.trajectory_length // 2:
+            return None
+        points = trajectory.points()
+        if np.ptp(points, axis=0).max() < self.min_motion:
+            return None  # Resting hand: normalising would only amplify jitter
         
+        best_match, _ = self.motion_gestures.match(points, threshold)
+        if best_match:
+            trajectory.clear()
         return best_match
     
     def close(self):
-        """Release MediaPipe resources."""
-        self.hands.close()
\ No newline at end of file
+        """Release MediaPipe resources owned by this controller."""
+        if self._owns_hands and self._hands is not None:
+            self._hands.close()
+        self._hands = None
+        self._owns_hands = False
\ No newline at end of file
@@ -1,25 +1,48 @@
 """Advanced gesture control features for system interaction."""
 
-import cv2
 import numpy as np
-import pyautogui
-import os
 from typing import Tuple, Dict, Any, Optional
+from src.actions import ActionDispatcher
+from src.drawing import DrawingCanvas
+from src.landmarks import (
+    INDEX_DIP,
+    INDEX_TIP,
+    MIDDLE_DIP,
+    MIDDLE_TIP,
+    PINKY_TIP,
+    THUMB_TIP,
+    as_landmark_array,
+)
+
+# Normal mode shortcuts (macOS key combinations). None of these poses
+# switches modes (see handle_mode_switch), so no gesture does both.
+SHORTCUTS = {
+    "1 Fingers": ("command", "space"),  # Spotlight
+    "Closed Fist": ("command", "w"),    # Close window
+    "2 Fingers": ("command", "tab"),    # App switcher
+    "3 Fingers": ("command", "m"),      # Minimize
+    "4 Fingers": ("command", "q"),      # Quit app
+}
 
 class GestureFeatures:
     """Provides advanced gesture-based control features."""
     
-    def __init__(self):
-        """Initialize gesture features."""
-        # Screen properties for mouse control
-        self.screen_width, self.screen_height = pyautogui.size()
-        pyautogui.FAILSAFE = False
+    def __init__(self, dispatcher: Optional[ActionDispatcher] = None):
+        """
+        Initialize gesture features.
+        
+        Args:
+            dispatcher (Optional[ActionDispatcher]): Performs mouse, keyboard
+                and volume actions off the frame loop (a desktop dispatcher
+                is created on first use when omitted)
+        """
+        self._dispatcher = dispatcher
+        self._screen_size: Optional[Tuple[int, int]] = None
         
         # Drawing properties
-        self.drawing_canvas = None
+        self.drawing_canvas = DrawingCanvas()
         self.drawing_color = (0, 255, 0)  # Default green
         self.drawing_thickness = 2
-        self.last_point = None
         
         # Volume control
         self.volume_min = 0
@@ -29,52 +52,66 @@ class GestureFeatures:
         # Mode tracking
         self.current_mode = "normal"  # normal, mouse, volume, drawing
         
+    @property
+    def dispatcher(self) -> ActionDispatcher:
+        """The action dispatcher (created on first access when not given)."""
+        if self._dispatcher is None:
+            self._dispatcher = ActionDispatcher()
+        return self._dispatcher
+    
+    @property
+    def screen_size(self) -> Tuple[int, int]:
+        """Screen width and height in pixels, read once from the backend."""
+        if self._screen_size is None:
+            self._screen_size = self.dispatcher.backend.screen_size()
+        return self._screen_size
+    
     def init_drawing_canvas(self, frame_shape: Tuple[int, int, int]) -> None:
         """
-        Initialize the drawing canvas.
+        Size the drawing canvas to the video frame (strokes are kept).
         
         Args:
             frame_shape: Shape of the video frame (height, width, channels)
         """
-        if self.drawing_canvas is None:
-            self.drawing_canvas = np.zeros(frame_shape, dtype=np.uint8)
+        self.drawing_canvas.resize(frame_shape)
     
     def handle_mouse_control(self, hand_landmarks, frame_shape: Tuple[int, int]) -> None:
         """
         Control mouse using hand position.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
             frame_shape: Shape of the video frame (height, width)
         """
+        landmarks = as_landmark_array(hand_landmarks)
+        
         # Get index finger tip position
-        index_tip = hand_landmarks.landmark[8]
+        index_tip = landmarks[INDEX_TIP]
         
         # Convert coordinates to screen position
-        screen_x = int(index_tip.x * self.screen_width)
-        screen_y = int(index_tip.y * self.screen_height)
+        screen_width, screen_height = self.screen_size
+        screen_x = int(index_tip[0] * screen_width)
+        screen_y = int(index_tip[1] * screen_height)
         
-        # Move mouse
-        pyautogui.moveTo(screen_x, screen_y, duration=0.1)
+        # Move mouse (only the newest pending target is performed)
+        self.dispatcher.move(screen_x, screen_y)
         
-        # Check for click gesture (thumb and index finger pinch)
-        thumb_tip = hand_landmarks.landmark[4]
-        if self._calculate_distance(thumb_tip, index_tip) < 0.05:
-            pyautogui.click()
+        # Check for click gesture (thumb and index finger pinch); a held
+        # pinch clicks once
+        if self._calculate_distance(landmarks[THUMB_TIP], index_tip) < 0.05:
+            self.dispatcher.click()
     
     def handle_volume_control(self, hand_landmarks) -> None:
         """
         Control system volume using hand position.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
         """
-        # Get thumb and pinky positions for volume control
-        thumb_tip = hand_landmarks.landmark[4]
-        pinky_tip = hand_landmarks.landmark[20]
+        landmarks = as_landmark_array(hand_landmarks)
         
-        # Calculate distance for volume level
-        distance = self._calculate_distance(thumb_tip, pinky_tip)
+        # Calculate thumb-pinky distance for volume level
+        distance = self._calculate_distance(landmarks[THUMB_TIP], landmarks[PINKY_TIP])
         
         # Map distance to volume (0-100)
         volume = int(max(0, min(100, distance * 200)))
@@ -82,45 +119,34 @@ class GestureFeatures:
         # Set system volume
         if abs(volume - self.current_volume) > 5:  # Prevent tiny adjustments
             self.current_volume = volume
-            os.system(f"osascript -e 'set volume output volume {volume}'")
+            self.dispatcher.set_volume(volume)
     
     def handle_drawing(self, hand_landmarks, frame: np.ndarray) -> np.ndarray:
         """
         Handle virtual drawing using hand gestures.
         
         Args:
-            hand_landmarks: MediaPipe hand landmarks
-            frame: Input video frame
+            hand_landmarks: (21, 3) landmark array or MediaPipe hand landmarks
+            frame: Input video frame (the drawing is blended into it in place)
             
         Returns:
             np.ndarray: Frame with drawing overlay
         """
-        self.init_drawing_canvas(frame.shape)
-        
-        # Get index finger tip position
-        index_tip = hand_landmarks.landmark[8]
-        point = (
-            int(index_tip.x * frame.shape[1]),
-            int(index_tip.y * frame.shape[0])
-        )
+        canvas = self.drawing_canvas
+        canvas.resize(frame.shape)
+        landmarks = as_landmark_array(hand_landmarks)
         
         # Draw if index finger is up and middle finger is down
-        if (hand_landmarks.landmark[8].y < hand_landmarks.landmark[7].y and 
-            hand_landmarks.landmark[12].y > hand_landmarks.landmark[11].y):
-            if self.last_point is not None:
-                cv2.line(
-                    self.drawing_canvas,
-                    self.last_point,
-                    point,
-                    self.drawing_color,
-                    self.drawing_thickness
-                )
-            self.last_point = point
+        if (landmarks[INDEX_TIP, 1] < landmarks[INDEX_DIP, 1] and 
+            landmarks[MIDDLE_TIP, 1] > landmarks[MIDDLE_DIP, 1]):
+            if not canvas.drawing:
+                canvas.begin_stroke(self.drawing_color, self.drawing_thickness)
+            canvas.add_point(landmarks[INDEX_TIP, 0], landmarks[INDEX_TIP, 1])
         else:
-            self.last_point = None
+            canvas.end_stroke()
         
-        # Combine frame with drawing
-        return cv2.addWeighted(frame, 1, self.drawing_canvas, 0.5, 0)
+        # Combine frame with drawing, touching only tiles that hold ink
+        return canvas.composite(frame)
     
     def handle_shortcuts(self, gesture: str) -> None:
         """
@@ -129,21 +155,14 @@ class GestureFeatures:
         Args:
             gesture: Detected gesture name
         """
-        shortcuts = {
-            "Open Palm": lambda: pyautogui.hotkey('command', 'space'),  # Spotlight
-            "Closed Fist": lambda: pyautogui.hotkey('command', 'w'),    # Close window
-            "2 Fingers": lambda: pyautogui.hotkey('command', 'tab'),    # App switcher
-            "3 Fingers": lambda: pyautogui.hotkey('command', 'm'),      # Minimize
-            "4 Fingers": lambda: pyautogui.hotkey('command', 'q'),      # Quit app
-        }
-        
-        if gesture in shortcuts:
-            shortcuts[gesture]()
+        keys = SHORTCUTS.get(gesture)
+        if keys is not None:
+            # Debounced and rate-limited, so a held gesture fires once
+            self.dispatcher.hotkey(*keys)
     
     def clear_drawing(self) -> None:
         """Clear the drawing canvas."""
-        if self.drawing_canvas is not None:
-            self.drawing_canvas.fill(0)
+        self.drawing_canvas.clear()
     
     def change_drawing_color(self) -> None:
         """Cycle through drawing colors."""
@@ -156,21 +175,20 @@ class GestureFeatures:
         ]
         current_index = colors.index(self.drawing_color)
         self.drawing_color = colors[(current_index + 1) % len(colors)]
+        self.drawing_canvas.end_stroke()  # Continue in the new colour
     
     def _calculate_distance(self, point1, point2) -> float:
         """
         Calculate Euclidean distance between two points.
         
         Args:
-            point1: First point
-            point2: Second point
+            point1: First point (x, y, z)
+            point2: Second point (x, y, z)
             
         Returns:
             float: Distance between points
         """
-        return ((point1.x - point2.x) ** 2 + 
-                (point1.y - point2.y) ** 2 + 
-                (point1.z - point2.z) ** 2) ** 0.5
+        return float(np.linalg.norm(np.subtract(point1, point2)))
     
     def handle_mode_switch(self, gesture: str) -> None:
         """
@@ -180,7 +198,7 @@ class GestureFeatures:
             gesture: Detected gesture name
         """
         mode_gestures = {
-            "5 Fingers Up": "normal",
+            "Open Palm": "normal",
             "Pinch": "mouse",
             "Victory": "volume",
             "ILY": "drawing"
@@ -0,0 +1,210 @@
+"""Persistent, memory-mapped storage for custom gesture templates.
+
+A library is two files:
+
+* ``<path>``: a 16-byte header followed by float32 (21, 3) templates,
+  already normalised, one after another;
+* ``<path>.names``: one UTF-8 template name per line, in the same order.
+
+Recording a gesture writes a single record: new names are appended and a
+name recorded again overwrites its record in place, so a library holds no
+duplicates. Loading memory-maps the template file read-only: every process
+sharing a library uses the same page-cache copy. Writers take an exclusive
+lock on ``<path>.lock`` (where ``fcntl`` is available), so processes can
+record into a shared library concurrently.
+"""
+
+import os
+import struct
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are not serialised
+    fcntl = None
+
+import numpy as np
+
+from src.gesture_templates import GestureTemplates, normalize_landmarks
+from src.landmarks import NUM_LANDMARKS
+
+MAGIC = b"GTPL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHH6x")  # magic, version, landmarks, dims
+RECORD_SIZE = NUM_LANDMARKS * 3 * 4
+
+
+def _names_path(path: str) -> str:
+    return f"{path}.names"
+
+
+def _write_header(handle) -> None:
+    handle.write(HEADER.pack(MAGIC, VERSION, NUM_LANDMARKS, 3))
+
+
+def _check_header(path: str) -> None:
+    with open(path, "rb") as handle:
+        header = handle.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is not a gesture library (truncated header)")
+    magic, version, landmarks, dims = HEADER.unpack(header)
+    if magic != MAGIC or (landmarks, dims) != (NUM_LANDMARKS, 3):
+        raise ValueError(f"{path} is not a gesture library")
+    if version != VERSION:
+        raise ValueError(f"Unsupported gesture library version {version}")
+
+
+def _validate_name(name: str) -> None:
+    if not name or "\n" in name or "\r" in name:
+        raise ValueError(f"Invalid gesture name {name!r}")
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[None]:
+    # Sidecar lock: save_templates replaces the data file, so locking the
+    # file itself would not exclude writers that opened the new one
+    with open(f"{path}.lock", "a") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _discard_partial_appends(path: str) -> List[str]:
+    # Truncate both files to the records that have a complete name, so the
+    # next append lines up; otherwise an orphaned record from a crashed
+    # append would shift every later name onto the wrong template. Returns
+    # the names kept.
+    names_file = _names_path(path)
+    lines = []
+    if os.path.exists(names_file):
+        with open(names_file, "rb") as handle:
+            lines = [line for line in handle.read().splitlines(keepends=True)
+                     if line.endswith(b"\n")]
+    records = (os.path.getsize(path) - HEADER.size) // RECORD_SIZE
+    count = min(len(lines), records)
+    os.truncate(path, HEADER.size + count * RECORD_SIZE)
+    if os.path.exists(names_file):
+        os.truncate(names_file, sum(len(line) for line in lines[:count]))
+    return [line[:-1].decode("utf-8") for line in lines[:count]]
+
+
+def save_templates(templates: GestureTemplates, path: str) -> None:
+    """
+    Write a complete library, replacing (and compacting) any existing one.
+
+    Args:
+        templates (GestureTemplates): Templates to store
+        path (str): Library path
+    """
+    for name in templates.names:
+        _validate_name(name)
+
+    with _locked(path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as handle:
+            _write_header(handle)
+            handle.write(np.ascontiguousarray(templates.templates, dtype="<f4").tobytes())
+        with open(_names_path(tmp), "w", encoding="utf-8") as handle:
+            handle.writelines(f"{name}\n" for name in templates.names)
+
+        # Each file is replaced atomically, the pair is not; the lock keeps
+        # appends out until both are in place
+        os.replace(_names_path(tmp), _names_path(path))
+        os.replace(tmp, path)
+
+
+def append_template(path: str, name: str, landmarks) -> None:
+    """
+    Record one template without rewriting the library.
+
+    A new name is appended; a name already in the library has its record
+    overwritten in place. Creates the library if it does not exist yet.
+
+    Args:
+        path (str): Library path
+        name (str): Template name
+        landmarks: Raw (21, 3) landmarks (normalised before writing)
+    """
+    _validate_name(name)
+    record = normalize_landmarks(landmarks).astype("<f4").tobytes()
+
+    with _locked(path):
+        names: List[str] = []
+        if not os.path.exists(path):
+            with open(path, "wb") as handle:
+                _write_header(handle)
+        else:
+            _check_header(path)
+            names = _discard_partial_appends(path)
+
+        if name in names:
+            # Re-recorded: replace the name's last record, keeping one per name
+            slot = len(names) - 1 - names[::-1].index(name)
+            with open(path, "r+b") as handle:
+                handle.seek(HEADER.size + slot * RECORD_SIZE)
+                handle.write(record)
+            return
+
+        # Template before name, so a crash leaves at most an unnamed record,
+        # which the next append discards
+        with open(path, "ab") as handle:
+            handle.write(record)
+        with open(_names_path(path), "a", encoding="utf-8") as handle:
+            handle.write(f"{name}\n")
+
+
+def read_library(path: str, mmap: bool = True) -> Tuple[List[str], np.ndarray]:
+    """
+    Read a library's names and templates.
+
+    Args:
+        path (str): Library path
+        mmap (bool): Memory-map the templates read-only instead of reading them
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Names and (T, 21, 3) float32 templates
+    """
+    _check_header(path)
+    names_file = _names_path(path)
+    if os.path.exists(names_file):
+        with open(names_file, encoding="utf-8") as handle:
+            names = handle.read().splitlines()
+    else:
+        names = []
+
+    # Ignore a partially written trailing record or an unnamed template
+    count = min(len(names), (os.path.getsize(path) - HEADER.size) // RECORD_SIZE)
+    names = names[:count]
+    shape = (count, NUM_LANDMARKS, 3)
+    if count == 0:
+        return names, np.empty(shape, dtype=np.float32)
+    if mmap:
+        return names, np.memmap(path, dtype="<f4", mode="r", offset=HEADER.size, shape=shape)
+    with open(path, "rb") as handle:
+        handle.seek(HEADER.size)
+        data = handle.read(count * RECORD_SIZE)
+    return names, np.frombuffer(data, dtype="<f4").reshape(shape).copy()
+
+
+def load_templates(path: str, mmap: bool = True, **kwargs) -> GestureTemplates:
+    """
+    Load a library as a template set.
+
+    With ``mmap`` the templates stay shared and read-only until the set is
+    modified, at which point that process gets a private copy.
+
+    Args:
+        path (str): Library path
+        mmap (bool): Memory-map the template file
+        **kwargs: Options forwarded to :class:`GestureTemplates`
+
+    Returns:
+        GestureTemplates: Loaded templates
+    """
+    names, templates = read_library(path, mmap=mmap)
+    return GestureTemplates.from_arrays(names, templates, **kwargs)
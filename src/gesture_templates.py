@@ -0,0 +1,234 @@
+"""Vectorised custom gesture templates with an optional PCA index."""
+
+import numpy as np
+from typing import Iterator, List, Optional, Tuple
+from src.landmarks import MIDDLE_MCP, NUM_LANDMARKS, WRIST
+
+
+def normalize_landmarks(landmarks: np.ndarray) -> np.ndarray:
+    """
+    Normalise hands for translation, scale and in-plane rotation.
+
+    The wrist is moved to the origin, the hand is scaled so the wrist to
+    middle-finger MCP distance is 1, and rotated about the wrist so that
+    vector points straight up (negative y).
+
+    Args:
+        landmarks (np.ndarray): Array of shape (21, 3) or (N, 21, 3)
+
+    Returns:
+        np.ndarray: float32 array of the same shape
+    """
+    hands = np.asarray(landmarks, dtype=np.float32)
+    single = hands.ndim == 2
+    if single:
+        hands = hands[None]
+
+    centered = hands - hands[:, WRIST:WRIST + 1]
+    axis = centered[:, MIDDLE_MCP, :2]
+    scale = np.linalg.norm(axis, axis=1)
+    scale[scale < 1e-6] = 1.0
+
+    # Rotation taking the wrist->middle MCP direction onto (0, -1)
+    cos = -axis[:, 1] / scale
+    sin = -axis[:, 0] / scale
+    x, y = centered[..., 0], centered[..., 1]
+    normalized = np.empty_like(centered)
+    normalized[..., 0] = cos[:, None] * x - sin[:, None] * y
+    normalized[..., 1] = sin[:, None] * x + cos[:, None] * y
+    normalized[..., 2] = centered[..., 2]
+    normalized /= scale[:, None, None]
+
+    return normalized[0] if single else normalized
+
+
+class GestureTemplates:
+    """
+    Named hand pose templates stored in one contiguous (T, 21, 3) array.
+
+    Matching computes the mean per-landmark distance to every template in a
+    single vectorised operation. Once there are ``index_threshold`` or more
+    templates, a PCA projection ranks templates first and only the closest
+    ``candidates`` are scored exactly.
+    """
+
+    def __init__(self, capacity: int = 16, index_threshold: int = 512,
+                 index_dims: int = 16, candidates: int = 32):
+        """
+        Initialize an empty template set.
+
+        Args:
+            capacity (int): Initial number of template slots
+            index_threshold (int): Template count at which the PCA index is used
+            index_dims (int): Number of PCA components kept by the index
+            candidates (int): Templates scored exactly after PCA ranking
+        """
+        self._templates = np.empty((capacity, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._names: List[str] = []
+        self._slots = {}
+        self.index_threshold = index_threshold
+        self.index_dims = index_dims
+        self.candidates = candidates
+        self._index: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_arrays(cls, names: List[str], templates: np.ndarray, **kwargs) -> "GestureTemplates":
+        """
+        Wrap already-normalised templates without copying them.
+
+        ``templates`` may be a read-only memory map; it is copied only when
+        the set is modified. Duplicate names keep their last template; that
+        copies the kept templates, so libraries are written without them.
+
+        Args:
+            names (List[str]): Template names
+            templates (np.ndarray): Normalised templates of shape (T, 21, 3)
+            **kwargs: Options forwarded to the constructor
+
+        Returns:
+            GestureTemplates: Template set backed by ``templates``
+        """
+        instance = cls(capacity=0, **kwargs)
+        slots = {name: slot for slot, name in enumerate(names)}
+        if len(slots) != len(names):
+            keep = sorted(slots.values())
+            names = [names[slot] for slot in keep]
+            templates = templates[keep]
+            slots = {name: slot for slot, name in enumerate(names)}
+        instance._templates = templates
+        instance._names = list(names)
+        instance._slots = slots
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    @property
+    def names(self) -> List[str]:
+        """Template names in storage order."""
+        return list(self._names)
+
+    @property
+    def templates(self) -> np.ndarray:
+        """Normalised templates, shape (T, 21, 3) (a view, do not modify)."""
+        return self._templates[:len(self._names)]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._templates[self._slots[name]]
+
+    def add(self, name: str, landmarks) -> None:
+        """
+        Add or replace a template.
+
+        Args:
+            name (str): Template name
+            landmarks: (21, 3) landmark array (raw, normalised on insert)
+        """
+        template = normalize_landmarks(landmarks)
+        count = len(self._names)
+        if not self._templates.flags.writeable:
+            # Detach from a shared read-only mapping before the first change
+            self._grow(count + 1)
+        if name in self._slots:
+            self._templates[self._slots[name]] = template
+        else:
+            if count == len(self._templates):
+                self._grow(max(2 * count, 1))
+            self._templates[count] = template
+            self._slots[name] = count
+            self._names.append(name)
+        self._index = None
+
+    def _grow(self, capacity: int) -> None:
+        count = len(self._names)
+        grown = np.empty((capacity, NUM_LANDMARKS, 3), dtype=np.float32)
+        grown[:count] = self._templates[:count]
+        self._templates = grown
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a template.
+
+        Args:
+            name (str): Template name
+        """
+        if not self._templates.flags.writeable:
+            self._grow(len(self._names))
+        slot = self._slots.pop(name)
+        last = len(self._names) - 1
+        if slot != last:
+            # Keep storage contiguous by moving the last template into the gap
+            moved = self._names[last]
+            self._templates[slot] = self._templates[last]
+            self._names[slot] = moved
+            self._slots[moved] = slot
+        self._names.pop()
+        self._index = None
+
+    def clear(self) -> None:
+        """Remove every template."""
+        self._names.clear()
+        self._slots.clear()
+        self._index = None
+
+    def _build_index(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        flat = self.templates.reshape(len(self), -1)
+        mean = flat.mean(axis=0)
+        # Principal axes from the SVD of the centred templates
+        _, _, vt = np.linalg.svd(flat - mean, full_matrices=False)
+        components = np.ascontiguousarray(vt[:self.index_dims].T)
+        return mean, components, (flat - mean) @ components
+
+    def distances(self, landmarks) -> np.ndarray:
+        """
+        Mean per-landmark distance from a hand to every template.
+
+        Args:
+            landmarks: (21, 3) landmark array
+
+        Returns:
+            np.ndarray: Distances of shape (T,)
+        """
+        query = normalize_landmarks(landmarks)
+        return np.linalg.norm(self.templates - query, axis=2).mean(axis=1)
+
+    def match(self, landmarks, threshold: float) -> Tuple[Optional[str], float]:
+        """
+        Find the closest template within ``threshold``.
+
+        Args:
+            landmarks: (21, 3) landmark array
+            threshold (float): Maximum mean per-landmark distance (in hand units)
+
+        Returns:
+            Tuple[Optional[str], float]: Matched name (or None) and its distance
+        """
+        count = len(self)
+        if not count:
+            return None, float("inf")
+
+        query = normalize_landmarks(landmarks)
+        if count < self.index_threshold or count <= self.candidates:
+            distances = np.linalg.norm(self.templates - query, axis=2).mean(axis=1)
+            candidates = None
+        else:
+            if self._index is None:
+                self._index = self._build_index()
+            mean, components, projected = self._index
+            approx = projected - (query.reshape(-1) - mean) @ components
+            approx = np.einsum("ij,ij->i", approx, approx)
+            candidates = np.argpartition(approx, self.candidates)[:self.candidates]
+            distances = np.linalg.norm(self.templates[candidates] - query, axis=2).mean(axis=1)
+
+        best = int(np.argmin(distances))
+        distance = float(distances[best])
+        if distance >= threshold:
+            return None, distance
+        slot = best if candidates is None else int(candidates[best])
+        return self._names[slot], distance
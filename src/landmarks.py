@@ -0,0 +1,86 @@
+"""NumPy representation of MediaPipe hand landmarks."""
+
+import numpy as np
+from typing import Sequence
+
+# Landmark indices (MediaPipe hand model)
+NUM_LANDMARKS = 21
+WRIST = 0
+THUMB_IP, THUMB_TIP = 3, 4
+INDEX_MCP, INDEX_PIP, INDEX_DIP, INDEX_TIP = 5, 6, 7, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_DIP, MIDDLE_TIP = 9, 10, 11, 12
+PINKY_MCP, PINKY_TIP = 17, 20
+
+FINGER_TIPS = np.array([8, 12, 16, 20])  # Finger tips (except thumb)
+FINGER_PIPS = FINGER_TIPS - 2
+PALM_POINTS = np.array([WRIST, INDEX_MCP, PINKY_MCP])
+
+
+def landmarks_to_array(hand_landmarks) -> np.ndarray:
+    """
+    Convert one MediaPipe hand to a landmark array.
+
+    Args:
+        hand_landmarks: MediaPipe ``NormalizedLandmarkList``
+
+    Returns:
+        np.ndarray: float32 array of shape (21, 3) with x, y, z per landmark
+    """
+    return np.array(
+        [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark],
+        dtype=np.float32
+    )
+
+
+def hands_to_array(multi_hand_landmarks: Sequence) -> np.ndarray:
+    """
+    Convert all detected hands to a batched landmark array.
+
+    Args:
+        multi_hand_landmarks: Sequence of MediaPipe hands (may be None or empty)
+
+    Returns:
+        np.ndarray: float32 array of shape (hands, 21, 3)
+    """
+    if not multi_hand_landmarks:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.array(
+        [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in multi_hand_landmarks],
+        dtype=np.float32
+    )
+
+
+def as_landmark_array(landmarks) -> np.ndarray:
+    """
+    Accept either a landmark array or a MediaPipe hand and return an array.
+
+    Arrays are returned as-is (no copy) so callers can pass the per-frame
+    array around freely; MediaPipe objects are converted.
+
+    Args:
+        landmarks: (21, 3) array-like or MediaPipe ``NormalizedLandmarkList``
+
+    Returns:
+        np.ndarray: Array of shape (21, 3)
+    """
+    if hasattr(landmarks, "landmark"):
+        return landmarks_to_array(landmarks)
+    return np.asarray(landmarks)
+
+
+def array_to_landmarks(landmarks: np.ndarray):
+    """
+    Convert a landmark array back to a MediaPipe hand (for drawing).
+
+    Args:
+        landmarks (np.ndarray): Array of shape (21, 3)
+
+    Returns:
+        MediaPipe ``NormalizedLandmarkList``
+    """
+    from mediapipe.framework.formats import landmark_pb2
+
+    hand = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in np.asarray(landmarks, dtype=np.float64):
+        hand.landmark.add(x=x, y=y, z=z)
+    return hand
@@ -0,0 +1,278 @@
+"""Motion gesture templates matched with banded DTW and LB_Keogh pruning."""
+
+import math
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+def normalize_trajectory(points, length: int = 32) -> np.ndarray:
+    """
+    Normalise a 2D path for position, size and drawing speed.
+
+    The path is resampled to ``length`` points evenly spaced along its arc
+    length, centred on its mean and scaled so its larger bounding-box side
+    is 1 (preserving aspect ratio, so a wave differs from a circle).
+
+    Args:
+        points: Path of shape (N, 2), N >= 2
+        length (int): Number of output points
+
+    Returns:
+        np.ndarray: float32 array of shape (length, 2)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    steps = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    distance = np.concatenate([[0.0], np.cumsum(steps)])
+    if distance[-1] <= 0:
+        return np.zeros((length, 2), dtype=np.float32)
+    samples = np.linspace(0.0, distance[-1], length)
+    resampled = np.column_stack([np.interp(samples, distance, points[:, 0]),
+                                 np.interp(samples, distance, points[:, 1])])
+    resampled -= resampled.mean(axis=0)
+    extent = np.ptp(resampled, axis=0).max()
+    return (resampled / extent).astype(np.float32)
+
+
+def _envelope(templates: np.ndarray, band: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Running min/max of templates (T, L, 2) over +-``band`` samples."""
+    padded = np.pad(templates, ((0, 0), (band, band), (0, 0)), mode="edge")
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * band + 1, axis=1)
+    return windows.min(axis=3), windows.max(axis=3)
+
+
+class MotionTemplates:
+    """
+    Named trajectory templates stored in one contiguous (T, L, 2) array.
+
+    Matching is Dynamic Time Warping restricted to a Sakoe-Chiba band of
+    ``band`` (a fraction of L) around the diagonal. An LB_Keogh lower bound
+    against every template's precomputed envelope is evaluated in one
+    vectorised step. Templates are then scored exactly in order of their
+    bound, a batch at a time, until the next bound exceeds the best
+    distance found. Hundreds of templates usually cost one batch.
+    """
+
+    def __init__(self, length: int = 32, band: float = 0.1, batch: int = 16,
+                 capacity: int = 16):
+        """
+        Initialize an empty template set.
+
+        Args:
+            length (int): Points every path is resampled to
+            band (float): Sakoe-Chiba band half-width as a fraction of ``length``
+            batch (int): Templates scored by DTW together
+            capacity (int): Initial number of template slots
+        """
+        self.length = length
+        self.band = max(int(math.ceil(band * length)), 1)
+        self.batch = batch
+        self._templates = np.empty((capacity, length, 2), dtype=np.float32)
+        self._lower = np.empty_like(self._templates)
+        self._upper = np.empty_like(self._templates)
+        self._names: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._layout = self._band_layout()
+
+    def _band_layout(self) -> np.ndarray:
+        # Band cells by anti-diagonal d = i + j and offset i - j, so every
+        # DTW predecessor is a plain slice: (i-1, j) and (i, j-1) sit on
+        # diagonal d - 1 at offsets -1 and +1, (i-1, j-1) on d - 2. Each
+        # entry indexes the flattened (L+1, L+1) pair cost table; cells off
+        # the grid (or of the wrong parity) point past its end, at infinity.
+        size, band = self.length, self.band
+        d = np.arange(2 * size + 1)[:, None]
+        k = np.arange(-band - 1, band + 2)[None, :]
+        i, j = (d + k) // 2, (d - k) // 2
+        valid = ((d + k) % 2 == 0) & (i >= 0) & (j >= 0) & (i <= size) & (j <= size)
+        valid[:, [0, -1]] = False  # Padding columns
+        return np.where(valid, i * (size + 1) + j, (size + 1) ** 2)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    @property
+    def names(self) -> List[str]:
+        """Template names in storage order."""
+        return list(self._names)
+
+    @property
+    def templates(self) -> np.ndarray:
+        """Normalised templates, shape (T, L, 2) (a view, do not modify)."""
+        return self._templates[:len(self._names)]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._templates[self._slots[name]]
+
+    def add(self, name: str, points) -> None:
+        """
+        Add or replace a template.
+
+        Args:
+            name (str): Template name
+            points: Path of shape (N, 2) (raw, normalised on insert)
+        """
+        template = normalize_trajectory(points, self.length)
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = len(self._names)
+            if slot == len(self._templates):
+                self._grow(max(2 * slot, 1))
+            self._slots[name] = slot
+            self._names.append(name)
+        self._templates[slot] = template
+        lower, upper = _envelope(template[None], self.band)
+        self._lower[slot], self._upper[slot] = lower[0], upper[0]
+
+    def _grow(self, capacity: int) -> None:
+        count = len(self._names)
+        for attr in ("_templates", "_lower", "_upper"):
+            grown = np.empty((capacity, self.length, 2), dtype=np.float32)
+            grown[:count] = getattr(self, attr)[:count]
+            setattr(self, attr, grown)
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a template.
+
+        Args:
+            name (str): Template name
+        """
+        slot = self._slots.pop(name)
+        last = len(self._names) - 1
+        if slot != last:
+            # Keep storage contiguous by moving the last template into the gap
+            moved = self._names[last]
+            for array in (self._templates, self._lower, self._upper):
+                array[slot] = array[last]
+            self._names[slot] = moved
+            self._slots[moved] = slot
+        self._names.pop()
+
+    def clear(self) -> None:
+        """Remove every template."""
+        self._names.clear()
+        self._slots.clear()
+
+    def save(self, path: str) -> None:
+        """
+        Write the templates to a ``.npz`` file.
+
+        Args:
+            path (str): Output path
+        """
+        np.savez(path, names=np.array(self._names), templates=self.templates)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "MotionTemplates":
+        """
+        Read templates written by :meth:`save`.
+
+        Args:
+            path (str): Input path
+            **kwargs: Options forwarded to the constructor
+
+        Returns:
+            MotionTemplates: Loaded template set
+        """
+        with np.load(path) as data:
+            names, templates = list(data["names"]), data["templates"]
+        instance = cls(length=templates.shape[1], capacity=max(len(names), 1), **kwargs)
+        instance._templates[:len(names)] = templates
+        instance._lower[:len(names)], instance._upper[:len(names)] = _envelope(templates, instance.band)
+        instance._names = [str(name) for name in names]
+        instance._slots = {name: slot for slot, name in enumerate(instance._names)}
+        return instance
+
+    def lower_bounds(self, query: np.ndarray) -> np.ndarray:
+        """
+        LB_Keogh bound of the squared DTW cost to every template.
+
+        Args:
+            query (np.ndarray): Normalised path of shape (L, 2)
+
+        Returns:
+            np.ndarray: Bounds of shape (T,)
+        """
+        count = len(self)
+        query = query.reshape(-1)
+        upper = self._upper[:count].reshape(count, -1)
+        lower = self._lower[:count].reshape(count, -1)
+        # The envelope contains the template, so at most one side is positive
+        excess = np.maximum(np.maximum(query - upper, lower - query), 0)
+        return np.einsum("ij,ij->i", excess, excess)
+
+    def dtw(self, query: np.ndarray, slots: np.ndarray) -> np.ndarray:
+        """
+        Banded DTW cost (sum of squared point distances) to some templates.
+
+        The templates are scored together: the cost table is filled one
+        anti-diagonal at a time, vectorised over the band and templates.
+
+        Args:
+            query (np.ndarray): Normalised path of shape (L, 2)
+            slots (np.ndarray): Template slots to score
+
+        Returns:
+            np.ndarray: Costs of shape (len(slots),)
+        """
+        size, count = self.length, len(slots)
+        templates = self._templates[slots]
+        # Squared distances of every point pair, with an infinite border
+        # (row and column 0, except the origin) and one infinite sentinel
+        pairs = np.full(((size + 1) ** 2 + 1, count), np.inf, dtype=np.float32)
+        grid = pairs[:-1].reshape(size + 1, size + 1, count)
+        points = templates.transpose(2, 1, 0)  # (2, L, templates)
+        grid[1:, 1:] = ((query[:, 0, None, None] - points[0]) ** 2
+                        + (query[:, 1, None, None] - points[1]) ** 2)
+        grid[0, 0] = 0.0
+
+        table = pairs[self._layout]  # (2L + 1, 2 * band + 3, templates)
+        step = np.empty_like(table[0, 1:-1])
+        for d in range(2, 2 * size + 1):
+            np.minimum(table[d - 1, :-2], table[d - 1, 2:], out=step)
+            np.minimum(step, table[d - 2, 1:-1], out=step)
+            table[d, 1:-1] += step
+        return table[-1, self.band + 1]
+
+    def match(self, points, threshold: float) -> Tuple[Optional[str], float]:
+        """
+        Find the closest template within ``threshold``.
+
+        Args:
+            points: Path of shape (N, 2)
+            threshold (float): Maximum RMS distance between aligned points,
+                in units of the path's extent
+
+        Returns:
+            Tuple[Optional[str], float]: Matched name (or None) and its distance
+        """
+        count = len(self)
+        if not count:
+            return None, float("inf")
+
+        query = normalize_trajectory(points, self.length)
+        bounds = self.lower_bounds(query)
+        order = np.argsort(bounds)
+        # Costs are squared sums over at least L aligned pairs
+        limit = threshold ** 2 * self.length
+        best_slot, best_cost = -1, float("inf")
+        for start in range(0, count, self.batch):
+            slots = order[start:start + self.batch]
+            if bounds[slots[0]] >= min(best_cost, limit):
+                break  # Every remaining template is provably worse
+            costs = self.dtw(query, slots)
+            best = int(np.argmin(costs))
+            if costs[best] < best_cost:
+                best_slot, best_cost = int(slots[best]), float(costs[best])
+
+        distance = math.sqrt(best_cost / self.length)
+        if best_slot < 0 or distance >= threshold:
+            return None, distance
+        return self._names[best_slot], distance
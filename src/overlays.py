@@ -0,0 +1,197 @@
+"""Trajectory buffers and cached annotation overlays."""
+
+import itertools
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+
+class TrajectoryBuffer:
+    """
+    Preallocated ring buffer of 2D points.
+
+    Every point is written twice, ``capacity`` rows apart, so the points in
+    order are always one contiguous slice and reading them never copies.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            capacity (int): Points kept; older ones are overwritten
+        """
+        self.capacity = capacity
+        self._data = np.zeros((2 * capacity, 2), dtype=np.float32)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(self, point) -> None:
+        """
+        Add a point, overwriting the oldest when full.
+
+        Args:
+            point: (x, y) in normalised frame units
+        """
+        head = self._count % self.capacity
+        self._data[head] = self._data[head + self.capacity] = point
+        self._count += 1
+
+    def points(self) -> np.ndarray:
+        """
+        The points, oldest first.
+
+        Returns:
+            np.ndarray: float32 view of shape (len, 2), valid until the next append
+        """
+        end = (self._count - 1) % self.capacity + self.capacity + 1
+        return self._data[end - len(self):end]
+
+    def __array__(self, dtype=None, copy=None):
+        points = self.points()
+        return points.astype(dtype) if dtype is not None else points.copy()
+
+    def __getitem__(self, index):
+        return self.points()[index]
+
+    def __iter__(self):
+        return iter(self.points())
+
+    def clear(self) -> None:
+        """Remove every point."""
+        self._count = 0
+
+
+class TrajectoryRenderer:
+    """
+    Draws fading trajectories with one ``cv2.polylines`` call per colour bucket.
+
+    Segment ``i`` of an ``n``-point trajectory fades with ``(i + 1) / n``
+    from red to green. The fade is quantised to ``buckets`` colours, and for
+    every trajectory length the runs of segments sharing a bucket are
+    precomputed once, so drawing any number of hands costs at most
+    ``buckets`` OpenCV calls.
+    """
+
+    def __init__(self, length: int, buckets: int = 8, thickness: int = 2):
+        """
+        Initialize the renderer.
+
+        Args:
+            length (int): Maximum trajectory length
+            buckets (int): Number of fade colours
+            thickness (int): Line width in pixels
+        """
+        self.length = length
+        self.buckets = buckets
+        self.thickness = thickness
+        alphas = (np.arange(buckets) + 0.5) / buckets
+        self.colors = [(0, int(255 * a), int(255 * (1 - a))) for a in alphas]
+        # runs[n]: (bucket, first point, last point + 1) for an n-point trajectory
+        self.runs: List[List[Tuple[int, int, int]]] = [[] for _ in range(length + 1)]
+        for n in range(2, length + 1):
+            alpha = np.arange(1, n) / n
+            bucket = np.minimum((alpha * buckets).astype(int), buckets - 1)
+            starts = np.flatnonzero(np.diff(bucket, prepend=-1))
+            stops = np.append(starts[1:], n - 1)
+            # A run of segments [start, stop) spans points start..stop
+            self.runs[n] = [(int(bucket[s]), int(s), int(e) + 1) for s, e in zip(starts, stops)]
+
+    def draw(self, image: np.ndarray, trajectories: Iterable[np.ndarray]) -> np.ndarray:
+        """
+        Draw trajectories on an image in place.
+
+        Args:
+            image (np.ndarray): BGR image
+            trajectories (Iterable[np.ndarray]): (n, 2) normalised point arrays
+
+        Returns:
+            np.ndarray: The same image
+        """
+        h, w = image.shape[:2]
+        scale = np.array([w, h], dtype=np.float32)
+        polylines: Dict[int, List[np.ndarray]] = {}
+        for points in trajectories:
+            n = min(len(points), self.length)
+            if n < 2:
+                continue
+            pixels = (points[-n:] * scale).astype(np.int32)
+            for bucket, start, stop in self.runs[n]:
+                polylines.setdefault(bucket, []).append(pixels[start:stop])
+        for bucket, lines in polylines.items():
+            cv2.polylines(image, lines, False, self.colors[bucket], self.thickness)
+        return image
+
+
+class HistoryOverlay:
+    """
+    Recent gesture names rendered once and pasted onto every frame.
+
+    The text is drawn into a small patch with a pixel mask; it is only
+    re-rendered when the shown gestures or the frame size change.
+    """
+
+    def __init__(self, lines: int = 5, origin: Tuple[int, int] = (10, 30),
+                 spacing: int = 30, scale: float = 0.6,
+                 color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 2):
+        """
+        Initialize the overlay.
+
+        Args:
+            lines (int): Number of recent gestures shown
+            origin (Tuple[int, int]): Baseline position of the first line
+            spacing (int): Pixels between baselines
+            scale (float): Font scale
+            color (Tuple[int, int, int]): BGR text colour
+            thickness (int): Text stroke width
+        """
+        self.lines = lines
+        self.origin = origin
+        self.spacing = spacing
+        self.scale = scale
+        self.color = color
+        self.thickness = thickness
+        self.renders = 0
+        self._key = None
+        self._patch: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+
+    def _render(self, texts: Sequence[str], shape: Tuple[int, int]) -> None:
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        x, y = self.origin
+        width = height = 0
+        for i, text in enumerate(texts):
+            (text_w, _), baseline = cv2.getTextSize(text, font, self.scale, self.thickness)
+            width = max(width, x + text_w + self.thickness)
+            height = y + i * self.spacing + baseline + self.thickness
+        height, width = min(height, shape[0]), min(width, shape[1])
+        patch = np.zeros((height, width, 3), dtype=np.uint8)
+        mask = np.zeros((height, width), dtype=np.uint8)
+        for i, text in enumerate(texts):
+            position = (x, y + i * self.spacing)
+            cv2.putText(patch, text, position, font, self.scale, self.color, self.thickness)
+            cv2.putText(mask, text, position, font, self.scale, 255, self.thickness)
+        self._patch, self._mask = patch, mask
+        self.renders += 1
+
+    def draw(self, image: np.ndarray, history: Sequence[str]) -> None:
+        """
+        Paste the newest gestures of ``history`` onto an image in place.
+
+        Args:
+            image (np.ndarray): BGR image
+            history (Sequence[str]): Gesture names, oldest first
+        """
+        texts = tuple(f"Recent: {gesture}"
+                      for gesture in itertools.islice(reversed(history), self.lines))
+        if not texts:
+            return
+        key = (texts, image.shape[:2])
+        if key != self._key:
+            self._render(texts, image.shape[:2])
+            self._key = key
+        height, width = self._mask.shape
+        cv2.copyTo(self._patch, self._mask, image[:height, :width])
@@ -0,0 +1,179 @@
+"""Frame skipping with landmark prediction between inference frames."""
+
+import os
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from src.landmarks import FINGER_TIPS, NUM_LANDMARKS, PALM_POINTS, THUMB_TIP, WRIST
+
+# Points tracked by optical flow: wrist and finger tips
+FLOW_POINTS = np.concatenate([[WRIST, THUMB_TIP], FINGER_TIPS])
+
+
+class FrameSkipper:
+    """
+    Decides which frames get full inference and predicts the others.
+
+    Inference runs at least every ``interval`` frames, and on every frame
+    while the hands move faster than ``motion_threshold`` (when
+    ``adaptive``). In between, landmarks follow a constant-velocity model
+    fitted to the last two inferred frames, optionally corrected by
+    Lucas-Kanade optical flow on the wrist and finger tips.
+    """
+
+    def __init__(self, interval: int = 2, adaptive: bool = True, motion_threshold: float = 1.0,
+                 optical_flow: bool = False, flow_size: int = 320, max_gap: float = 0.25):
+        """
+        Initialize the frame skipper.
+
+        Args:
+            interval (int): Run inference at least every ``interval`` frames
+            adaptive (bool): Run inference on every frame during fast motion
+            motion_threshold (float): Palm speed, in frame widths per second,
+                above which every frame is inferred
+            optical_flow (bool): Correct predictions with optical flow
+            flow_size (int): Longest image side used for optical flow
+            max_gap (float): Never predict further than this many seconds
+                past the last inference
+        """
+        self.interval = max(interval, 1)
+        self.adaptive = adaptive
+        self.motion_threshold = motion_threshold
+        self.optical_flow = optical_flow
+        self.flow_size = flow_size
+        self.max_gap = max_gap
+        self.reset()
+
+    @classmethod
+    def from_env(cls) -> Optional["FrameSkipper"]:
+        """
+        Create a frame skipper from ``GESTURE_SKIP_INTERVAL`` and
+        ``GESTURE_OPTICAL_FLOW``.
+
+        Returns:
+            Optional[FrameSkipper]: Configured skipper, or None when every
+            frame is inferred (interval of 1 or unset)
+        """
+        interval = int(os.environ.get("GESTURE_SKIP_INTERVAL", 1))
+        if interval <= 1:
+            return None
+        flow = os.environ.get("GESTURE_OPTICAL_FLOW", "0").lower() in ("1", "true", "yes")
+        return cls(interval=interval, optical_flow=flow)
+
+    def reset(self) -> None:
+        """Forget all observations; the next frame is inferred."""
+        self._landmarks: Optional[np.ndarray] = None
+        self._handedness: List[Tuple[str, float]] = []
+        self._timestamp = 0.0
+        self._velocity: Optional[np.ndarray] = None
+        self._skipped = 0
+        self._gray: Optional[np.ndarray] = None
+        self._gray_landmarks: Optional[np.ndarray] = None
+
+    @property
+    def speed(self) -> float:
+        """Fastest palm speed at the last inference, in frame units per second."""
+        if self._velocity is None or not len(self._velocity):
+            return 0.0
+        palm = self._velocity[:, PALM_POINTS, :2].mean(axis=1)
+        return float(np.linalg.norm(palm, axis=1).max())
+
+    def should_infer(self, timestamp: float) -> bool:
+        """
+        Whether the frame captured at ``timestamp`` needs full inference.
+
+        Args:
+            timestamp (float): Capture time in seconds
+
+        Returns:
+            bool: True to run inference, False to predict
+        """
+        if self._landmarks is None or self._skipped + 1 >= self.interval:
+            return True
+        if timestamp - self._timestamp > self.max_gap:
+            return True
+        return self.adaptive and self.speed > self.motion_threshold
+
+    def _gray_image(self, image: np.ndarray) -> np.ndarray:
+        h, w = image.shape[:2]
+        scale = min(self.flow_size / max(h, w), 1.0)
+        if scale < 1.0:
+            image = cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_LINEAR)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    def observe(self, timestamp: float, landmarks: np.ndarray,
+                handedness: List[Tuple[str, float]], image: Optional[np.ndarray] = None) -> None:
+        """
+        Record the result of a full inference.
+
+        Args:
+            timestamp (float): Capture time in seconds
+            landmarks (np.ndarray): Inferred landmarks of shape (hands, 21, 3)
+            handedness (List[Tuple[str, float]]): (label, score) per hand
+            image (Optional[np.ndarray]): The frame (needed for optical flow)
+        """
+        landmarks = np.array(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3)
+        dt = timestamp - self._timestamp
+        if self._landmarks is not None and len(self._landmarks) == len(landmarks) and dt > 0:
+            self._velocity = (landmarks - self._landmarks) / dt
+        else:
+            self._velocity = None
+        self._landmarks = landmarks
+        self._handedness = list(handedness)
+        self._timestamp = timestamp
+        self._skipped = 0
+        if self.optical_flow and image is not None:
+            self._gray = self._gray_image(image)
+            self._gray_landmarks = landmarks
+
+    def predict(self, timestamp: float, image: Optional[np.ndarray] = None
+                ) -> Tuple[np.ndarray, List[Tuple[str, float]]]:
+        """
+        Predict the landmarks of a skipped frame.
+
+        Args:
+            timestamp (float): Capture time in seconds
+            image (Optional[np.ndarray]): The frame (needed for optical flow)
+
+        Returns:
+            Tuple[np.ndarray, List[Tuple[str, float]]]: Predicted landmarks of
+            shape (hands, 21, 3) and the last inferred handedness
+        """
+        self._skipped += 1
+        if self._landmarks is None or not len(self._landmarks):
+            return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32), []
+
+        predicted = self._landmarks.copy()
+        if self._velocity is not None:
+            predicted += self._velocity * (timestamp - self._timestamp)
+
+        if self.optical_flow and image is not None and self._gray is not None:
+            gray = self._gray_image(image)
+            predicted = self._flow_correct(gray, predicted)
+            self._gray, self._gray_landmarks = gray, predicted
+        return predicted, list(self._handedness)
+
+    def _flow_correct(self, gray: np.ndarray, predicted: np.ndarray) -> np.ndarray:
+        h, w = gray.shape
+        scale = np.array([w, h], dtype=np.float32)
+        previous = self._gray_landmarks
+        points = (previous[:, FLOW_POINTS, :2] * scale).reshape(-1, 1, 2)
+        moved, status, _ = cv2.calcOpticalFlowPyrLK(self._gray, gray, points, None,
+                                                   winSize=(15, 15), maxLevel=2)
+        if moved is None:
+            return predicted
+
+        shift = ((moved - points).reshape(len(previous), -1, 2) / scale)
+        ok = status.reshape(len(previous), -1).astype(bool)
+        corrected = predicted.copy()
+        for hand in range(len(previous)):
+            if not ok[hand].any():
+                continue  # Keep the constant-velocity prediction
+            # Move the whole hand with the tracked points, tips individually
+            corrected[hand] = previous[hand]
+            corrected[hand, :, :2] += shift[hand][ok[hand]].mean(axis=0)
+            tips = FLOW_POINTS[ok[hand]]
+            corrected[hand, tips, :2] = previous[hand, tips, :2] + shift[hand][ok[hand]]
+        return corrected
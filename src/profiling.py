@@ -0,0 +1,175 @@
+"""Opt-in per-stage latency profiling with fixed-memory histograms."""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, Iterable, List, Tuple
+
+# Log-spaced bucket upper bounds: 10 us to ~60 s, four buckets per doubling
+# (quantile estimates are within ~10% of the true value)
+BUCKET_BOUNDS: List[float] = [1e-5 * 2 ** (i / 4) for i in range(91)]
+QUANTILES = (0.5, 0.95, 0.99)
+
+_DISABLED = nullcontext()
+
+
+class LatencyHistogram:
+    """Thread-safe histogram of durations with constant memory."""
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self._counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one duration.
+
+        Args:
+            seconds (float): Duration in seconds
+        """
+        index = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile, interpolating within its bucket.
+
+        Args:
+            q (float): Quantile in [0, 1]
+
+        Returns:
+            float: Estimated duration in seconds (NaN when empty)
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self.count
+        if not total:
+            return float("nan")
+
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                lower = BUCKET_BOUNDS[index - 1] if index else 0.0
+                upper = BUCKET_BOUNDS[min(index, len(BUCKET_BOUNDS) - 1)]
+                return lower + (upper - lower) * max(rank - cumulative, 0) / count
+            cumulative += count
+        return BUCKET_BOUNDS[-1]
+
+
+class _Stage:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "StageProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.observe(self.name, time.perf_counter() - self.start)
+
+
+class StageProfiler:
+    """
+    Named stage timers backed by :class:`LatencyHistogram`.
+
+    When disabled, :meth:`stage` returns a shared no-op context manager and
+    nothing is timed or stored.
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled (bool): Record stage durations
+        """
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "StageProfiler":
+        """
+        Create a profiler enabled by ``GESTURE_PROFILE=1``.
+
+        Returns:
+            StageProfiler: Configured profiler
+        """
+        return cls(enabled=os.environ.get("GESTURE_PROFILE", "0").lower() in ("1", "true", "yes"))
+
+    def stage(self, name: str):
+        """
+        Time a block of code as stage ``name``.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            Context manager timing the block (a no-op when disabled)
+        """
+        if not self.enabled:
+            return _DISABLED
+        return _Stage(self, name)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record a duration measured elsewhere.
+
+        Args:
+            name (str): Stage name
+            seconds (float): Duration in seconds
+        """
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        histogram.observe(seconds)
+
+    def snapshot(self) -> List[Tuple[str, LatencyHistogram]]:
+        """
+        The stages recorded so far, safe to iterate while workers record.
+
+        Returns:
+            List[Tuple[str, LatencyHistogram]]: (stage name, histogram) pairs
+            sorted by name
+        """
+        with self._lock:
+            return sorted(self.histograms.items())
+
+    def summary(self, quantiles: Iterable[float] = QUANTILES) -> Dict[str, Dict[str, float]]:
+        """
+        Per-stage counts and quantiles.
+
+        Args:
+            quantiles (Iterable[float]): Quantiles to report
+
+        Returns:
+            Dict[str, Dict[str, float]]: Stage name to ``count``, ``sum`` and
+            ``p50``-style quantile keys, in seconds
+        """
+        quantiles = tuple(quantiles)
+        result = {}
+        for name, histogram in self.snapshot():
+            stats = {"count": histogram.count, "sum": histogram.sum}
+            for q in quantiles:
+                stats[f"p{q * 100:g}"] = histogram.quantile(q)
+            result[name] = stats
+        return result
+
+    def reset(self) -> None:
+        """Forget every recorded duration."""
+        with self._lock:
+            self.histograms = {}
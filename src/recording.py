@@ -0,0 +1,233 @@
+"""Recording and replay of per-frame hand landmarks.
+
+A recording is a 16-byte header followed by one record per analysed frame::
+
+    timestamp  float64   capture time in seconds
+    hands      uint8     number of hands in the frame
+    then per hand:
+    label      uint8     0 = Left, 1 = Right, 255 = unknown
+    score      float32   handedness confidence
+    landmarks  float32   (21, 3)
+
+The file is append-only; a partially written trailing record is ignored on
+read and dropped when the file is reopened for recording. Replaying a recording runs the gesture logic exactly as it ran live,
+without MediaPipe, so the post-inference pipeline can be tested and
+benchmarked deterministically.
+"""
+
+import os
+import struct
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.landmarks import NUM_LANDMARKS
+
+MAGIC = b"GLRC"
+VERSION = 1
+HEADER = struct.Struct("<4sHHH6x")  # magic, version, landmarks, dims
+FRAME = struct.Struct("<dB")  # timestamp, hands
+HAND = struct.Struct("<Bf")  # handedness label, score
+LANDMARKS_SIZE = NUM_LANDMARKS * 3 * 4
+HANDEDNESS_LABELS = ("Left", "Right")
+UNKNOWN_LABEL = 255
+
+
+class RecordedFrame(NamedTuple):
+    """Landmarks of one recorded frame."""
+
+    timestamp: float
+    landmarks: np.ndarray  # float32 (hands, 21, 3)
+    handedness: List[Tuple[str, float]]
+
+
+def _check_header(header: bytes, path: str) -> None:
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is not a landmark recording (truncated header)")
+    magic, version, landmarks, dims = HEADER.unpack(header[:HEADER.size])
+    if magic != MAGIC or (landmarks, dims) != (NUM_LANDMARKS, 3):
+        raise ValueError(f"{path} is not a landmark recording")
+    if version != VERSION:
+        raise ValueError(f"Unsupported landmark recording version {version}")
+
+
+def _frame_offsets(data: bytes) -> Iterator[Tuple[int, int]]:
+    # Start offset and hand count of every complete frame, stopping at a
+    # partially written trailing frame
+    offset, end = HEADER.size, len(data)
+    hand_size = HAND.size + LANDMARKS_SIZE
+    while offset + FRAME.size <= end:
+        _, count = FRAME.unpack_from(data, offset)
+        if offset + FRAME.size + count * hand_size > end:
+            return
+        yield offset, count
+        offset += FRAME.size + count * hand_size
+
+
+def _complete_length(data: bytes) -> int:
+    # Size of the header plus every complete frame
+    length = HEADER.size
+    for offset, count in _frame_offsets(data):
+        length = offset + FRAME.size + count * (HAND.size + LANDMARKS_SIZE)
+    return length
+
+
+class LandmarkRecorder:
+    """Appends analysed frames to a landmark recording."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a recording for appending.
+
+        Args:
+            path (str): Recording path
+        """
+        self.path = path
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "rb") as handle:
+                data = handle.read()
+            _check_header(data, path)
+            # Drop a frame cut off by a crash, or later frames would be misread
+            os.truncate(path, _complete_length(data))
+            self._file = open(path, "ab")
+        else:
+            self._file = open(path, "wb")
+            self._file.write(HEADER.pack(MAGIC, VERSION, NUM_LANDMARKS, 3))
+        self.frames = 0
+
+    def write(self, timestamp: float, landmarks: np.ndarray,
+              handedness: List[Tuple[str, float]]) -> None:
+        """
+        Append one frame.
+
+        Args:
+            timestamp (float): Capture time in seconds
+            landmarks (np.ndarray): Array of shape (hands, 21, 3)
+            handedness (List[Tuple[str, float]]): (label, score) per hand
+        """
+        landmarks = np.asarray(landmarks, dtype="<f4").reshape(-1, NUM_LANDMARKS, 3)
+        parts = [FRAME.pack(timestamp, len(landmarks))]
+        for idx, hand in enumerate(landmarks):
+            label, score = handedness[idx] if idx < len(handedness) else (None, 0.0)
+            code = HANDEDNESS_LABELS.index(label) if label in HANDEDNESS_LABELS else UNKNOWN_LABEL
+            parts.append(HAND.pack(code, score))
+            parts.append(hand.tobytes())
+        # Buffered: a crash loses the frames written since the last flush();
+        # a frame cut off part-way through is ignored on read
+        self._file.write(b"".join(parts))
+        self.frames += 1
+
+    def record(self, analysis: Dict[str, Any], timestamp: float) -> None:
+        """
+        Append the hands of an analysis returned by ``GestureController``.
+
+        Args:
+            analysis (Dict[str, Any]): Frame analysis
+            timestamp (float): Capture time in seconds
+        """
+        self.write(timestamp, analysis["landmarks"], analysis["handedness"])
+
+    def flush(self) -> None:
+        """Flush buffered frames to disk."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the recording."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "LandmarkRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_recording(path: str) -> Iterator[RecordedFrame]:
+    """
+    Read the frames of a recording.
+
+    Args:
+        path (str): Recording path
+
+    Yields:
+        RecordedFrame: Frames in recording order
+    """
+    with open(path, "rb") as handle:
+        data = handle.read()
+    _check_header(data, path)
+
+    hand_size = HAND.size + LANDMARKS_SIZE
+    for offset, count in _frame_offsets(data):
+        timestamp, _ = FRAME.unpack_from(data, offset)
+        start = offset + FRAME.size
+        landmarks = np.empty((count, NUM_LANDMARKS, 3), dtype=np.float32)
+        handedness = []
+        for idx in range(count):
+            code, score = HAND.unpack_from(data, start)
+            handedness.append((HANDEDNESS_LABELS[code] if code < len(HANDEDNESS_LABELS)
+                               else "Unknown", score))
+            landmarks[idx] = np.frombuffer(data, dtype="<f4", count=NUM_LANDMARKS * 3,
+                                           offset=start + HAND.size).reshape(NUM_LANDMARKS, 3)
+            start += hand_size
+        yield RecordedFrame(timestamp, landmarks, handedness)
+
+
+class LandmarkReplay:
+    """
+    A recording loaded into memory as a frame source.
+
+    Feeds recorded hands through :meth:`GestureController.analyze_landmarks`
+    with their original timestamps, so dynamic gestures fire exactly as they
+    did live. Each analysis carries the (21, 3) arrays that the
+    ``GestureFeatures`` handlers accept.
+    """
+
+    def __init__(self, frames: List[RecordedFrame]):
+        """
+        Wrap recorded frames.
+
+        Args:
+            frames (List[RecordedFrame]): Frames in recording order
+        """
+        self.frames = frames
+
+    @classmethod
+    def load(cls, path: str) -> "LandmarkReplay":
+        """
+        Load a recording.
+
+        Args:
+            path (str): Recording path
+
+        Returns:
+            LandmarkReplay: Replay of every complete frame in the file
+        """
+        return cls(list(read_recording(path)))
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        return iter(self.frames)
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the first and last frame."""
+        if not self.frames:
+            return 0.0
+        return self.frames[-1].timestamp - self.frames[0].timestamp
+
+    def replay(self, controller, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Run the gesture logic over the recorded frames.
+
+        Args:
+            controller (GestureController): Controller whose state is updated
+            limit (Optional[int]): Stop after this many frames
+
+        Yields:
+            Dict[str, Any]: Per-frame analysis (``image`` is None)
+        """
+        for frame in self.frames[:limit]:
+            yield controller.analyze_landmarks(frame.landmarks, frame.handedness, frame.timestamp)
@@ -0,0 +1,160 @@
+"""Adaptive inference input: downscaling and cropping to the tracked hands."""
+
+import os
+from typing import Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# Normalised (x, y, width, height) of the frame area an inference input covers
+Region = Tuple[float, float, float, float]
+FULL_FRAME: Region = (0.0, 0.0, 1.0, 1.0)
+
+
+class InferenceInput:
+    """
+    Prepares the image handed to MediaPipe and maps its landmarks back.
+
+    Frames are downscaled so their longest side is at most ``max_side``. With
+    ``crop`` enabled, frames following a detection are cropped to a padded
+    square around the last hands. The crop only moves once the hands leave
+    its inner part, which keeps MediaPipe's own tracking stable. The full
+    frame is searched again every ``redetect_interval`` frames, so new hands
+    are found, and immediately whenever tracking is lost.
+    """
+
+    def __init__(self, max_side: int = 640, crop: bool = True, padding: float = 0.5,
+                 redetect_interval: int = 10, min_crop: float = 0.2):
+        """
+        Initialize the input stage.
+
+        Args:
+            max_side (int): Longest side of the inference image in pixels
+                (0 keeps the source resolution)
+            crop (bool): Crop to the tracked hands between full-frame detections
+            padding (float): Crop margin around the hands, as a fraction of
+                the hands' bounding box size
+            redetect_interval (int): Frames between full-frame detections
+            min_crop (float): Smallest crop side, as a fraction of the
+                frame's shorter side
+        """
+        self.max_side = max_side
+        self.crop = crop
+        self.padding = padding
+        self.redetect_interval = max(redetect_interval, 1)
+        self.min_crop = min_crop
+        self.region: Optional[Region] = None
+        self._since_detect = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["InferenceInput"]:
+        """
+        Create an input stage from ``GESTURE_INFERENCE_SIZE``, ``GESTURE_ROI``
+        and ``GESTURE_REDETECT_INTERVAL``.
+
+        Returns:
+            Optional[InferenceInput]: Configured stage, or None when neither
+            downscaling nor cropping is enabled
+        """
+        max_side = int(os.environ.get("GESTURE_INFERENCE_SIZE", 0))
+        crop = os.environ.get("GESTURE_ROI", "0").lower() in ("1", "true", "yes")
+        if not max_side and not crop:
+            return None
+        return cls(max_side=max_side, crop=crop,
+                   redetect_interval=int(os.environ.get("GESTURE_REDETECT_INTERVAL", 10)))
+
+    def reset(self) -> None:
+        """Forget the tracked region; the next frame is searched in full."""
+        self.region = None
+        self._since_detect = 0
+
+    def prepare(self, image: np.ndarray) -> Tuple[np.ndarray, Region]:
+        """
+        Build the inference input for a frame.
+
+        Args:
+            image (np.ndarray): Full-resolution frame
+
+        Returns:
+            Tuple[np.ndarray, Region]: Inference image (a view when no
+            resizing is needed) and the normalised frame region it covers
+        """
+        h, w = image.shape[:2]
+        region = self.region if self.crop else None
+        if region is None or self._since_detect >= self.redetect_interval:
+            region = FULL_FRAME
+            self._since_detect = 0
+        else:
+            self._since_detect += 1
+
+        # Snap to whole pixels so the mapping back is exact
+        x0, y0 = int(round(region[0] * w)), int(round(region[1] * h))
+        x1 = max(int(round((region[0] + region[2]) * w)), x0 + 1)
+        y1 = max(int(round((region[1] + region[3]) * h)), y0 + 1)
+        cropped = image[y0:y1, x0:x1]
+
+        longest = max(x1 - x0, y1 - y0)
+        if self.max_side and longest > self.max_side:
+            scale = self.max_side / longest
+            size = (max(int(round((x1 - x0) * scale)), 1), max(int(round((y1 - y0) * scale)), 1))
+            cropped = cv2.resize(cropped, size, interpolation=cv2.INTER_LINEAR)
+        return cropped, (x0 / w, y0 / h, (x1 - x0) / w, (y1 - y0) / h)
+
+    def update(self, landmarks: np.ndarray, frame_shape: Sequence[int]) -> None:
+        """
+        Choose the crop for the next frame from this frame's hands.
+
+        Args:
+            landmarks (np.ndarray): Full-frame landmarks of shape (hands, 21, 3)
+            frame_shape (Sequence[int]): Frame (height, width, ...)
+        """
+        if not len(landmarks):
+            # Tracking lost: search the whole frame next time
+            self.reset()
+            return
+        if not self.crop:
+            return
+
+        h, w = frame_shape[:2]
+        points = landmarks[..., :2].reshape(-1, 2) * (w, h)
+        lower, upper = points.min(axis=0), points.max(axis=0)
+
+        if self.region is not None:
+            # Keep the current crop while the hands stay well inside it and
+            # still fill a reasonable part of it
+            x, y, rw, rh = self.region
+            crop_low = np.array([x * w, y * h])
+            crop_size = np.array([rw * w, rh * h])
+            margin = 0.25 * self.padding / (1 + self.padding) * crop_size
+            fits = np.all(lower >= crop_low + margin) and np.all(upper <= crop_low + crop_size - margin)
+            if fits and (upper - lower).max() * (1 + self.padding) * 2 > crop_size.min():
+                return
+
+        # Padded square around the hands, clamped to the frame
+        center = (lower + upper) / 2
+        side = max((upper - lower).max() * (1 + self.padding), self.min_crop * min(w, h))
+        side = min(side, w, h)
+        x0 = float(np.clip(center[0] - side / 2, 0, w - side))
+        y0 = float(np.clip(center[1] - side / 2, 0, h - side))
+        self.region = (x0 / w, y0 / h, side / w, side / h)
+
+
+def map_to_frame(landmarks: np.ndarray, region: Region) -> np.ndarray:
+    """
+    Map landmarks from inference-image to full-frame normalised coordinates.
+
+    Args:
+        landmarks (np.ndarray): Array of shape (..., 21, 3), updated in place
+        region (Region): Frame region the inference image covered
+
+    Returns:
+        np.ndarray: ``landmarks``
+    """
+    if region == FULL_FRAME:
+        return landmarks
+    x0, y0, rw, rh = region
+    landmarks[..., 0] = landmarks[..., 0] * rw + x0
+    landmarks[..., 1] = landmarks[..., 1] * rh + y0
+    landmarks[..., 2] *= rw  # MediaPipe scales z like x
+    return landmarks
+
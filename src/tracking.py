@@ -0,0 +1,150 @@
+"""Stable hand identities across frames."""
+
+import itertools
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.landmarks import PALM_POINTS
+
+# Exact assignment is tried over every permutation up to this many hands
+_EXACT_LIMIT = 5
+
+
+class HandTrack:
+    """Last known state of one tracked hand."""
+
+    __slots__ = ("track_id", "position", "velocity", "label", "last_seen")
+
+    def __init__(self, track_id: int, position: np.ndarray, label: Optional[str], timestamp: float):
+        self.track_id = track_id
+        self.position = position
+        self.velocity = np.zeros(2, dtype=np.float32)
+        self.label = label
+        self.last_seen = timestamp
+
+
+class HandTracker:
+    """
+    Assigns persistent IDs to detected hands.
+
+    Detections are matched to tracks by palm-centre distance, with the track
+    moved along its last velocity first. A handedness mismatch adds a penalty
+    rather than forbidding the match, because MediaPipe occasionally flips
+    labels. Tracks not matched for ``timeout`` seconds expire, and their IDs
+    are reported once in :attr:`expired` so per-hand state can be released.
+    """
+
+    def __init__(self, max_distance: float = 0.25, timeout: float = 0.5,
+                 handedness_penalty: float = 0.1):
+        """
+        Initialize the tracker.
+
+        Args:
+            max_distance (float): Largest palm movement, in normalised frame
+                units, accepted as the same hand
+            timeout (float): Seconds before an unmatched track expires
+            handedness_penalty (float): Distance added when labels disagree
+        """
+        self.max_distance = max_distance
+        self.timeout = timeout
+        self.handedness_penalty = handedness_penalty
+        self.tracks: Dict[int, HandTrack] = {}
+        self.expired: List[int] = []
+        self._ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def _cost(self, palms: np.ndarray, labels: Sequence[Optional[str]],
+              tracks: List[HandTrack], timestamp: float) -> np.ndarray:
+        predicted = np.array([t.position + t.velocity * (timestamp - t.last_seen) for t in tracks])
+        cost = np.linalg.norm(palms[:, None, :] - predicted[None, :, :], axis=2)
+        for j, track in enumerate(tracks):
+            for i, label in enumerate(labels):
+                if label and track.label and label != track.label:
+                    cost[i, j] += self.handedness_penalty
+        cost[cost > self.max_distance] = np.inf
+        return cost
+
+    @staticmethod
+    def _assign(cost: np.ndarray) -> List[Tuple[int, int]]:
+        rows, cols = cost.shape
+        if min(rows, cols) <= _EXACT_LIMIT and max(rows, cols) <= 2 * _EXACT_LIMIT:
+            # Optimal assignment by enumeration (hand counts are tiny)
+            best, best_pairs = (0, np.inf), []
+            if rows <= cols:
+                candidates = (list(zip(range(rows), perm))
+                              for perm in itertools.permutations(range(cols), rows))
+            else:
+                candidates = (list(zip(perm, range(cols)))
+                              for perm in itertools.permutations(range(rows), cols))
+            values = cost.tolist()
+            for pairs in candidates:
+                matched = [(i, j) for i, j in pairs if values[i][j] != math.inf]
+                score = (-len(matched), sum(values[i][j] for i, j in matched))
+                if score < best:
+                    best, best_pairs = score, matched
+            return best_pairs
+
+        # Greedy on increasing cost
+        pairs, used_rows, used_cols = [], set(), set()
+        for flat in np.argsort(cost, axis=None):
+            i, j = divmod(int(flat), cols)
+            if not np.isfinite(cost[i, j]):
+                break
+            if i not in used_rows and j not in used_cols:
+                pairs.append((i, j))
+                used_rows.add(i)
+                used_cols.add(j)
+        return pairs
+
+    def update(self, landmarks: np.ndarray, handedness: Sequence[Tuple[str, float]],
+               timestamp: float) -> List[int]:
+        """
+        Match one frame of hands to tracks.
+
+        Args:
+            landmarks (np.ndarray): Landmarks of shape (hands, 21, 3)
+            handedness (Sequence[Tuple[str, float]]): (label, score) per hand
+            timestamp (float): Capture time in seconds
+
+        Returns:
+            List[int]: Track ID of each hand, in input order
+        """
+        self.expired = [track_id for track_id, track in self.tracks.items()
+                        if timestamp - track.last_seen > self.timeout]
+        for track_id in self.expired:
+            del self.tracks[track_id]
+
+        count = len(landmarks)
+        if not count:
+            return []
+        palms = np.asarray(landmarks)[:, PALM_POINTS, :2].mean(axis=1)
+        labels = [handedness[i][0] if i < len(handedness) else None for i in range(count)]
+
+        ids: List[Optional[int]] = [None] * count
+        tracks = list(self.tracks.values())
+        if tracks:
+            for i, j in self._assign(self._cost(palms, labels, tracks, timestamp)):
+                track = tracks[j]
+                dt = timestamp - track.last_seen
+                if dt > 0:
+                    track.velocity = ((palms[i] - track.position) / dt).astype(np.float32)
+                track.position = palms[i]
+                track.label = labels[i] or track.label
+                track.last_seen = timestamp
+                ids[i] = track.track_id
+
+        for i in range(count):
+            if ids[i] is None:
+                track = HandTrack(next(self._ids), palms[i], labels[i], timestamp)
+                self.tracks[track.track_id] = track
+                ids[i] = track.track_id
+        return ids
+
+    def reset(self) -> None:
+        """Expire every track."""
+        self.expired = list(self.tracks)
+        self.tracks.clear()
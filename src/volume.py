@@ -0,0 +1,151 @@
+"""System volume backends that keep one control channel open."""
+
+import os
+import subprocess
+import sys
+from typing import List, Optional, Sequence
+
+
+class VolumeBackend:
+    """Sets the output volume; implementations keep their channel open."""
+
+    def set(self, level: int) -> None:
+        """
+        Set the output volume.
+
+        Args:
+            level (int): Volume (0-100)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the control channel."""
+
+    @classmethod
+    def from_env(cls) -> "VolumeBackend":
+        """
+        Create the backend named by ``GESTURE_VOLUME``.
+
+        ``amixer`` (the Linux default), ``osascript`` (the macOS default),
+        ``osc://host:port/address`` or ``none``.
+
+        Returns:
+            VolumeBackend: Configured backend
+        """
+        default = "osascript" if sys.platform == "darwin" else "amixer"
+        name = os.environ.get("GESTURE_VOLUME", default)
+        if name == "amixer":
+            return AmixerVolume(control=os.environ.get("GESTURE_VOLUME_CONTROL", "Master"))
+        if name == "osascript":
+            return OsascriptVolume()
+        if name.startswith("osc://"):
+            location, _, address = name[len("osc://"):].partition("/")
+            host, _, port = location.rpartition(":")
+            return OscVolume(host or "127.0.0.1", int(port), "/" + (address or "volume"))
+        if name == "none":
+            return FakeVolume()
+        raise ValueError(f"Unknown volume backend: {name}")
+
+
+class AmixerVolume(VolumeBackend):
+    """
+    ALSA mixer (PulseAudio and PipeWire through their ALSA plugins).
+
+    One ``amixer --stdin`` process is started on first use and fed a
+    command line per change, so an update is a pipe write rather than a
+    process spawn. If the process dies it is restarted on the next change.
+    """
+
+    def __init__(self, control: str = "Master",
+                 command: Sequence[str] = ("amixer", "-q", "--stdin")):
+        """
+        Initialize the backend; the process starts on the first change.
+
+        Args:
+            control (str): Mixer control to set
+            command (Sequence[str]): Command that reads mixer commands from stdin
+        """
+        self.control = control
+        self.command = list(command)
+        self._process: Optional[subprocess.Popen] = None
+
+    def set(self, level: int) -> None:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(self.command, stdin=subprocess.PIPE,
+                                             stdout=subprocess.DEVNULL,
+                                             stderr=subprocess.DEVNULL, text=True)
+        self._process.stdin.write(f"sset {self.control} {int(level)}%\n")
+        self._process.stdin.flush()
+
+    def close(self) -> None:
+        if self._process is not None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+
+
+class OscVolume(VolumeBackend):
+    """
+    Sends the volume as an OSC message over UDP (``python-osc``).
+
+    For mixers and audio software that listen for OSC; the level is sent
+    as a float from 0 to 1.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9000, address: str = "/volume"):
+        """
+        Initialize the OSC client.
+
+        Args:
+            host (str): Receiver host
+            port (int): Receiver UDP port
+            address (str): OSC address of the volume parameter
+        """
+        from pythonosc.udp_client import SimpleUDPClient
+
+        self.address = address
+        self._client = SimpleUDPClient(host, port)
+
+    def set(self, level: int) -> None:
+        self._client.send_message(self.address, int(level) / 100)
+
+    def close(self) -> None:
+        close = getattr(self._client, "close", None)  # Missing in older python-osc
+        if close is not None:
+            close()
+
+
+class OsascriptVolume(VolumeBackend):
+    """
+    macOS volume through ``osascript``.
+
+    AppleScript has no long-lived channel, so each change runs osascript
+    directly (without a shell); the dispatcher's rate limit bounds how often.
+    """
+
+    def set(self, level: int) -> None:
+        subprocess.run(["osascript", "-e", f"set volume output volume {int(level)}"],
+                       check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class FakeVolume(VolumeBackend):
+    """
+    In-memory volume for tests and machines without audio.
+
+    Attributes:
+        levels (List[int]): Every level set, in order
+    """
+
+    def __init__(self):
+        self.levels: List[int] = []
+
+    @property
+    def level(self) -> Optional[int]:
+        """The current level, or None if never set."""
+        return self.levels[-1] if self.levels else None
+
+    def set(self, level: int) -> None:
+        self.levels.append(int(level))
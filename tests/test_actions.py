@@ -0,0 +1,119 @@
+"""Tests for the background OS action dispatcher."""
+
+import threading
+import time
+
+import numpy as np
+
+from src.actions import ActionDispatcher, RecordingBackend
+from src.gesture_features import SHORTCUTS, GestureFeatures
+from src.landmarks import INDEX_TIP, THUMB_TIP
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BlockingBackend(RecordingBackend):
+    """Backend whose actions wait until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def _record(self, *call):
+        self.release.wait(5)
+        super()._record(*call)
+
+
+def test_moves_never_block_and_coalesce():
+    """Submitting while the backend is stuck returns at once; only the newest move runs."""
+    backend = BlockingBackend()
+    dispatcher = ActionDispatcher(backend)
+    dispatcher.move(0, 0)
+    time.sleep(0.05)  # The worker is now stuck performing the first move
+
+    start = time.perf_counter()
+    for x in range(1, 101):
+        dispatcher.move(x, x)
+    assert time.perf_counter() - start < 0.5
+
+    backend.release.set()
+    assert dispatcher.flush(5)
+    assert backend.calls == [("move", 0, 0), ("move", 100, 100)]
+    assert dispatcher.stats()["coalesced"] == 99
+    dispatcher.close()
+
+
+def test_held_click_fires_once_until_released():
+    """A click requested every frame fires once, and again after a pause."""
+    backend, clock = RecordingBackend(), FakeClock()
+    dispatcher = ActionDispatcher(backend, debounce=0.3, clock=clock)
+    for _ in range(10):
+        dispatcher.click()
+        clock.now += 0.1
+    clock.now += 0.5
+    assert dispatcher.click()
+    assert dispatcher.flush(5)
+    assert backend.calls == [("click",), ("click",)]
+    assert dispatcher.stats()["suppressed"] == 9
+    dispatcher.close()
+
+
+def test_hotkeys_are_rate_limited():
+    """Different hotkeys closer than the interval are suppressed."""
+    backend, clock = RecordingBackend(), FakeClock()
+    dispatcher = ActionDispatcher(backend, hotkey_interval=1.0, clock=clock)
+    assert dispatcher.hotkey("command", "w")
+    clock.now = 0.4
+    assert not dispatcher.hotkey("command", "m")
+    clock.now = 1.2
+    assert dispatcher.hotkey("command", "m")
+    assert dispatcher.flush(5)
+    assert backend.calls == [("hotkey", "command", "w"), ("hotkey", "command", "m")]
+    dispatcher.close()
+
+
+def test_full_queue_drops_actions():
+    """Discrete actions beyond ``max_pending`` are dropped, not queued."""
+    backend = BlockingBackend()
+    dispatcher = ActionDispatcher(backend, max_pending=2, debounce=0, hotkey_interval=0)
+    dispatcher.click()
+    time.sleep(0.05)
+    queued = [dispatcher.hotkey("command", key) for key in "abcd"]
+    assert queued == [True, True, False, False]
+    assert dispatcher.stats()["dropped"] == 2
+    backend.release.set()
+    assert dispatcher.flush(5)
+    dispatcher.close()
+
+
+def test_features_dispatch_to_backend():
+    """Mouse, volume and shortcut handlers go through the dispatcher."""
+    backend = RecordingBackend(size=(1000, 500))
+    features = GestureFeatures(ActionDispatcher(backend))
+    landmarks = np.zeros((21, 3), dtype=np.float32)
+    landmarks[INDEX_TIP] = landmarks[THUMB_TIP] = (0.5, 0.2, 0.0)
+
+    features.handle_mouse_control(landmarks, (480, 640))
+    features.handle_shortcuts("Closed Fist")
+    features.handle_shortcuts("Unknown")
+    assert features.dispatcher.flush(5)
+    assert sorted(backend.calls) == [("click",), ("hotkey", "command", "w"), ("move", 500, 100)]
+    features.dispatcher.close()
+
+
+def test_shortcut_gestures_never_switch_modes():
+    """No gesture both switches modes and triggers a shortcut."""
+    features = GestureFeatures(ActionDispatcher(RecordingBackend()))
+    for gesture in SHORTCUTS:
+        features.current_mode = "mouse"
+        features.handle_mode_switch(gesture)
+        assert features.current_mode == "mouse", gesture
+    features.dispatcher.close()
@@ -0,0 +1,119 @@
+"""Unit tests for offline batch processing."""
+
+import json
+import os
+import cv2
+import numpy as np
+from benchmarks.synthetic import hand_at
+from src.batch import ColumnBuffer, expand_inputs, output_paths, process_source
+from src.gesture_control import GestureController
+
+def make_frames(directory, count):
+    """Write ``count`` blank frames to a directory."""
+    os.makedirs(directory, exist_ok=True)
+    for i in range(count):
+        cv2.imwrite(os.path.join(directory, f"{i:04d}.png"), np.zeros((120, 160, 3), np.uint8))
+
+def empty_analysis():
+    return {"landmarks": np.empty((0, 21, 3), np.float32), "handedness": [], "gestures": []}
+
+def test_column_buffer():
+    """Test rows are padded to the hand slots and stored as columns."""
+    buffer = ColumnBuffer(max_hands=2)
+    hand = np.ones((1, 21, 3), np.float32)
+    buffer.append(0, 0.0, {"landmarks": hand, "handedness": [("Right", 0.9)],
+                           "gestures": ["Fist", "Swipe Left"]})
+    buffer.append(1, 0.5, empty_analysis())
+    
+    columns = buffer.columns()
+    assert columns["landmarks"].shape == (2, 2, 21, 3)
+    np.testing.assert_array_equal(columns["num_hands"], [1, 0])
+    np.testing.assert_array_equal(columns["handedness"], [[1, -1], [-1, -1]])
+    assert np.isnan(columns["landmarks"][0, 1]).all()
+    assert list(columns["gestures"]) == ["Fist;Swipe Left", ""]
+
+def test_process_directory(tmp_path):
+    """Test a frame directory produces one row per frame and no leftovers."""
+    source = str(tmp_path / "clip")
+    output = str(tmp_path / "out")
+    os.makedirs(output)
+    make_frames(source, 5)
+    
+    summary = process_source(source, output, chunk_size=2)
+    result = np.load(summary["output"])
+    
+    assert summary["frames"] == 5
+    np.testing.assert_array_equal(result["frame"], np.arange(5))
+    np.testing.assert_array_equal(result["num_hands"], np.zeros(5))
+    assert sorted(os.listdir(output)) == ["clip.npz"]
+    
+    # A finished input is skipped
+    assert process_source(source, output)["skipped"]
+
+def test_media_timestamps_drive_analysis(tmp_path, monkeypatch):
+    """Test frames are analysed at their media time, not the wall clock."""
+    source = str(tmp_path / "clip")
+    output = str(tmp_path / "out")
+    os.makedirs(output)
+    make_frames(source, 3)
+    
+    timestamps = []
+    analyze_frame = GestureController.analyze_frame
+    
+    def record(self, frame, timestamp=None):
+        timestamps.append(timestamp)
+        return analyze_frame(self, frame, timestamp)
+    
+    monkeypatch.setattr(GestureController, "analyze_frame", record)
+    process_source(source, output, fps=25.0)
+    assert timestamps == [0.0, 0.04, 0.08]
+
+def test_directory_frames_keep_hand_ids(tmp_path, monkeypatch):
+    """Test frames of a directory are close enough in time to track one hand."""
+    source = str(tmp_path / "clip")
+    output = str(tmp_path / "out")
+    os.makedirs(output)
+    make_frames(source, 5)
+    
+    hand_ids = []
+    
+    def detect(self, frame, timestamp=None):
+        # One hand in every frame, through the real tracking logic
+        analysis = self.analyze_landmarks(hand_at(0.4, 0.5, size=0.1)[None],
+                                          [("Right", 0.9)], timestamp)
+        hand_ids.extend(analysis["hand_ids"])
+        return analysis
+    
+    monkeypatch.setattr(GestureController, "analyze_frame", detect)
+    process_source(source, output)
+    assert hand_ids == [hand_ids[0]] * 5
+
+def test_resume_from_checkpoint(tmp_path):
+    """Test processing resumes after the last checkpointed chunk."""
+    source = str(tmp_path / "clip")
+    output = str(tmp_path / "out")
+    os.makedirs(output)
+    make_frames(source, 4)
+    
+    result_path, checkpoint_path = output_paths(source, output)
+    buffer = ColumnBuffer(max_hands=2)
+    buffer.append(0, 0.0, empty_analysis())
+    buffer.append(1, 1.0, empty_analysis())
+    chunk = result_path[:-4] + ".part00000.npz"
+    np.savez(chunk, **buffer.columns())
+    with open(checkpoint_path, "w") as handle:
+        json.dump({"next_frame": 2, "chunks": [chunk], "frames": 2, "seconds": 0.1}, handle)
+    
+    summary = process_source(source, output)
+    
+    assert summary["resumed_from"] == 2
+    assert summary["frames"] == 4
+    np.testing.assert_array_equal(np.load(result_path)["frame"], np.arange(4))
+    assert not os.path.exists(checkpoint_path)
+
+def test_expand_inputs(tmp_path):
+    """Test glob patterns expand to existing inputs only."""
+    for name in ("a.mp4", "b.mp4"):
+        (tmp_path / name).write_bytes(b"")
+    inputs = expand_inputs([str(tmp_path / "*.mp4"), str(tmp_path / "missing.mp4")])
+    assert inputs == [str(tmp_path / "a.mp4"), str(tmp_path / "b.mp4")]
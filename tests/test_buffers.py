@@ -0,0 +1,50 @@
+"""Tests for the reusable frame buffer pool."""
+
+import tracemalloc
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from src.buffers import FramePool
+from src.gesture_control import GestureController
+
+
+class NoHands:
+    """Inference stand-in that never finds a hand."""
+
+    def process(self, image):
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+
+def test_pool_rotates_and_reallocates_on_shape_change():
+    """Slots are reused in rotation and replaced only when the shape changes."""
+    pool = FramePool(depth=2)
+    first = pool.get("flip", (4, 6, 3))
+    second = pool.get("flip", (4, 6, 3))
+    assert first is not second
+    assert pool.get("flip", (4, 6, 3)) is first
+    assert pool.allocations == 2
+
+    resized = pool.get("flip", (8, 6, 3))
+    assert resized.shape == (8, 6, 3) and pool.allocations == 3
+    assert pool.nbytes == 8 * 6 * 3 + 4 * 6 * 3
+
+
+def test_analyze_frame_allocates_no_frames_in_steady_state():
+    """After warm-up, analysing a frame allocates far less than one frame."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    controller = GestureController(hands=NoHands())
+    for _ in range(3):
+        analysis = controller.analyze_frame(frame)
+    np.testing.assert_array_equal(analysis["image"], cv2.flip(frame, 1))
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(5):
+        controller.annotate_frame(controller.analyze_frame(frame))
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    assert peak < frame.nbytes // 10
+    assert controller.frame_pool.allocations == 4  # Two flip and two RGB slots
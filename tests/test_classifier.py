@@ -0,0 +1,101 @@
+"""Unit tests for the static gesture rules and the trainable classifier."""
+
+import numpy as np
+
+from src.classifier import NUM_FEATURES, LandmarkClassifier, landmark_features, train_classifier
+from src.gesture_control import GestureController
+
+UP, DOWN = (-0.4, -0.6, -0.7, -0.8), (-0.4, -0.55, -0.45, -0.4)
+POSES = {
+    "Closed Fist": (0, 0, 0, 0, 0),
+    "Open Palm": (1, 1, 1, 1, 1),
+    "3 Fingers": (1, 1, 1, 0, 0),
+    "Victory": (0, 1, 1, 0, 0),
+    "ILY": (1, 1, 0, 0, 1),
+    "Pinch": None,
+}
+
+def pose(states, left=False, rng=None):
+    """An upright right hand (mirrored when ``left``) with the given fingers up."""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    if states is None:
+        # Pinch: thumb tip meets the half-bent index tip, other fingers up
+        hand[1:5, :2] = [(-0.15, -0.1), (-0.25, -0.25), (-0.3, -0.45), (-0.21, -0.63)]
+        hand[5:9, :2] = [(-0.12, -0.4), (-0.15, -0.55), (-0.18, -0.62), (-0.2, -0.66)]
+        states = (0, 0, 1, 1, 1)
+    else:
+        thumb_tip = (-0.4, -0.35) if states[0] else (-0.2, -0.3)
+        hand[1:5, :2] = [(-0.15, -0.1), (-0.25, -0.2), (-0.32, -0.28), thumb_tip]
+        hand[5:9, 0] = -0.12
+        hand[5:9, 1] = UP if states[1] else DOWN
+    for finger, base_x in ((2, 0.0), (3, 0.12), (4, 0.22)):
+        start = 1 + 4 * finger
+        hand[start:start + 4, 0] = base_x
+        hand[start:start + 4, 1] = UP if states[finger] else DOWN
+    if rng is not None:
+        hand[:, :2] += rng.normal(0, 0.015, (21, 2))
+        angle = rng.uniform(-0.4, 0.4)
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        hand[:, :2] = hand[:, :2] @ rotation.T
+    if left:
+        hand[:, 0] *= -1
+    scale = 0.25 if rng is None else rng.uniform(0.15, 0.35)
+    return hand * scale + [0.5, 0.7, 0.0]
+
+def dataset(count, seed):
+    rng = np.random.default_rng(seed)
+    names = list(POSES)
+    labels = [names[i % len(names)] for i in range(count)]
+    left = rng.random(count) < 0.5
+    hands = np.stack([pose(POSES[name], l, rng) for name, l in zip(labels, left)])
+    handedness = [("Left" if l else "Right", 0.9) for l in left]
+    return hands, handedness, labels
+
+def test_rules_work_for_both_hands():
+    """Test the thumb and named poses are recognised on left and right hands."""
+    controller = GestureController(hands=object())
+    for left in (False, True):
+        for name, states in POSES.items():
+            hand = pose(states, left)
+            # Victory is left to the classifier; the rules count two fingers
+            assert controller.detect_gesture(hand) == ("2 Fingers" if name == "Victory" else name)
+            if states is not None:
+                assert controller.count_fingers(hand) == sum(states)
+
+def test_features_mirror_left_hands():
+    """Test a left hand has the features of the mirrored right hand."""
+    right = pose(POSES["ILY"])
+    features = landmark_features(np.stack([right, pose(POSES["ILY"], left=True)]),
+                                 [("Right", 0.9), ("Left", 0.9)])
+    assert features.shape == (2, NUM_FEATURES)
+    np.testing.assert_allclose(features[0], features[1], atol=1e-5)
+
+def test_trained_classifier(tmp_path):
+    """Test a model trained on varied poses generalises and round-trips."""
+    hands, handedness, labels = dataset(600, seed=0)
+    model = train_classifier(landmark_features(hands, handedness), labels)
+    
+    test_hands, test_handedness, test_labels = dataset(300, seed=1)
+    predicted = model.predict(test_hands, test_handedness)
+    assert np.mean([p == t for p, t in zip(predicted, test_labels)]) > 0.95
+    
+    path = str(tmp_path / "model.npz")
+    model.save(path)
+    loaded = LandmarkClassifier.load(path)
+    np.testing.assert_allclose(loaded.predict_proba(test_hands, test_handedness),
+                               model.predict_proba(test_hands, test_handedness), atol=1e-6)
+    assert model.predict(np.empty((0, 21, 3))) == []
+
+def test_controller_uses_classifier():
+    """Test the model decides static gestures, the rules only when unsure."""
+    hands, handedness, labels = dataset(300, seed=2)
+    model = train_classifier(landmark_features(hands, handedness), labels, epochs=200)
+    controller = GestureController(hands=object(), classifier=model)
+    frame = np.stack([pose(POSES["Victory"]), pose((0, 1, 0, 0, 0), left=True)])
+    
+    model.threshold = 1.1  # Never confident: rules decide
+    assert controller.detect_gestures(frame, [("Right", 0.9), ("Left", 0.9)]) == ["2 Fingers", "1 Fingers"]
+    model.threshold = 0.0
+    gestures = controller.analyze_landmarks(frame, [("Right", 0.9), ("Left", 0.9)], 0.0)["gestures"]
+    assert gestures[0] == "Victory"
+    assert gestures[1] in POSES
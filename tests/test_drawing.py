@@ -0,0 +1,81 @@
+"""Tests for the tiled drawing canvas."""
+
+import json
+
+import cv2
+import numpy as np
+
+from src.drawing import DrawingCanvas
+from src.gesture_features import GestureFeatures
+from src.landmarks import INDEX_DIP, INDEX_TIP, MIDDLE_DIP, MIDDLE_TIP
+
+
+def draw_line(canvas: DrawingCanvas) -> None:
+    """A red stroke across the upper left of the frame."""
+    canvas.begin_stroke((0, 0, 255), 3)
+    for x in np.linspace(0.1, 0.4, 10):
+        canvas.add_point(x, 0.2)
+    canvas.end_stroke()
+
+
+def test_composite_matches_full_frame_blend():
+    """Blending inked tiles in place equals blending the whole frame."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)
+    canvas = DrawingCanvas(tile=32)
+    canvas.resize(frame.shape)
+    draw_line(canvas)
+
+    expected = cv2.addWeighted(frame, 1, canvas._ink, 0.5, 0)
+    result = canvas.composite(frame)
+    assert result is frame
+    assert np.array_equal(result, expected)
+    assert 0 < canvas.inked_tiles < canvas._mask.size // 4
+
+
+def test_resolution_change_rerenders_strokes():
+    """Strokes survive a frame size change at the same relative position."""
+    canvas = DrawingCanvas()
+    draw_line(canvas)
+    small = canvas.composite(np.zeros((120, 160, 3), dtype=np.uint8))
+    large = canvas.composite(np.zeros((480, 640, 3), dtype=np.uint8))
+    assert small[24, 40].any() and large[96, 160].any()
+    assert not large[300, 300].any()
+
+
+def test_clear_removes_ink():
+    """Clearing leaves nothing to composite."""
+    canvas = DrawingCanvas()
+    canvas.resize((120, 160, 3))
+    draw_line(canvas)
+    canvas.clear()
+    assert canvas.inked_tiles == 0 and not canvas._ink.any()
+    assert not canvas.composite(np.zeros((120, 160, 3), dtype=np.uint8)).any()
+
+
+def test_json_round_trip_and_svg():
+    """Strokes export to JSON and SVG and load back."""
+    canvas = DrawingCanvas()
+    draw_line(canvas)
+    restored = DrawingCanvas.from_json(canvas.to_json())
+    assert json.loads(restored.to_json()) == json.loads(canvas.to_json())
+    svg = canvas.to_svg(200, 100)
+    assert svg.count("<polyline") == 1
+    assert 'stroke="#ff0000"' in svg and "20.0,20.0" in svg
+
+
+def test_handle_drawing_records_strokes():
+    """Index-only pose draws; lowering the index ends the stroke."""
+    features = GestureFeatures()
+    landmarks = np.zeros((21, 3), dtype=np.float32)
+    landmarks[INDEX_DIP, 1], landmarks[MIDDLE_TIP, 1], landmarks[MIDDLE_DIP, 1] = 0.5, 0.6, 0.5
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    for x in (0.2, 0.3, 0.4):
+        landmarks[INDEX_TIP] = (x, 0.3, 0)
+        frame = features.handle_drawing(landmarks, frame)
+    landmarks[INDEX_TIP, 1] = 0.7
+    features.handle_drawing(landmarks, frame)
+    canvas = features.drawing_canvas
+    assert not canvas.drawing and len(canvas.strokes) == 1
+    assert len(canvas.strokes[0].points) == 3
+    assert frame[36, 48].any()
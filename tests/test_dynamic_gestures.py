@@ -0,0 +1,81 @@
+"""Unit tests for sliding-window dynamic gesture detection."""
+
+import math
+
+import numpy as np
+
+from src.dynamic_gestures import DynamicGestureDetector, MotionHistory
+
+def hand(x, y, size=0.2, pinch=False):
+    """An open hand with its palm centred near (x, y)."""
+    points = np.zeros((21, 3), dtype=np.float32)
+    points[:, 0], points[:, 1] = x, y
+    points[0, 1] = y + size / 2  # Wrist
+    points[9, 1] = y - size / 2  # Middle finger base
+    points[4, 0] = x - size  # Thumb tip
+    points[8, :2] = (x - size * 0.9, y) if pinch else (x + size, y - size)
+    return points
+
+def run(detector, positions, hand_id=0, fps=30, **kwargs):
+    """Feed positions at ``fps`` and collect the gestures."""
+    gestures = []
+    for i, (x, y) in enumerate(positions):
+        gesture = detector.update(hand_id, hand(x, y, **kwargs), i / fps)
+        if gesture:
+            gestures.append(gesture)
+    return gestures
+
+def test_two_hands_swipe_independently():
+    """Test each hand has its own buffer and swipes do not mix."""
+    detector = DynamicGestureDetector()
+    gestures = {0: [], 1: []}
+    for i in range(20):
+        for hand_id, direction in ((0, 1), (1, -1)):
+            x = 0.5 + direction * 0.02 * i
+            gesture = detector.update(hand_id, hand(x, 0.5), i / 30)
+            if gesture:
+                gestures[hand_id].append(gesture)
+    assert gestures == {0: ["Swipe Right"], 1: ["Swipe Left"]}
+
+def test_slow_drift_and_jitter_are_not_swipes():
+    """Test displacement must happen within the window."""
+    rng = np.random.default_rng(0)
+    detector = DynamicGestureDetector()
+    drift = [(0.2 + 0.005 * i, 0.5) for i in range(120)]
+    jitter = [(0.5 + dx, 0.5 + dy) for dx, dy in rng.normal(0, 0.003, (120, 2))]
+    assert run(detector, drift) == []
+    assert run(detector, jitter, hand_id=1) == []
+
+def test_circles_report_direction():
+    """Test a full revolution is a circle in the direction drawn."""
+    for sign, name in ((1, "Circle Clockwise"), (-1, "Circle Counterclockwise")):
+        angles = np.linspace(0, sign * 2.2 * math.pi, 40)
+        path = [(0.5 + 0.1 * math.cos(a), 0.5 + 0.1 * math.sin(a)) for a in angles]
+        assert run(DynamicGestureDetector(), path) == [name]
+
+def test_push_and_pull_follow_hand_size():
+    """Test a growing hand is a push and a shrinking one a pull."""
+    detector = DynamicGestureDetector()
+    gestures = []
+    sizes = list(np.linspace(0.15, 0.25, 15)) + list(np.linspace(0.25, 0.15, 15))
+    for i, size in enumerate(sizes):
+        gesture = detector.update(0, hand(0.5, 0.5, size=size), i / 30)
+        if gesture:
+            gestures.append(gesture)
+    assert gestures == ["Push", "Pull"]
+
+def test_pinch_drag_suppresses_swipes():
+    """Test moving while pinched drags instead of swiping."""
+    detector = DynamicGestureDetector()
+    positions = [(0.2 + 0.03 * i, 0.5) for i in range(20)]
+    assert run(detector, positions, pinch=True) == ["Pinch Drag"]
+    assert detector.update(0, hand(0.8, 0.5), 1.0) == "Pinch Drop"
+
+def test_history_is_bounded():
+    """Test the ring buffer keeps a fixed number of samples."""
+    history = MotionHistory(capacity=8)
+    for i in range(100):
+        history.push(i / 30, 0.01 * i, 0.5, 0.0)
+    assert len(history) == 8
+    assert history.oldest(10.0)[0] == history.samples[(100 - 8) % 8][0]
+    assert history.newest()[0] == 0.99
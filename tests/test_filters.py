@@ -0,0 +1,68 @@
+"""Unit tests for landmark smoothing filters."""
+
+import numpy as np
+import pytest
+from src.filters import KalmanFilterBank, OneEuroFilterBank
+from src.gesture_control import GestureController
+
+FPS = 30.0
+
+def noisy_track(velocity, frames=90, noise=0.003, seed=0):
+    """A hand moving at ``velocity`` (units/s) with landmark jitter."""
+    rng = np.random.default_rng(seed)
+    base = rng.uniform(0.3, 0.5, (21, 3)).astype(np.float32)
+    t = np.arange(frames) / FPS
+    truth = base + velocity * t[:, None, None]
+    return t, truth, truth + rng.normal(0, noise, truth.shape).astype(np.float32)
+
+def run(bank, t, noisy, hand_id="Right"):
+    return np.array([bank.filter([hand_id], frame[None], ts)[0] for ts, frame in zip(t, noisy)])
+
+@pytest.mark.parametrize("bank", [OneEuroFilterBank(), KalmanFilterBank()])
+def test_filters_reduce_jitter(bank):
+    """Test a still hand is smoothed well below its measurement noise."""
+    t, truth, noisy = noisy_track(0.0)
+    filtered = run(bank, t, noisy)
+    raw_error = np.abs(noisy[30:] - truth[30:]).mean()
+    assert np.abs(filtered[30:] - truth[30:]).mean() < 0.75 * raw_error
+
+@pytest.mark.parametrize("bank", [OneEuroFilterBank(), KalmanFilterBank()])
+def test_filters_follow_motion(bank):
+    """Test a moving hand is tracked with little lag."""
+    t, truth, noisy = noisy_track(np.array([0.5, 0.0, 0.0], np.float32), noise=0.001)
+    filtered = run(bank, t, noisy)
+    assert np.abs(filtered[-10:] - truth[-10:]).mean() < 0.01
+
+@pytest.mark.parametrize("bank", [OneEuroFilterBank(), KalmanFilterBank()])
+def test_duplicate_timestamps_keep_smoothing(bank):
+    """Test a repeated timestamp holds the estimate instead of resetting it."""
+    t, truth, noisy = noisy_track(0.0)
+    filtered = run(bank, t[:60], noisy[:60])
+    repeated = bank.filter(["Right"], noisy[60][None] + 0.05, t[59])[0]
+    np.testing.assert_array_equal(repeated, filtered[-1])
+    
+    # Filtering carries on from the held state, not from the outlier
+    after = run(bank, t[60:], noisy[60:])
+    assert np.abs(after - truth[60:]).mean() < 0.75 * np.abs(noisy[60:] - truth[60:]).mean()
+
+def test_hands_are_independent():
+    """Test hands are filtered together but keep separate state."""
+    bank = OneEuroFilterBank()
+    left, right = np.zeros((21, 3), np.float32), np.ones((21, 3), np.float32)
+    bank.filter(["Left", "Right"], np.stack([left, right]), 0.0)
+    # Hands swapped in detector order: IDs keep their state apart
+    out = bank.filter(["Right", "Left"], np.stack([right, left]), 1 / FPS)
+    np.testing.assert_allclose(out, np.stack([right, left]))
+    
+    # State expires after max_age
+    bank.prune(1.0)
+    assert len(bank) == 0
+
+def test_controller_smooths_landmarks():
+    """Test the controller hands smoothed landmarks to its gesture logic."""
+    t, truth, noisy = noisy_track(0.0)
+    controller = GestureController(landmark_filter=OneEuroFilterBank())
+    outputs = [controller.analyze_landmarks(frame[None], [("Right", 0.9)], ts)["landmarks"][0]
+               for ts, frame in zip(t, noisy)]
+    controller.close()
+    assert np.abs(np.array(outputs)[30:] - truth[30:]).mean() < np.abs(noisy[30:] - truth[30:]).mean()
@@ -19,14 +19,32 @@ def test_process_frame():
     test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
     
     # Process frame
-    gesture, annotated_frame = controller.process_frame(test_frame)
+    gestures, annotated_frame = controller.process_frame(test_frame)
     
     # Verify outputs
-    assert gesture == "No Gesture"
+    assert gestures == []
     assert annotated_frame.shape == test_frame.shape
     
     controller.close()
 
+def test_process_frame_without_annotation():
+    """Test landmark-only processing leaves the frame untouched."""
+    controller = GestureController()
+    
+    test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    test_frame[:, :320] = 255
+    
+    gestures, image = controller.process_frame(test_frame, annotate=False)
+    assert gestures == []
+    np.testing.assert_array_equal(image, cv2.flip(test_frame, 1))
+    
+    analysis = controller.analyze_frame(test_frame)
+    assert analysis["landmarks"].shape == (0, 21, 3)
+    assert analysis["landmarks"].dtype == np.float32
+    assert analysis["handedness"] == []
+    
+    controller.close()
+
 def test_handle_gesture_command():
     """Test gesture command handling."""
     controller = GestureController()
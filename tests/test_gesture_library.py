@@ -0,0 +1,101 @@
+"""Unit tests for the persistent custom gesture library."""
+
+import multiprocessing
+import os
+import numpy as np
+from src.gesture_control import GestureController
+from src.gesture_library import RECORD_SIZE, append_template, load_templates, save_templates
+from src.gesture_templates import GestureTemplates
+
+def test_save_and_load(tmp_path):
+    """Test templates survive a save/load round trip via a read-only map."""
+    rng = np.random.default_rng(0)
+    templates = GestureTemplates()
+    hands = rng.random((3, 21, 3)).astype(np.float32)
+    for i, hand in enumerate(hands):
+        templates.add(f"g{i}", hand)
+    
+    path = str(tmp_path / "gestures.gtpl")
+    save_templates(templates, path)
+    loaded = load_templates(path)
+    
+    assert loaded.names == ["g0", "g1", "g2"]
+    assert isinstance(loaded.templates, np.memmap)
+    assert not loaded.templates.flags.writeable
+    np.testing.assert_array_equal(loaded.templates, templates.templates)
+    
+    # Modifying the loaded set gives it a private copy
+    loaded.add("g3", hands[0])
+    assert len(loaded) == 4
+    assert load_templates(path).names == ["g0", "g1", "g2"]
+
+def test_append(tmp_path):
+    """Test appending writes one record and re-recording overwrites in place."""
+    rng = np.random.default_rng(1)
+    path = str(tmp_path / "gestures.gtpl")
+    first, second = rng.random((2, 21, 3)).astype(np.float32)
+    
+    append_template(path, "wave", first)
+    size = os.path.getsize(path)
+    append_template(path, "wave", second)
+    append_template(path, "point", first)
+    assert os.path.getsize(path) == size + RECORD_SIZE
+    
+    loaded = load_templates(path)
+    assert loaded.names == ["wave", "point"]
+    assert isinstance(loaded.templates, np.memmap)  # No duplicates to resolve by copying
+    assert loaded.match(second, threshold=1e-3)[0] == "wave"
+    assert loaded.match(first, threshold=1e-3)[0] == "point"
+
+def test_append_after_crash(tmp_path):
+    """Test a record orphaned by a crashed append does not shift later names."""
+    rng = np.random.default_rng(3)
+    path = str(tmp_path / "gestures.gtpl")
+    wave, orphan, point = rng.random((3, 21, 3)).astype(np.float32)
+    
+    append_template(path, "wave", wave)
+    with open(path, "ab") as handle:  # Crash after the record, before its name
+        handle.write(orphan.astype("<f4").tobytes())
+    assert load_templates(path).names == ["wave"]
+    
+    append_template(path, "point", point)
+    loaded = load_templates(path)
+    assert loaded.names == ["wave", "point"]
+    assert loaded.match(point, threshold=1e-3)[0] == "point"
+    assert loaded.match(wave, threshold=1e-3)[0] == "wave"
+
+def append_many(path, prefix, count):
+    rng = np.random.default_rng(len(prefix))
+    for i in range(count):
+        append_template(path, f"{prefix}{i}", rng.random((21, 3)).astype(np.float32))
+
+def test_concurrent_appends(tmp_path):
+    """Test processes appending to one library keep names and records paired."""
+    path = str(tmp_path / "gestures.gtpl")
+    prefixes = ["a", "bb", "ccc", "dddd"]
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=append_many, args=(path, prefix, 25)) for prefix in prefixes]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    
+    loaded = load_templates(path)
+    assert len(loaded) == 100
+    for prefix in prefixes:
+        rng = np.random.default_rng(len(prefix))
+        for i in range(25):
+            assert loaded.match(rng.random((21, 3)), threshold=1e-3)[0] == f"{prefix}{i}"
+
+def test_controller_persists_recorded_gestures(tmp_path):
+    """Test gestures recorded by one controller are loaded by the next."""
+    path = str(tmp_path / "gestures.gtpl")
+    hand = np.random.default_rng(2).random((21, 3)).astype(np.float32)
+    
+    controller = GestureController(gesture_library=path)
+    controller.record_custom_gesture("fist", hand)
+    controller.close()
+    
+    controller = GestureController(gesture_library=path)
+    assert controller.match_custom_gesture(hand) == "fist"
+    controller.close()
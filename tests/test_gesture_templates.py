@@ -0,0 +1,49 @@
+"""Unit tests for the vectorised custom gesture templates."""
+
+import numpy as np
+from src.gesture_templates import GestureTemplates, normalize_landmarks
+
+def test_normalization_invariance():
+    """Test normalisation removes translation, scale and in-plane rotation."""
+    rng = np.random.default_rng(0)
+    hand = rng.random((21, 3)).astype(np.float32)
+    
+    angle = 0.7
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    moved = hand.copy()
+    moved[:, :2] = hand[:, :2] @ rotation.T * 2.0 + 0.3
+    moved[:, 2] *= 2.0
+    
+    np.testing.assert_allclose(normalize_landmarks(moved), normalize_landmarks(hand), atol=1e-5)
+    np.testing.assert_allclose(normalize_landmarks(np.stack([hand, moved]))[1],
+                               normalize_landmarks(hand), atol=1e-5)
+
+def test_add_replace_remove():
+    """Test templates stay contiguous while being edited."""
+    rng = np.random.default_rng(1)
+    templates = GestureTemplates(capacity=1)
+    hands = {name: rng.random((21, 3)).astype(np.float32) for name in "abc"}
+    for name, hand in hands.items():
+        templates.add(name, hand)
+    
+    assert len(templates) == 3
+    assert templates.templates.shape == (3, 21, 3)
+    assert templates.match(hands["b"], threshold=0.01)[0] == "b"
+    
+    templates.remove("a")
+    assert templates.names == ["c", "b"]
+    assert templates.match(hands["c"], threshold=0.01)[0] == "c"
+    assert templates.match(hands["a"], threshold=0.01)[0] is None
+
+def test_index_matches_exact_search():
+    """Test the PCA index finds the same template as the exact search."""
+    rng = np.random.default_rng(2)
+    exact = GestureTemplates(index_threshold=10 ** 6)
+    indexed = GestureTemplates(index_threshold=1, candidates=8)
+    hands = rng.random((200, 21, 3)).astype(np.float32)
+    for i, hand in enumerate(hands):
+        exact.add(str(i), hand)
+        indexed.add(str(i), hand)
+    
+    for hand in hands[:20] + rng.normal(0, 0.005, (20, 21, 3)).astype(np.float32):
+        assert indexed.match(hand, 1.0)[0] == exact.match(hand, 1.0)[0]
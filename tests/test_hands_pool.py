@@ -0,0 +1,66 @@
+"""Unit tests for the pooled MediaPipe graph manager."""
+
+import numpy as np
+from backend.hands_pool import HandsPool
+from src.gesture_control import GestureController
+
+def test_lease_affinity():
+    """Test sessions get their own graph back and the pool stays bounded."""
+    pool = HandsPool(max_size=2)
+    
+    with pool.lease("a") as hands_a:
+        with pool.lease("b") as hands_b:
+            assert hands_a is not hands_b
+    
+    with pool.lease("b") as hands:
+        assert hands is hands_b
+    with pool.lease("a") as hands:
+        assert hands is hands_a
+    
+    with pool.lease("c") as hands:
+        assert hands in (hands_a, hands_b)
+    assert len(pool) == 2
+    
+    pool.close()
+
+def test_graph_forgotten_while_leased_is_reset():
+    """Test a session never inherits tracking state forgotten mid-frame."""
+    pool = HandsPool(max_size=1)
+    graph = pool.acquire("a")
+    pool.forget("a")  # Session closed while its frame is still processing
+    pool.release(graph)
+    
+    resets = []
+    reset = graph.hands.reset
+    graph.hands.reset = lambda: resets.append(True) or reset()
+    assert pool.acquire("b") is graph
+    assert resets == [True]
+    pool.release(graph)
+    pool.close()
+
+def test_evict_idle():
+    """Test unused graphs are closed after the idle timeout."""
+    pool = HandsPool(max_size=2, idle_timeout=0.0)
+    with pool.lease("a"):
+        pass
+    
+    assert pool.evict_idle() == 1
+    assert len(pool) == 0
+
+def test_controller_uses_leased_graph():
+    """Test a controller processes frames with an injected graph."""
+    pool = HandsPool(max_size=1)
+    controller = GestureController()
+    
+    with pool.lease("a") as hands:
+        controller.hands = hands
+        gestures, annotated_frame = controller.process_frame(np.zeros((120, 160, 3), dtype=np.uint8))
+        controller.hands = None
+    
+    assert gestures == []
+    controller.close()
+    
+    # The controller must not close a graph it does not own
+    with pool.lease("a") as hands:
+        hands.process(np.zeros((120, 160, 3), dtype=np.uint8))
+    pool.close()
@@ -0,0 +1,41 @@
+"""Unit tests for the latest-frame-wins ingest stage."""
+
+import asyncio
+import pytest
+from backend.ingest import FrameMailbox, MailboxClosed, pump
+
+def test_mailbox_keeps_newest_frame():
+    """Test stale frames are dropped and counted."""
+    async def main():
+        mailbox = FrameMailbox()
+        for i in range(5):
+            mailbox.put(i)
+        message, _, dropped = await mailbox.get()
+        return mailbox, message, dropped
+    
+    mailbox, message, dropped = asyncio.run(main())
+    assert message == 4
+    assert dropped == 4
+    assert mailbox.received == 5
+    assert mailbox.dropped == 4
+
+def test_pump_closes_mailbox():
+    """Test the consumer stops once the producer fails."""
+    async def main():
+        messages = iter([b"a", b"b"])
+        
+        async def receive():
+            await asyncio.sleep(0)
+            return next(messages)  # StopIteration ends the stream
+        
+        mailbox = FrameMailbox()
+        reader = asyncio.create_task(pump(receive, mailbox))
+        received = []
+        with pytest.raises(MailboxClosed):
+            while True:
+                message, _, _ = await mailbox.get()
+                received.append(message)
+        await asyncio.gather(reader, return_exceptions=True)
+        return received
+    
+    assert asyncio.run(main())[-1] == b"b"
@@ -0,0 +1,65 @@
+"""Unit tests for the NumPy landmark representation."""
+
+from types import SimpleNamespace
+import numpy as np
+from benchmarks.synthetic import to_protobuf
+import src.gesture_control as gesture_control
+from src.gesture_control import GestureController
+from src.landmarks import as_landmark_array, hands_to_array, landmarks_to_array
+
+def make_hand(fingers_up: int) -> np.ndarray:
+    """Build a simple upright hand with the first ``fingers_up`` fingers raised."""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, :2] = 0.5
+    # Thumb: tip left of the IP joint when raised
+    hand[3, 0] = 0.40
+    hand[4, 0] = 0.35 if fingers_up >= 1 else 0.45
+    for finger in range(4):
+        tip = 8 + 4 * finger
+        hand[tip - 2, 1] = 0.40
+        hand[tip, 1] = 0.30 if finger + 1 < fingers_up else 0.45
+    return hand
+
+def test_conversion():
+    """Test protobuf hands convert to (21, 3) and batched arrays."""
+    hand = np.random.rand(21, 3).astype(np.float32)
+    
+    np.testing.assert_allclose(landmarks_to_array(to_protobuf(hand)), hand)
+    assert hands_to_array([to_protobuf(hand)] * 2).shape == (2, 21, 3)
+    assert hands_to_array(None).shape == (0, 21, 3)
+    assert as_landmark_array(hand) is hand
+
+def test_gestures_from_arrays():
+    """Test gesture logic gives the same answers for arrays and protobufs."""
+    controller = GestureController()
+    
+    for fingers in range(6):
+        hand = make_hand(fingers)
+        assert controller.count_fingers(hand) == fingers
+        assert controller.count_fingers(to_protobuf(hand)) == fingers
+    
+    assert controller.detect_gesture(make_hand(0)) == "Closed Fist"
+    assert controller.detect_gesture(make_hand(5)) == "Open Palm"
+    
+    controller.record_custom_gesture("peace", to_protobuf(make_hand(3)))
+    assert controller.match_custom_gesture(make_hand(3)) == "peace"
+    
+    controller.update_trajectory(0, make_hand(5))
+    np.testing.assert_allclose(controller.trajectories[0][-1], [0.5, 0.5])
+    
+    controller.close()
+
+def test_landmark_objects_only_built_for_drawing(monkeypatch):
+    """Test analysis stays array-only; annotation builds what it draws."""
+    label = SimpleNamespace(classification=[SimpleNamespace(label="Right", score=0.9)])
+    results = SimpleNamespace(multi_hand_landmarks=[to_protobuf(make_hand(5))],
+                              multi_handedness=[label])
+    controller = GestureController(hands=SimpleNamespace(process=lambda image: results))
+    built = []
+    monkeypatch.setattr(gesture_control, "array_to_landmarks",
+                        lambda hand: built.append(hand) or to_protobuf(hand))
+    
+    analysis = controller.analyze_frame(np.zeros((120, 160, 3), np.uint8))
+    assert "hand_landmarks" not in analysis and built == []
+    assert controller.annotate_frame(analysis).any()
+    assert len(built) == 1
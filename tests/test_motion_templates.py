@@ -0,0 +1,107 @@
+"""Unit tests for DTW motion gesture templates."""
+
+import numpy as np
+import pytest
+
+from src.gesture_control import GestureController
+from src.motion_templates import MotionTemplates, normalize_trajectory
+
+def zigzag(points=42):
+    """A "Z" drawn left to right, top to bottom."""
+    third = points // 3
+    return np.concatenate([
+        np.column_stack([np.linspace(0, 1, third), np.zeros(third)]),
+        np.column_stack([np.linspace(1, 0, third), np.linspace(0, 1, third)]),
+        np.column_stack([np.linspace(0, 1, third), np.ones(third)]),
+    ])
+
+def wave(points=40):
+    t = np.linspace(0, 1, points)
+    return np.column_stack([t, 0.2 * np.sin(4 * np.pi * t)])
+
+def circle(points=40):
+    t = np.linspace(0, 2 * np.pi, points)
+    return np.column_stack([np.cos(t), np.sin(t)])
+
+def reference_dtw(query, template, band):
+    """Textbook banded DTW with squared point distances."""
+    size = len(query)
+    table = np.full((size + 1, size + 1), np.inf)
+    table[0, 0] = 0
+    for i in range(1, size + 1):
+        for j in range(max(1, i - band), min(size, i + band) + 1):
+            cost = ((query[i - 1] - template[j - 1]) ** 2).sum()
+            table[i, j] = cost + min(table[i - 1, j], table[i, j - 1], table[i - 1, j - 1])
+    return table[size, size]
+
+def test_normalize_trajectory_ignores_position_size_and_speed():
+    """Test the same shape drawn anywhere, at any size and pace matches."""
+    path = zigzag()
+    uneven = np.concatenate([path[:10:3], path[10:]])
+    moved = normalize_trajectory(uneven * 0.3 + 0.5)
+    assert moved.shape == (32, 2)
+    assert np.abs(moved - normalize_trajectory(path)).max() < 0.05
+    assert np.ptp(moved, axis=0).max() == pytest.approx(1.0)
+
+def test_dtw_and_lower_bound():
+    """Test batched DTW matches the textbook recursion and LB_Keogh bounds it."""
+    rng = np.random.default_rng(0)
+    templates = MotionTemplates()
+    for i in range(20):
+        templates.add(f"walk{i}", np.cumsum(rng.normal(size=(30, 2)), axis=0))
+    query = normalize_trajectory(np.cumsum(rng.normal(size=(30, 2)), axis=0))
+    
+    costs = templates.dtw(query, np.arange(20))
+    expected = [reference_dtw(query, t, templates.band) for t in templates.templates]
+    np.testing.assert_allclose(costs, expected, rtol=1e-4)
+    assert np.all(templates.lower_bounds(query) <= costs + 1e-5)
+
+def test_match_among_many_templates():
+    """Test noisy, resampled performances match among random distractors."""
+    rng = np.random.default_rng(1)
+    templates = MotionTemplates()
+    for i in range(300):
+        templates.add(f"walk{i}", np.cumsum(rng.normal(size=(30, 2)), axis=0))
+    for name, path in (("Z", zigzag()), ("wave", wave()), ("circle", circle())):
+        templates.add(name, path)
+    
+    for name, path in (("Z", zigzag()), ("wave", wave()), ("circle", circle())):
+        kept = np.sort(rng.choice(len(path), 30, replace=False))
+        performed = path[kept] * 0.3 + 0.4 + rng.normal(0, 0.005, (30, 2))
+        assert templates.match(performed, 0.1)[0] == name
+    
+    for i in range(300):
+        templates.remove(f"walk{i}")
+    line = np.column_stack([np.linspace(0, 1, 30), np.zeros(30)])
+    assert templates.match(line, 0.1)[0] is None
+
+def test_remove_and_persist(tmp_path):
+    """Test templates survive a save/load round trip and removal."""
+    templates = MotionTemplates()
+    templates.add("Z", zigzag())
+    templates.add("wave", wave())
+    templates.remove("Z")
+    path = str(tmp_path / "motions.npz")
+    templates.save(path)
+    loaded = MotionTemplates.load(path)
+    assert loaded.names == ["wave"]
+    assert loaded.match(wave(25), 0.1)[0] == "wave"
+
+def test_controller_records_and_matches_trajectories():
+    """Test a recorded trajectory matches once when performed again."""
+    controller = GestureController(hands=object())
+    hand = np.zeros((1, 21, 3), dtype=np.float32)
+    path = zigzag(33) * 0.3 + 0.3
+    
+    for i, (x, y) in enumerate(path[1:]):
+        hand[0, :, :2] = x, y
+        controller.analyze_landmarks(hand, [("Right", 0.9)], i / 30)
+    controller.record_motion_gesture("Z")
+    for trajectory in controller.trajectories.values():
+        trajectory.clear()
+    
+    gestures = []
+    for i, (x, y) in enumerate(path[1:] + 0.1):
+        hand[0, :, :2] = x, y
+        gestures += controller.analyze_landmarks(hand, [("Right", 0.9)], 2 + i / 30)["gestures"]
+    assert gestures.count("Motion: Z") == 1
@@ -0,0 +1,69 @@
+"""Tests for trajectory buffers and cached annotation overlays."""
+
+import cv2
+import numpy as np
+
+from src.gesture_control import GestureController
+from src.overlays import HistoryOverlay, TrajectoryBuffer, TrajectoryRenderer
+
+
+def test_trajectory_buffer_wraps_in_order():
+    """The newest ``capacity`` points come back oldest first, as one view."""
+    buffer = TrajectoryBuffer(4)
+    for i in range(6):
+        buffer.append((i, -i))
+    points = buffer.points()
+    assert len(buffer) == 4 and points.base is not None
+    np.testing.assert_array_equal(points[:, 0], [2, 3, 4, 5])
+    np.testing.assert_array_equal(buffer[-1], [5, -5])
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.points().shape == (0, 2)
+
+
+def test_renderer_batches_by_colour_bucket(monkeypatch):
+    """Any number of hands costs at most one polylines call per bucket."""
+    renderer = TrajectoryRenderer(32, buckets=4)
+    calls = []
+    polylines = cv2.polylines
+    monkeypatch.setattr(cv2, "polylines", lambda *args: calls.append(args) or polylines(*args))
+
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    t = np.linspace(0.1, 0.9, 32, dtype=np.float32)
+    hands = [np.column_stack([t, np.full_like(t, y)]) for y in (0.2, 0.5, 0.8)]
+    renderer.draw(image, hands)
+    assert len(calls) == 4
+    # Old end in the reddest bucket, new end in the greenest
+    assert tuple(image[20, 22]) == renderer.colors[0]
+    assert tuple(image[80, 178]) == renderer.colors[-1]
+
+
+def test_controller_draws_only_current_hands():
+    """Trajectories of hands missing from the frame are not drawn."""
+    controller = GestureController(hands=object())
+    for i in range(5):
+        controller.trajectories.setdefault(0, TrajectoryBuffer(32)).append((0.1 + i / 20, 0.2))
+        controller.trajectories.setdefault(1, TrajectoryBuffer(32)).append((0.1 + i / 20, 0.8))
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    controller.draw_trajectories(image, [1])
+    assert not image[:50].any() and image[50:].any()
+
+
+def test_history_overlay_matches_put_text_and_caches():
+    """The pasted overlay equals drawing the text, and renders once per change."""
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)
+    history = ["Open Palm", "Swipe Left", "Victory"]
+
+    expected = frame.copy()
+    for i, gesture in enumerate(reversed(history)):
+        cv2.putText(expected, f"Recent: {gesture}", (10, 30 + i * 30),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
+    overlay = HistoryOverlay()
+    for _ in range(3):
+        image = frame.copy()
+        overlay.draw(image, history)
+    np.testing.assert_array_equal(image, expected)
+    assert overlay.renders == 1
+
+    overlay.draw(frame.copy(), history + ["Push"])
+    assert overlay.renders == 2
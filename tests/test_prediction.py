@@ -0,0 +1,64 @@
+"""Unit tests for frame skipping and landmark prediction."""
+
+import cv2
+import numpy as np
+import pytest
+from src.gesture_control import GestureController
+from src.prediction import FrameSkipper
+
+def hand(x, y):
+    """A (1, 21, 3) hand translated to (x, y)."""
+    base = np.random.default_rng(0).uniform(0, 0.1, (1, 21, 3)).astype(np.float32)
+    base[..., 0] += x
+    base[..., 1] += y
+    return base
+
+def test_constant_velocity_prediction():
+    """Test skipped frames extrapolate the last two inferences."""
+    skipper = FrameSkipper(interval=3, adaptive=False)
+    assert skipper.should_infer(0.0)
+    skipper.observe(0.0, hand(0.2, 0.5), [("Right", 0.9)])
+    skipper.observe(0.1, hand(0.25, 0.5), [("Right", 0.9)])
+    
+    assert not skipper.should_infer(0.15)
+    predicted, handedness = skipper.predict(0.15)
+    np.testing.assert_allclose(predicted, hand(0.275, 0.5), atol=1e-6)
+    assert handedness == [("Right", 0.9)]
+    
+    assert not skipper.should_infer(0.2)
+    skipper.predict(0.2)
+    assert skipper.should_infer(0.25)  # Every third frame is inferred
+
+def test_adaptive_inference_on_fast_motion():
+    """Test fast hands and long gaps force inference."""
+    skipper = FrameSkipper(interval=4, motion_threshold=1.0)
+    skipper.observe(0.0, hand(0.2, 0.5), [])
+    skipper.observe(0.1, hand(0.22, 0.5), [])  # 0.2 widths/s
+    assert not skipper.should_infer(0.13)
+    assert skipper.should_infer(0.5)  # Beyond max_gap
+    
+    skipper.observe(0.2, hand(0.4, 0.5), [])  # 1.8 widths/s
+    assert skipper.should_infer(0.23)
+
+def test_optical_flow_correction():
+    """Test optical flow follows a moving textured patch."""
+    rng = np.random.default_rng(1)
+    texture = rng.integers(0, 255, (240, 320), dtype=np.uint8)
+    texture = cv2.GaussianBlur(texture, (5, 5), 0)
+    frame = cv2.cvtColor(texture, cv2.COLOR_GRAY2BGR)
+    moved = np.roll(frame, 8, axis=1)  # 8 px = 0.025 frame widths
+    
+    skipper = FrameSkipper(interval=2, adaptive=False, optical_flow=True)
+    skipper.observe(0.0, hand(0.4, 0.4), [], frame)
+    predicted, _ = skipper.predict(0.03, moved)  # No velocity yet, flow only
+    shift = (predicted - hand(0.4, 0.4))[0, :, :2].mean(axis=0)
+    assert shift[0] == pytest.approx(0.025, abs=0.005)
+    assert shift[1] == pytest.approx(0.0, abs=0.005)
+
+def test_controller_flags_predicted_frames():
+    """Test the controller alternates inferred and predicted frames."""
+    controller = GestureController(frame_skipper=FrameSkipper(interval=2, adaptive=False))
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    flags = [controller.analyze_frame(frame)["predicted"] for _ in range(4)]
+    assert flags == [False, True, False, True]
+    controller.close()
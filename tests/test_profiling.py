@@ -0,0 +1,65 @@
+"""Unit tests for stage profiling and metrics export."""
+
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from backend.metrics import render_metrics
+from src.gesture_control import GestureController
+from src.profiling import LatencyHistogram, StageProfiler
+
+def test_histogram_quantiles():
+    """Test quantile estimates stay within one bucket of the truth."""
+    histogram = LatencyHistogram()
+    samples = np.random.default_rng(0).lognormal(np.log(0.01), 0.5, 10000)
+    for sample in samples:
+        histogram.observe(sample)
+    
+    assert histogram.count == len(samples)
+    assert histogram.sum == pytest.approx(samples.sum())
+    for q in (0.5, 0.95, 0.99):
+        assert histogram.quantile(q) == pytest.approx(np.quantile(samples, q), rel=0.1)
+    assert np.isnan(LatencyHistogram().quantile(0.5))
+
+def test_disabled_profiler_records_nothing():
+    """Test a disabled profiler neither times nor stores anything."""
+    profiler = StageProfiler()
+    with profiler.stage("inference"):
+        pass
+    profiler.observe("queue", 0.5)
+    assert profiler.histograms == {}
+
+def test_snapshot_is_independent_of_new_stages():
+    """Test a snapshot can be iterated while new stages are recorded."""
+    profiler = StageProfiler(enabled=True)
+    profiler.observe("decode", 0.01)
+    for name, _ in profiler.snapshot():
+        profiler.observe(f"{name}_late", 0.01)  # Would resize a live dict view
+    assert [name for name, _ in profiler.snapshot()] == ["decode", "decode_late"]
+
+def test_controller_stages():
+    """Test process_frame reports each stage once per frame."""
+    profiler = StageProfiler(enabled=True)
+    controller = GestureController(profiler=profiler)
+    for _ in range(3):
+        controller.process_frame(np.zeros((120, 160, 3), dtype=np.uint8))
+    controller.close()
+    
+    summary = profiler.summary()
+    assert set(summary) == {"flip", "color_convert", "inference", "gestures", "annotate"}
+    assert all(stats["count"] == 3 for stats in summary.values())
+    assert summary["inference"]["p50"] > 0
+
+def test_render_metrics():
+    """Test Prometheus output contains summaries, counters and gauges."""
+    profiler = StageProfiler(enabled=True)
+    profiler.observe("decode", 0.002)
+    sessions = [SimpleNamespace(session_id=7, frames_processed=40, frames_dropped=3)]
+    text = render_metrics(profiler, sessions, {"processed": 90, "dropped": 5},
+                          {"connections": 1})
+    
+    assert '# TYPE gesture_stage_seconds summary' in text
+    assert 'gesture_stage_seconds_count{stage="decode"} 1' in text
+    assert 'gesture_frames_processed_total 90' in text
+    assert 'gesture_connection_frames_dropped_total{connection="7"} 3' in text
+    assert 'gesture_connections 1' in text
+    assert text.endswith("\n")
@@ -0,0 +1,76 @@
+"""Unit tests for the WebSocket wire protocols."""
+
+import numpy as np
+import pytest
+from backend.protocol import (
+    CODEC_JPEG,
+    CODEC_LANDMARKS,
+    PROTOCOL_BINARY,
+    PROTOCOL_JSON,
+    RESPONSE_FRAME,
+    RESPONSE_LANDMARKS,
+    ProtocolError,
+    build_binary_frame,
+    build_binary_reply,
+    decode_image,
+    encode_image,
+    negotiate,
+    pack_landmarks,
+    parse_binary_frame,
+    parse_binary_reply,
+    unpack_landmarks,
+)
+
+def test_negotiate():
+    """Test protocol negotiation and legacy fallback."""
+    assert negotiate('{"protocol": "binary"}') == (PROTOCOL_BINARY, RESPONSE_FRAME, None)
+    assert negotiate('{"protocol": "carrier-pigeon"}') == (PROTOCOL_JSON, RESPONSE_FRAME, None)
+    assert negotiate(
+        '{"protocol": "binary", "response": "landmarks"}'
+    ) == (PROTOCOL_BINARY, RESPONSE_LANDMARKS, None)
+    
+    protocol, response, pending = negotiate('{"image": "data:image/jpeg;base64,", "mode": "normal"}')
+    assert protocol == PROTOCOL_JSON
+    assert pending["mode"] == "normal"
+    
+    with pytest.raises(ProtocolError):
+        negotiate("not json")
+
+def test_binary_round_trip():
+    """Test binary frames and replies survive a round trip."""
+    frame = np.full((48, 64, 3), 128, dtype=np.uint8)
+    payload = encode_image(frame, CODEC_JPEG).tobytes()
+    
+    header, image_bytes = parse_binary_frame(
+        build_binary_frame(7, 1234.5, "volume", payload)
+    )
+    assert header == {"frame_id": 7, "timestamp": 1234.5, "mode": "volume", "codec": CODEC_JPEG}
+    assert decode_image(image_bytes).shape == frame.shape
+    
+    metadata, reply_payload = parse_binary_reply(
+        build_binary_reply(header, {"gestures": ["Open Palm"]}, payload)
+    )
+    assert metadata["frame_id"] == 7
+    assert metadata["gestures"] == ["Open Palm"]
+    assert bytes(reply_payload) == payload
+
+def test_parse_binary_frame_rejects_garbage():
+    """Test malformed binary frames raise ProtocolError."""
+    with pytest.raises(ProtocolError):
+        parse_binary_frame(b"\x00\x01")
+    for codec in (CODEC_LANDMARKS, 9):  # Never silently answered as JPEG
+        with pytest.raises(ProtocolError):
+            parse_binary_frame(build_binary_frame(1, 0.0, "normal", b"\xff\xd8", codec))
+
+def test_landmark_payload_round_trip():
+    """Test landmark replies are compact and lossless."""
+    landmarks = np.random.rand(2, 21, 3).astype(np.float32)
+    trajectories = {0: np.random.rand(5, 2).astype(np.float32), 1: np.zeros((0, 2), np.float32)}
+    
+    layout, payload = pack_landmarks(landmarks, trajectories)
+    assert len(payload) == (2 * 21 * 3 + 5 * 2) * 4
+    
+    unpacked, unpacked_trajectories = unpack_landmarks(layout, payload)
+    np.testing.assert_array_equal(unpacked, landmarks)
+    np.testing.assert_array_equal(unpacked_trajectories[0], trajectories[0])
+    assert unpacked_trajectories[1].shape == (0, 2)
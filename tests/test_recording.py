@@ -0,0 +1,95 @@
+"""Unit tests for landmark recording and replay."""
+
+import numpy as np
+import pytest
+from src.gesture_control import GestureController
+from src.recording import LandmarkRecorder, LandmarkReplay, read_recording
+
+def open_palm(x):
+    """A raised open hand with its wrist at ``x``."""
+    hand = np.zeros((21, 3), dtype=np.float32)
+    hand[:, 0] = x
+    hand[0, 1] = 0.9
+    hand[1:5, 0] = x - np.array([0.02, 0.04, 0.06, 0.08])  # Thumb out to the left
+    hand[1:5, 1] = 0.8
+    for tip in (8, 12, 16, 20):
+        hand[tip - 3:tip + 1, 1] = [0.7, 0.6, 0.5, 0.4]
+    return hand
+
+def test_round_trip(tmp_path):
+    """Test frames, handedness and timestamps survive a round trip."""
+    path = str(tmp_path / "hands.glr")
+    hands = np.random.default_rng(0).random((2, 21, 3)).astype(np.float32)
+    with LandmarkRecorder(path) as recorder:
+        recorder.write(0.0, np.empty((0, 21, 3), np.float32), [])
+        recorder.write(0.5, hands, [("Left", 0.9), ("Right", 0.8)])
+    with LandmarkRecorder(path) as recorder:
+        recorder.write(1.0, hands[:1], [("Right", 0.7)])
+    
+    frames = list(read_recording(path))
+    assert [frame.timestamp for frame in frames] == [0.0, 0.5, 1.0]
+    assert frames[0].landmarks.shape == (0, 21, 3)
+    np.testing.assert_array_equal(frames[1].landmarks, hands)
+    assert [label for label, _ in frames[1].handedness] == ["Left", "Right"]
+    assert frames[2].handedness[0][1] == pytest.approx(0.7)
+
+def test_truncated_and_invalid(tmp_path):
+    """Test a partial trailing frame is ignored and foreign files rejected."""
+    path = tmp_path / "hands.glr"
+    with LandmarkRecorder(str(path)) as recorder:
+        recorder.write(0.0, np.zeros((1, 21, 3)), [("Left", 1.0)])
+        recorder.write(0.1, np.zeros((1, 21, 3)), [("Left", 1.0)])
+    path.write_bytes(path.read_bytes()[:-10])
+    assert len(LandmarkReplay.load(str(path))) == 1
+    
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        list(read_recording(str(other)))
+
+def test_append_after_crash(tmp_path):
+    """Test reopening a recording cut mid-frame drops the partial frame."""
+    path = tmp_path / "hands.glr"
+    hand = np.random.default_rng(0).random((1, 21, 3)).astype(np.float32)
+    with LandmarkRecorder(str(path)) as recorder:
+        recorder.write(0.0, hand, [("Left", 1.0)])
+        recorder.write(0.1, hand, [("Left", 1.0)])
+    path.write_bytes(path.read_bytes()[:-10])  # Crash while writing frame 2
+    
+    with LandmarkRecorder(str(path)) as recorder:
+        recorder.write(0.2, hand, [("Right", 0.5)])
+    frames = list(read_recording(str(path)))
+    assert [frame.timestamp for frame in frames] == [0.0, 0.2]
+    assert frames[1].handedness == [("Right", 0.5)]
+    np.testing.assert_array_equal(frames[1].landmarks, hand)
+
+def test_replay_is_deterministic(tmp_path):
+    """Test replay reproduces static and timed dynamic gestures."""
+    path = str(tmp_path / "swipe.glr")
+    with LandmarkRecorder(path) as recorder:
+        for i in range(31):
+            recorder.write(i / 20, open_palm(0.2 + i * 0.015)[None], [("Right", 0.9)])
+    replay = LandmarkReplay.load(path)
+    assert replay.duration == pytest.approx(1.5)
+    
+    runs = []
+    for _ in range(2):
+        controller = GestureController()
+        runs.append([analysis["gestures"] for analysis in replay.replay(controller)])
+        controller.close()
+    
+    assert runs[0] == runs[1]
+    assert runs[0][0] == ["Open Palm"]
+    assert "Swipe Right" in sum(runs[0], [])
+
+def test_controller_records_frames(tmp_path):
+    """Test analyze_frame logs every frame to an attached recorder."""
+    path = str(tmp_path / "live.glr")
+    with LandmarkRecorder(path) as recorder:
+        controller = GestureController(recorder=recorder)
+        controller.analyze_frame(np.zeros((120, 160, 3), dtype=np.uint8))
+        controller.close()
+    
+    frames = list(read_recording(path))
+    assert len(frames) == 1
+    assert frames[0].landmarks.shape == (0, 21, 3)
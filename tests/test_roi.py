@@ -0,0 +1,71 @@
+"""Unit tests for adaptive inference input."""
+
+import numpy as np
+from benchmarks.synthetic import hand_at
+from src.gesture_control import GestureController
+from src.roi import FULL_FRAME, InferenceInput, map_to_frame
+
+def test_downscale_full_frame():
+    """Test frames are resized to the inference size with the aspect kept."""
+    stage = InferenceInput(max_side=320, crop=False)
+    image, region = stage.prepare(np.zeros((1080, 1920, 3), np.uint8))
+    assert image.shape == (180, 320, 3)
+    assert region == FULL_FRAME
+    
+    small = np.zeros((120, 160, 3), np.uint8)
+    image, _ = stage.prepare(small)
+    assert image.base is small  # No resize needed, no copy
+
+def test_crop_follows_hands_and_redetects():
+    """Test crops track the hands, re-detect every K frames and on loss."""
+    stage = InferenceInput(max_side=0, redetect_interval=3)
+    frame = np.zeros((720, 1280, 3), np.uint8)
+    
+    _, region = stage.prepare(frame)
+    assert region == FULL_FRAME
+    stage.update(hand_at(0.5, 0.5, size=0.1)[None], frame.shape)
+    
+    image, region = stage.prepare(frame)
+    assert region != FULL_FRAME
+    assert image.shape[0] == image.shape[1]  # Square crop in pixels
+    x, y, w, h = region
+    assert x < 0.5 and y < 0.5 and x + w > 0.6 and y + h > 0.6
+    
+    # Small movements keep the crop stable
+    stage.update(hand_at(0.505, 0.5, size=0.1)[None], frame.shape)
+    assert stage.prepare(frame)[1] == region
+    stage.update(hand_at(0.505, 0.5, size=0.1)[None], frame.shape)
+    assert stage.prepare(frame)[1] == region
+    
+    # Every K frames the whole frame is searched again
+    stage.update(hand_at(0.505, 0.5, size=0.1)[None], frame.shape)
+    assert stage.prepare(frame)[1] == FULL_FRAME
+    
+    # Losing the hands falls back to full frames
+    stage.update(hand_at(0.505, 0.5, size=0.1)[None], frame.shape)
+    assert stage.prepare(frame)[1] != FULL_FRAME
+    stage.update(np.empty((0, 21, 3), np.float32), frame.shape)
+    assert stage.prepare(frame)[1] == FULL_FRAME
+
+def test_map_to_frame_round_trip():
+    """Test crop coordinates map back to the original full-frame landmarks."""
+    stage = InferenceInput(max_side=0)
+    frame = np.zeros((480, 640, 3), np.uint8)
+    stage.update(hand_at(0.3, 0.4, size=0.1)[None], frame.shape)
+    _, region = stage.prepare(frame)
+    
+    full = hand_at(0.32, 0.41, size=0.1)[None]
+    x0, y0, w, h = region
+    cropped = full.copy()
+    cropped[..., 0] = (full[..., 0] - x0) / w
+    cropped[..., 1] = (full[..., 1] - y0) / h
+    cropped[..., 2] = full[..., 2] / w
+    np.testing.assert_allclose(map_to_frame(cropped, region), full, atol=1e-6)
+
+def test_controller_with_inference_input():
+    """Test the controller runs inference on the prepared input."""
+    controller = GestureController(inference_input=InferenceInput(max_side=256))
+    gestures, image = controller.process_frame(np.zeros((720, 1280, 3), np.uint8))
+    assert gestures == []
+    assert image.shape == (720, 1280, 3)
+    controller.close()
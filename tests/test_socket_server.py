@@ -0,0 +1,128 @@
+"""Tests for the Socket.IO gesture server."""
+
+import asyncio
+from types import SimpleNamespace
+
+from backend.protocol import build_binary_frame
+from backend.socket_server import GestureSocketServer
+
+
+class FakeSio:
+    """Records handlers, rooms and emitted events in place of a Socket.IO server."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.room_members = {}
+        self.emitted = []
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def enter_room(self, sid, room):
+        self.room_members.setdefault(room, set()).add(sid)
+
+    async def leave_room(self, sid, room):
+        self.room_members.get(room, set()).discard(sid)
+
+    def rooms(self, sid):
+        return [sid] + [room for room, members in self.room_members.items() if sid in members]
+
+    async def emit(self, event, data, to):
+        rooms = to if isinstance(to, list) else [to]
+        sids = set()
+        for room in rooms:
+            sids |= self.room_members.get(room, {room})  # A sid is its own room
+        self.emitted.append((event, data, sids))
+
+
+class FakeSessions:
+    """Session manager stand-in."""
+
+    def __init__(self):
+        self.open_ids, self.closed = [], []
+
+    def open(self):
+        session = SimpleNamespace(session_id=len(self.open_ids), response="frame", frames_dropped=0)
+        self.open_ids.append(session.session_id)
+        return session
+
+    def close(self, session_id):
+        self.closed.append(session_id)
+
+
+async def run_inline(func, *args):
+    return func(*args)
+
+
+def make_server(script):
+    """A server whose frames yield the gesture lists of ``script`` in turn."""
+    gestures = iter(script)
+    modes = []
+
+    def process(session, header, image_bytes):
+        modes.append(header["mode"])
+        return {"gestures": next(gestures), "hand_ids": [0]}, {}, None
+
+    sio = FakeSio()
+    return GestureSocketServer(FakeSessions(), run_inline, process, sio=sio), sio, modes
+
+
+async def send_frames(server, sid, count, message):
+    for _ in range(count):
+        await server.on_frame(sid, message)
+        await asyncio.sleep(0.01)
+
+
+def test_gesture_events_only_on_change():
+    """Ten frames with three distinct gesture runs emit three events."""
+    script = [[]] * 3 + [["Open Palm"]] * 4 + [["Victory"]] * 3
+
+    async def main():
+        server, sio, modes = make_server(script)
+        await server.on_connect("sid1", {})
+        await server.on_change_mode("sid1", {"mode": "mouse"})
+        await send_frames(server, "sid1", 10, {"image": "data:image/jpeg;base64,AA=="})
+        stats = server.stats()
+        await server.on_disconnect("sid1")
+        return server, sio, modes, stats
+
+    server, sio, modes, stats = asyncio.run(main())
+    events = [data["gesture"] for event, data, _ in sio.emitted if event == "gesture_detected"]
+    assert events == ["None", "Open Palm", "Victory"]
+    assert set(modes) == {"mouse"}  # JSON frames without a mode use change_mode
+    assert stats == {"socket_clients": 1, "socket_frames": 10, "socket_events": 3}
+    assert server.sessions.closed == [0] and not server.clients
+
+
+def test_room_viewers_receive_broadcasts():
+    """Gestures go to the sender and every client in its rooms."""
+    async def main():
+        server, sio, _ = make_server([["Push"]])
+        await server.on_connect("sid1", {})
+        await server.on_connect("sid2", {})
+        assert await server.on_join("sid1", {"room": "demo"}) == {"room": "demo"}
+        await server.on_join("sid2", {"room": "demo"})
+        frame = build_binary_frame(1, 0.0, "volume", b"\xff\xd8")
+        await send_frames(server, "sid1", 1, frame)
+        for sid in ("sid1", "sid2"):
+            await server.on_disconnect(sid)
+        return sio
+
+    event, data, recipients = asyncio.run(main()).emitted[0]
+    assert event == "gesture_detected"
+    assert data["gesture"] == "Push" and data["mode"] == "volume"
+    assert recipients == {"sid1", "sid2"}
+
+
+def test_bad_frames_report_errors():
+    """A malformed frame is answered with ``frame_error`` and processing continues."""
+    async def main():
+        server, sio, _ = make_server([["Pinch"]])
+        await server.on_connect("sid1", {})
+        await send_frames(server, "sid1", 1, b"\x00")
+        await send_frames(server, "sid1", 1, {"image": "AA=="})
+        await server.on_disconnect("sid1")
+        return sio
+
+    events = [event for event, _, _ in asyncio.run(main()).emitted]
+    assert events == ["frame_error", "gesture_detected"]
@@ -0,0 +1,48 @@
+import numpy as np
+
+from benchmarks.synthetic import hand_at
+from src.gesture_control import GestureController
+from src.tracking import HandTracker
+
+
+def test_ids_follow_hands_when_order_swaps():
+    tracker = HandTracker()
+    first = tracker.update(np.stack([hand_at(0.2, 0.5), hand_at(0.8, 0.5)]),
+                           [("Left", 0.9), ("Right", 0.9)], 0.0)
+    swapped = tracker.update(np.stack([hand_at(0.79, 0.5), hand_at(0.21, 0.5)]),
+                             [("Right", 0.9), ("Left", 0.9)], 0.033)
+    assert swapped == first[::-1]
+
+
+def test_crossing_hands_keep_ids_with_velocity():
+    tracker = HandTracker()
+    ids = None
+    # Two hands crossing; each frame they move 0.08 towards the other side
+    for step in range(11):
+        x = 0.1 + 0.08 * step
+        ids = tracker.update(np.stack([hand_at(x, 0.5), hand_at(1.0 - x, 0.52)]),
+                             [], step / 30)
+        if step == 0:
+            first = ids
+    assert ids == first
+
+
+def test_lost_tracks_expire_and_free_state():
+    controller = GestureController(hands=object())
+    hands = np.stack([hand_at(0.2, 0.5), hand_at(0.8, 0.5)])
+    analysis = controller.analyze_landmarks(hands, [("Left", 0.9), ("Right", 0.9)], 0.0)
+    left, right = analysis["hand_ids"]
+    assert set(controller.trajectories) == {left, right}
+
+    analysis = controller.analyze_landmarks(hands[1:], [("Right", 0.9)], 0.4)
+    assert analysis["hand_ids"] == [right]
+    assert left in controller.trajectories
+
+    controller.analyze_landmarks(hands[1:], [("Right", 0.9)], 0.8)
+    assert set(controller.trajectories) == {right}
+    assert left not in controller.dynamic_gestures
+
+    # A returning hand gets a fresh ID
+    analysis = controller.analyze_landmarks(hands, [("Left", 0.9), ("Right", 0.9)], 0.9)
+    assert analysis["hand_ids"][1] == right
+    assert analysis["hand_ids"][0] not in (left, right)
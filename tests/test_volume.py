@@ -0,0 +1,62 @@
+"""Tests for the volume backends and volume rate limiting."""
+
+import socket
+import sys
+import time
+
+from src.actions import ActionDispatcher, RecordingBackend
+from src.volume import AmixerVolume, FakeVolume, OscVolume, VolumeBackend
+
+
+def test_amixer_commands_share_one_process(tmp_path):
+    """Every change is a line written to the same long-lived process."""
+    output = tmp_path / "commands.txt"
+    command = [sys.executable, "-c",
+               f"import sys; open({str(output)!r}, 'w').writelines(sys.stdin)"]
+    volume = AmixerVolume(control="PCM", command=command)
+    volume.set(30)
+    process = volume._process
+    volume.set(70)
+    assert volume._process is process
+    volume.close()
+    assert output.read_text() == "sset PCM 30%\nsset PCM 70%\n"
+
+
+def test_osc_sends_normalised_level():
+    """The OSC backend sends the level as a 0-1 float to its address."""
+    from pythonosc.osc_message import OscMessage
+
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(5)
+    volume = OscVolume("127.0.0.1", receiver.getsockname()[1], "/mixer/master")
+    volume.set(25)
+    message = OscMessage(receiver.recv(1024))
+    volume.close()
+    receiver.close()
+    assert message.address == "/mixer/master"
+    assert message.params == [0.25]
+
+
+def test_from_env_selects_backend(monkeypatch):
+    """``GESTURE_VOLUME`` names the backend."""
+    monkeypatch.setenv("GESTURE_VOLUME", "none")
+    assert isinstance(VolumeBackend.from_env(), FakeVolume)
+    monkeypatch.setenv("GESTURE_VOLUME", "osc://127.0.0.1:9100/vol")
+    volume = VolumeBackend.from_env()
+    assert isinstance(volume, OscVolume) and volume.address == "/vol"
+    volume.close()
+
+
+def test_volume_changes_are_rate_limited():
+    """A burst of changes applies the first at once and then only the newest."""
+    backend = RecordingBackend()
+    dispatcher = ActionDispatcher(backend, volume_interval=0.2)
+    for level in range(0, 100, 10):
+        dispatcher.set_volume(level)
+        time.sleep(0.01)
+    assert dispatcher.flush(5)
+    dispatcher.close()
+    levels = [call[1] for call in backend.calls]
+    assert levels[-1] == 90
+    assert len(levels) <= 3
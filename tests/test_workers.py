@@ -0,0 +1,37 @@
+"""Unit tests for the backend frame worker pool."""
+
+import asyncio
+import threading
+from backend.workers import FrameWorkerPool
+
+def test_run_off_event_loop():
+    """Test jobs run on worker threads and return their results."""
+    pool = FrameWorkerPool(max_workers=2)
+    loop_thread = threading.get_ident()
+    
+    async def main():
+        return await pool.run(lambda x: (x * 2, threading.get_ident()), 21)
+    
+    result, worker_thread = asyncio.run(main())
+    assert result == 42
+    assert worker_thread != loop_thread
+    pool.close()
+
+def test_queue_depth():
+    """Test jobs beyond the worker count are reported as queued."""
+    pool = FrameWorkerPool(max_workers=1, max_pending=4)
+    release = threading.Event()
+    
+    async def main():
+        jobs = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        stats = pool.stats()
+        release.set()
+        await asyncio.gather(*jobs)
+        return stats
+    
+    stats = asyncio.run(main())
+    assert stats["running"] == 1
+    assert stats["queue_depth"] == 2
+    assert pool.queue_depth == 0
+    pool.close()